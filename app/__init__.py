@@ -32,7 +32,10 @@ from app.backend.integrations.atlassian_jira.atlassian_jira_db import DBAtlassia
 from app.backend.integrations.azure_wiki.azure_wiki_db import DBAzureWiki
 from app.backend.integrations.grafana.grafana_db import DBGrafana, DBGrafanaDashboards
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_db import DBInfluxdb
+from app.backend.integrations.data_sources.influxdb_v2.test_catalog_db import DBTestCatalog, DBTestCatalogState
 from app.backend.integrations.smtp_mail.smtp_mail_db import DBSMTPMail, DBSMTPMailRecipient
+from app.backend.components.report_jobs.report_jobs_db import DBReportJobs
+from app.backend.components.test_history.test_history_db import DBTestSummaries
 from logging.handlers import RotatingFileHandler
 from flask import Flask
 from flask_login import LoginManager
@@ -41,6 +44,7 @@ from flask_compress import Compress
 
 from app.api import register_blueprints
 from app.schema_migrations.runner import MigrationRunner
+from app.backend.components.report_jobs.report_job_runner import ReportJobRunner
 
 # Grabs the folder where the script runs.
 basedir = os.path.abspath(os.path.dirname(__file__))
@@ -88,12 +92,19 @@ with app.app_context():
         DBTemplateGroupData.__table__,
         DBGraphs.__table__,
         DBGrafanaDashboards.__table__,
-        DBSMTPMailRecipient.__table__
+        DBSMTPMailRecipient.__table__,
+        DBTestCatalog.__table__,
+        DBTestCatalogState.__table__,
+        DBReportJobs.__table__,
+        DBTestSummaries.__table__
         ], checkfirst=True)
 
     # Run migrations to add/modify columns via base orchestrator
     MigrationRunner().run()
 
+    # Report jobs of a previous run of the app will never finish
+    ReportJobRunner.fail_orphaned_jobs()
+
     DBPrompts.load_default_prompts_from_yaml()
 
     DBGraphs.load_default_graphs_from_yaml()
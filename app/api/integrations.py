@@ -34,6 +34,7 @@ from influxdb_client import InfluxDBClient
 from influxdb import InfluxDBClient as InfluxDBClient18
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_extraction import InfluxdbV2
 from app.backend.integrations.data_sources.influxdb_v1_8.influxdb_extraction_1_8 import InfluxdbV18
+from app.backend.integrations.data_sources.client_pool import ClientPool
 from app.api.base import (
     api_response, api_error_handler, get_project_id,
    HTTP_CREATED, HTTP_NO_CONTENT, HTTP_BAD_REQUEST, HTTP_NOT_FOUND
@@ -520,6 +521,9 @@ def update_integration(integration_id):
                 project_id=project_id,
                 data=integration_data
             )
+            if db_class is DBInfluxdb:
+                # Pooled clients still use the old connection settings
+                ClientPool.evict(integration_id)
 
             return api_response(
                 data={"integration_id": integration_id, "integration_type": integration_type},
@@ -1041,6 +1045,8 @@ def delete_integration(integration_id):
                 )
 
             db_class.delete(project_id=project_id, id=integration_id)
+            if db_class is DBInfluxdb:
+                ClientPool.evict(integration_id)
 
             return api_response(
                 message="Integration deleted successfully",
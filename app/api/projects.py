@@ -30,6 +30,7 @@ from app.backend.components.graphs.graphs_db import DBGraphs
 from app.backend.integrations.grafana.grafana_db import DBGrafana
 from app.backend.components.templates.templates_db import DBTemplates
 from app.backend.components.prompts.prompts_db import DBPrompts
+from app.backend.data_provider.data_analysis.model_store import BaselineModelStore
 from app.backend.errors import ErrorMessages
 from app import db
 
@@ -206,6 +207,7 @@ def delete_project(project_id):
             )
 
         DBProjects.delete(id=project_id)
+        BaselineModelStore.invalidate(project_id)
         return api_response(
             message="Project deleted successfully",
             status=HTTP_NO_CONTENT
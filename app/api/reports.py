@@ -15,18 +15,24 @@
 """
 Reports API endpoints.
 """
+import os
 import json
 import logging
-import importlib
 import traceback
 from flask import Blueprint, request, send_file
 from app.backend.data_provider.data_provider import DataProvider
+from app.backend.data_provider.data_analysis.streaming_detection import StreamingAnomalyDetector
+from app.backend.data_provider.data_analysis.history_analysis import TestHistoryAnalyzer
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 from app.backend.integrations.report_registry import ReportRegistry
 from app.backend.components.projects.projects_db import DBProjects
+from app.backend.components.report_jobs.report_jobs_db import DBReportJobs
+from app.backend.components.test_history.test_history_db import DBTestSummaries
+from app.backend.components.report_jobs.report_job_runner import ReportJobRunner
 from app.backend.errors import ErrorMessages
 from app.api.base import (
     api_response, api_error_handler, get_project_id,
-    HTTP_OK, HTTP_BAD_REQUEST, HTTP_NOT_FOUND, HTTP_INTERNAL_SERVER_ERROR
+    HTTP_OK, HTTP_ACCEPTED, HTTP_BAD_REQUEST, HTTP_NOT_FOUND, HTTP_INTERNAL_SERVER_ERROR
 )
 
 # Create a Blueprint for reports API
@@ -37,19 +43,20 @@ def _ensure_report_types_loaded():
     Dynamically import all report types to ensure they are registered.
     This avoids circular imports by only importing when needed.
     """
-    report_modules = [
-        'app.backend.integrations.pdf.pdf_report',
-        'app.backend.integrations.smtp_mail.smtp_mail_report',
-        'app.backend.integrations.azure_wiki.azure_wiki_report',
-        'app.backend.integrations.atlassian_jira.atlassian_jira_report',
-        'app.backend.integrations.atlassian_confluence.atlassian_confluence_report'
-    ]
-
-    for module_name in report_modules:
-        try:
-            importlib.import_module(module_name)
-        except ImportError as e:
-            logging.warning(f"Could not import report module {module_name}: {e}")
+    ReportRegistry.load_report_types()
+
+def _resolve_action_type(output_config):
+    """
+    Determine the report action type from the output config.
+
+    Returns:
+        The action type, or None if it cannot be determined
+    """
+    action_id = output_config.get("output_id")
+    integration_type = output_config.get("integration_type")
+    if action_id == "pdf_report" or action_id == "delete":
+        return action_id
+    return integration_type or None
 
 @reports_api.route('/api/v1/tests/data', methods=['GET'])
 @api_error_handler
@@ -172,6 +179,105 @@ def get_test_data():
             errors=[{"code": "test_data_error", "message": str(e)}]
         )
 
+@reports_api.route('/api/v1/tests/live-anomalies', methods=['GET'])
+@api_error_handler
+def get_live_anomalies():
+    """
+    Get the current anomalies of a running test (streaming analysis).
+
+    Each call processes only the samples recorded since the previous call.
+
+    Query Parameters:
+        test_title: The title of the test
+        source_type: The type of data source
+        id: The ID of the data source
+        bucket: Optional bucket override
+        reset: If "true", drop the streaming state and analyze the test from its start
+
+    Returns:
+        A JSON response with the processed range, per-metric statistics and anomaly windows
+    """
+    try:
+        project_id = get_project_id()
+        if not project_id:
+            return api_response(
+                message="No project selected",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_project", "message": "No project selected"}]
+            )
+
+        test_title = request.args.get('test_title')
+        source_type = request.args.get('source_type')
+        if not test_title or not source_type:
+            return api_response(
+                message="Missing test_title or source_type parameter",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_param", "message": "Missing test_title or source_type parameter"}]
+            )
+
+        dp = DataProvider(project=project_id, source_type=source_type, id=request.args.get('id'), bucket=request.args.get('bucket'))
+        if request.args.get('reset', '').lower() == 'true':
+            StreamingAnomalyDetector.reset(dp, test_title)
+        return api_response(data=StreamingAnomalyDetector.poll(dp, test_title))
+    except Exception as e:
+        logging.error(f"Error in streaming anomaly detection: {traceback.format_exc()}")
+        return api_response(
+            message="Error in streaming anomaly detection",
+            status=HTTP_INTERNAL_SERVER_ERROR,
+            errors=[{"code": "live_anomalies_error", "message": str(e)}]
+        )
+
+@reports_api.route('/api/v1/tests/history', methods=['GET'])
+@api_error_handler
+def get_test_history():
+    """
+    Get the cross-test history of a test: trends, changepoints and the
+    comparison of the test with the previous runs of its family.
+
+    Runs are read from the test history index. Runs of the family that are not
+    indexed yet are backfilled from the data source, up to the
+    history_backfill_max_tests setting per request; "index" in the result
+    reports how many runs were found, backfilled and are still missing.
+
+    Query Parameters:
+        test_title: The title of the test
+        source_type: The type of data source
+        id: The ID of the data source
+        bucket: Optional bucket override
+        family: Optional title prefix of the runs to compare (derived from test_title by default)
+
+    Returns:
+        A JSON response with the runs, per-metric trends, changepoints and regressions
+    """
+    try:
+        project_id = get_project_id()
+        if not project_id:
+            return api_response(
+                message="No project selected",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_project", "message": "No project selected"}]
+            )
+
+        test_title = request.args.get('test_title')
+        source_type = request.args.get('source_type')
+        if not test_title or not source_type:
+            return api_response(
+                message="Missing test_title or source_type parameter",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_param", "message": "Missing test_title or source_type parameter"}]
+            )
+
+        dp = DataProvider(project=project_id, source_type=source_type, id=request.args.get('id'), bucket=request.args.get('bucket'))
+        history = TestHistoryAnalyzer(project_id).analyze_test(dp, test_title, family=request.args.get('family'))
+        return api_response(data=history)
+    except Exception as e:
+        logging.error(f"Error in test history analysis: {traceback.format_exc()}")
+        return api_response(
+            message="Error in test history analysis",
+            status=HTTP_INTERNAL_SERVER_ERROR,
+            errors=[{"code": "test_history_error", "message": str(e)}]
+        )
+
 @reports_api.route('/api/v1/reports', methods=['POST'])
 @api_error_handler
 def generate_report():
@@ -216,14 +322,10 @@ def generate_report():
 
         template_group = data.get("template_group")
         action_id = output_config.get("output_id")
-        integration_type = output_config.get("integration_type")
 
         # Determine action type
-        if action_id == "pdf_report" or action_id == "delete":
-            action_type = action_id
-        elif integration_type:
-            action_type = integration_type
-        else:
+        action_type = _resolve_action_type(output_config)
+        if not action_type:
             return api_response(
                 message="Could not determine report type",
                 status=HTTP_BAD_REQUEST,
@@ -242,7 +344,11 @@ def generate_report():
                 return api_response("error", "PDF report type not found in registry.", HTTP_NOT_FOUND)
 
             # Generate the report
-            result = pdf.generate_report(data["tests"], template_group, theme=theme)
+            try:
+                result = pdf.generate_report(data["tests"], template_group, theme=theme)
+            except Exception:
+                pdf.close()
+                raise
 
             pdf.pdf_io.seek(0)
             # Convert the result to a JSON string and include it in the headers
@@ -263,6 +369,9 @@ def generate_report():
                     db_config = test.get('db_config')
                     dp = DataProvider(project=project_id, source_type=db_config['source_type'], id=db_config['id'], bucket=db_config['bucket'])
                     dp.ds_obj.delete_test_data(test['test_title'])
+                    scope = QueryResultCache.get_scope_of(dp.ds_obj)
+                    if scope is not None:
+                        DBTestSummaries.delete_entry(project_id, db_config['source_type'], scope[0], scope[1], test['test_title'])
                 return api_response(message="Tests deleted successfully", status=HTTP_OK)
             except Exception as e:
                 logging.error(f"Error deleting tests: {str(e)}")
@@ -415,3 +524,172 @@ def get_report_data():
             status=HTTP_BAD_REQUEST,
             errors=[{"code": "report_error", "message": str(e)}]
         )
+
+@reports_api.route('/api/v1/reports/jobs', methods=['POST'])
+@api_error_handler
+def submit_report_job():
+    """
+    Submit a report for background generation.
+
+    Request Body:
+        Same as POST /api/v1/reports (tests, template_group, output_config)
+
+    Returns:
+        A JSON response with the job ID
+    """
+    try:
+        project_id = get_project_id()
+        if not project_id:
+            return api_response(
+                message="No project selected",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_project", "message": "No project selected"}]
+            )
+
+        data = request.get_json()
+        if not data:
+            return api_response(
+                message="No data provided",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_data", "message": "No data provided"}]
+            )
+
+        output_config = data.get('output_config', {})
+        if "output_id" not in output_config:
+            return api_response(
+                message="Missing output_id parameter",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "missing_param", "message": "Missing output_id parameter"}]
+            )
+
+        action_type = _resolve_action_type(output_config)
+        _ensure_report_types_loaded()
+        if not action_type or action_type == "delete" or not ReportRegistry.is_valid_report_type(action_type):
+            return api_response(
+                message=f"Invalid action type: {action_type}",
+                status=HTTP_BAD_REQUEST,
+                errors=[{"code": "invalid_action", "message": f"Invalid action type: {action_type}"}]
+            )
+
+        job_id = ReportJobRunner.submit(project_id, action_type, data)
+        return api_response(
+            data={"job_id": job_id, "status": "queued"},
+            message="Report job submitted",
+            status=HTTP_ACCEPTED
+        )
+    except Exception as e:
+        logging.error(f"Error submitting report job: {traceback.format_exc()}")
+        return api_response(
+            message=ErrorMessages.ER00011.value,
+            status=HTTP_INTERNAL_SERVER_ERROR,
+            errors=[{"code": "report_error", "message": str(e)}]
+        )
+
+def _job_response_data(job):
+    """Public view of a report job (without the request payload and file path)."""
+    return {
+        "job_id": job["id"],
+        "action_type": job["action_type"],
+        "status": job["status"],
+        "cancel_requested": job["cancel_requested"],
+        "progress": job["progress"],
+        "result": job["result"],
+        "error": job["error"],
+        "has_artifact": bool(job["artifact_path"]),
+        "created_at": job["created_at"].isoformat() if job["created_at"] else None,
+        "started_at": job["started_at"].isoformat() if job["started_at"] else None,
+        "finished_at": job["finished_at"].isoformat() if job["finished_at"] else None
+    }
+
+@reports_api.route('/api/v1/reports/jobs', methods=['GET'])
+@api_error_handler
+def get_report_jobs():
+    """
+    Get the most recent report jobs of the project.
+
+    Returns:
+        A JSON response with a list of jobs
+    """
+    project_id = get_project_id()
+    if not project_id:
+        return api_response(
+            message="No project selected",
+            status=HTTP_BAD_REQUEST,
+            errors=[{"code": "missing_project", "message": "No project selected"}]
+        )
+    jobs = DBReportJobs.get_configs(project_id=project_id)
+    return api_response(data={"jobs": [_job_response_data(job) for job in jobs]})
+
+@reports_api.route('/api/v1/reports/jobs/<job_id>', methods=['GET'])
+@api_error_handler
+def get_report_job(job_id):
+    """
+    Get the status and progress of a report job.
+
+    Args:
+        job_id: The ID of the job
+
+    Returns:
+        A JSON response with the job status, progress and result
+    """
+    project_id = get_project_id()
+    job = DBReportJobs.get_config_by_id(project_id=project_id, id=job_id)
+    if not job:
+        return api_response(
+            message=f"Report job with ID {job_id} not found",
+            status=HTTP_NOT_FOUND,
+            errors=[{"code": "not_found", "message": f"Report job with ID {job_id} not found"}]
+        )
+    return api_response(data=_job_response_data(job))
+
+@reports_api.route('/api/v1/reports/jobs/<job_id>/cancel', methods=['POST'])
+@api_error_handler
+def cancel_report_job(job_id):
+    """
+    Cancel a report job. Queued jobs are cancelled immediately,
+    running jobs stop at their next progress update.
+
+    Args:
+        job_id: The ID of the job
+
+    Returns:
+        A JSON response with the job status
+    """
+    project_id = get_project_id()
+    status = DBReportJobs.request_cancel(project_id=project_id, id=job_id)
+    if status is None:
+        return api_response(
+            message=f"Report job with ID {job_id} not found",
+            status=HTTP_NOT_FOUND,
+            errors=[{"code": "not_found", "message": f"Report job with ID {job_id} not found"}]
+        )
+    return api_response(data={"job_id": job_id, "status": status}, message="Cancellation requested")
+
+@reports_api.route('/api/v1/reports/jobs/<job_id>/download', methods=['GET'])
+@api_error_handler
+def download_report_job(job_id):
+    """
+    Download the artifact (PDF file) of a completed report job.
+
+    Args:
+        job_id: The ID of the job
+
+    Returns:
+        The file download
+    """
+    project_id = get_project_id()
+    job = DBReportJobs.get_config_by_id(project_id=project_id, id=job_id)
+    if not job or not job["artifact_path"] or not os.path.exists(job["artifact_path"]):
+        return api_response(
+            message=f"No artifact available for report job {job_id}",
+            status=HTTP_NOT_FOUND,
+            errors=[{"code": "not_found", "message": f"No artifact available for report job {job_id}"}]
+        )
+    response = send_file(
+        os.path.abspath(job["artifact_path"]),
+        mimetype=job["artifact_mimetype"],
+        download_name=job["artifact_name"],
+        as_attachment=True
+    )
+    response.headers['X-Result-Data'] = json.dumps(job["result"])
+    return response
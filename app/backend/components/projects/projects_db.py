@@ -30,6 +30,7 @@ from app.backend.integrations.azure_wiki.azure_wiki_db                     impor
 from app.backend.integrations.grafana.grafana_db                           import DBGrafana
 from app.backend.pydantic_models                                           import ProjectModel
 from app.backend.components.settings.settings_service                      import SettingsService
+from app.backend.config_cache                                              import ConfigCache
 
 
 class DBProjects(db.Model):
@@ -169,6 +170,8 @@ class DBProjects(db.Model):
             if config:
                 db.session.delete(config)
                 db.session.commit()
+                # Integrations and secrets of the project were deleted with it
+                ConfigCache.invalidate()
         except Exception:
             db.session.rollback()
             logging.warning(str(traceback.format_exc()))
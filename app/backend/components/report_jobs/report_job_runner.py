@@ -0,0 +1,267 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Report Job Runner - generates reports in background threads.
+
+Submitting a report stores a job in the report_jobs table and hands it to a
+thread pool of the current worker process, so the HTTP request returns at
+once with the job id. Reports publish progress through
+ReportingBase.progress_callback; the runner stores it on the job and checks
+for cancellation requests at the same points. PDF artifacts are written under
+app/data/report_jobs and downloaded through the API.
+
+Jobs only live in the thread pool of the process that accepted them. A job
+records that process (owner_pid) and a heartbeat the process refreshes while
+the job is queued or running; when the process dies, its unfinished jobs are
+failed on the next startup or job submission instead of staying queued or
+running forever.
+"""
+
+import os
+import time
+import shutil
+import logging
+import threading
+import traceback
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Optional, Set, Tuple
+
+from flask import current_app
+
+from app.backend.components.report_jobs.report_jobs_db import DBReportJobs
+from app.backend.integrations.report_registry import ReportRegistry
+
+
+class ReportJobCancelled(Exception):
+    """Raised from the progress callback to stop a cancelled report."""
+
+
+class _JobProgress:
+    """Progress callback of one job: tracks tests and graph items and persists them."""
+
+    def __init__(self, job_id: str, tests_total: int, persist_interval_seconds: float):
+        self.job_id = job_id
+        self.persist_interval_seconds = persist_interval_seconds
+        self._last_persist = 0.0
+        self._seen_tests = []
+        self.state: Dict[str, Any] = {
+            'tests_total': tests_total,
+            'tests_done': 0,
+            'current_test': None,
+            'items_total': 0,
+            'items_done': 0,
+            'current_item': None,
+            'percent': 0.0
+        }
+
+    def __call__(self, event: str, **details):
+        force = False
+        if event == 'test':
+            test_title = details.get('test_title')
+            # Reports may collect the same test more than once; count each test once
+            if test_title not in self._seen_tests:
+                self._seen_tests.append(test_title)
+                self.state['items_done'] = 0
+                force = True
+            self.state['tests_done'] = len(self._seen_tests) - 1
+            self.state['current_test'] = test_title
+            self.state['items_total'] = details.get('items_total', 0)
+        elif event == 'item':
+            self.state['items_done'] += 1
+            self.state['current_item'] = details.get('name')
+        self._update_percent()
+        if force or time.monotonic() - self._last_persist >= self.persist_interval_seconds:
+            self.persist()
+
+    def _update_percent(self):
+        tests_total = max(self.state['tests_total'], 1)
+        items_total = self.state['items_total']
+        test_fraction = min(self.state['items_done'] / items_total, 1.0) if items_total else 0.0
+        self.state['percent'] = round(min((self.state['tests_done'] + test_fraction) / tests_total, 1.0) * 100, 1)
+
+    def persist(self):
+        self._last_persist = time.monotonic()
+        if DBReportJobs.update_progress(self.job_id, self.state):
+            raise ReportJobCancelled()
+
+    def finish(self):
+        self.state['tests_done'] = self.state['tests_total']
+        self.state['current_item'] = None
+        self.state['percent'] = 100.0
+
+
+class ReportJobRunner:
+    """Process-wide thread pool executing report jobs."""
+
+    artifacts_dir = os.path.join('app', 'data', 'report_jobs')
+    retention = timedelta(days=7)
+    progress_interval_seconds = 1.0
+    heartbeat_interval_seconds = 30.0
+    # Jobs whose heartbeat is older than this are failed as orphaned
+    heartbeat_timeout = timedelta(minutes=5)
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+    _active_jobs: Set[str] = set()
+    _heartbeat_thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max(1, int(current_app.config.get('REPORT_JOB_WORKERS', 2))),
+                    thread_name_prefix="perforge-report"
+                )
+            return cls._executor
+
+    @classmethod
+    def submit(cls, project_id: int, action_type: str, data: Dict[str, Any]) -> str:
+        """Store a new job and queue it; returns the job id."""
+        cls._delete_expired_jobs()
+        job_id = DBReportJobs.save(project_id, action_type, data)
+        app = current_app._get_current_object()
+        with cls._lock:
+            cls._active_jobs.add(job_id)
+        cls._start_heartbeat(app)
+        cls._get_executor().submit(cls._run, app, job_id, project_id, action_type, data)
+        return job_id
+
+    @classmethod
+    def _start_heartbeat(cls, app) -> None:
+        with cls._lock:
+            # A thread started before a fork does not run in the child
+            if cls._heartbeat_thread is not None and cls._heartbeat_thread.is_alive():
+                return
+            cls._heartbeat_thread = threading.Thread(
+                target=cls._heartbeat_loop, args=(app,), name="perforge-report-heartbeat", daemon=True
+            )
+            cls._heartbeat_thread.start()
+
+    @classmethod
+    def _heartbeat_loop(cls, app) -> None:
+        while True:
+            time.sleep(cls.heartbeat_interval_seconds)
+            with cls._lock:
+                job_ids = list(cls._active_jobs)
+            if not job_ids:
+                continue
+            try:
+                with app.app_context():
+                    DBReportJobs.heartbeat(job_ids)
+            except Exception as er:
+                logging.warning(f"Failed to update report job heartbeat: {er}")
+
+    @staticmethod
+    def _is_process_alive(pid: Optional[int]) -> bool:
+        if pid is None:
+            return False
+        # os.kill() terminates the process on Windows; rely on the heartbeat there
+        if pid == os.getpid() or os.name == 'nt':
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        except OSError:
+            return False
+        return True
+
+    @classmethod
+    def fail_orphaned_jobs(cls) -> None:
+        """Fail queued and running jobs whose worker process is gone."""
+        try:
+            job_ids = DBReportJobs.fail_orphaned(datetime.utcnow() - cls.heartbeat_timeout, cls._is_process_alive)
+            if job_ids:
+                logging.warning(f"Failed {len(job_ids)} orphaned report job(s): {', '.join(job_ids)}")
+        except Exception as er:
+            logging.warning(f"Failed to check for orphaned report jobs: {er}")
+
+    @classmethod
+    def _run(cls, app, job_id: str, project_id: int, action_type: str, data: Dict[str, Any]) -> None:
+        with app.app_context():
+            try:
+                if not DBReportJobs.mark_running(job_id):
+                    return
+                progress = _JobProgress(job_id, len(data.get('tests', [])), cls.progress_interval_seconds)
+                result, artifact = cls._generate(project_id, action_type, data, progress)
+                progress.finish()
+
+                artifact_path = artifact_name = artifact_mimetype = None
+                if artifact is not None:
+                    artifact_name, artifact_mimetype, content = artifact
+                    os.makedirs(cls.artifacts_dir, exist_ok=True)
+                    artifact_path = os.path.join(cls.artifacts_dir, f"{job_id}.pdf")
+                    # The document is copied in chunks from the spooled report file
+                    with content, open(artifact_path, 'wb') as f:
+                        content.seek(0)
+                        shutil.copyfileobj(content, f)
+                DBReportJobs.finish(
+                    job_id, 'completed', result=result, progress=progress.state,
+                    artifact_path=artifact_path, artifact_name=artifact_name, artifact_mimetype=artifact_mimetype
+                )
+            except ReportJobCancelled:
+                logging.info(f"Report job {job_id} cancelled")
+                DBReportJobs.finish(job_id, 'cancelled')
+            except Exception as e:
+                logging.error(f"Report job {job_id} failed: {traceback.format_exc()}")
+                try:
+                    DBReportJobs.finish(job_id, 'failed', error=str(e))
+                except Exception:
+                    pass
+            finally:
+                with cls._lock:
+                    cls._active_jobs.discard(job_id)
+
+    @classmethod
+    def _generate(cls, project_id: int, action_type: str, data: Dict[str, Any], progress: _JobProgress) -> Tuple[Dict[str, Any], Optional[Tuple[str, str, BinaryIO]]]:
+        """
+        Run the report. Returns the report result and, for PDF reports,
+        the artifact as (download name, mimetype, file object with the content).
+        """
+        ReportRegistry.load_report_types()
+        output_config = data.get('output_config', {})
+        template_group = data.get("template_group")
+        report_instance = ReportRegistry.get_report_instance(action_type, project_id)
+        if report_instance is None:
+            raise ValueError(f"Invalid action type: {action_type}")
+        report_instance.progress_callback = progress
+
+        if action_type == "pdf_report":
+            try:
+                result = report_instance.generate_report(data["tests"], template_group, theme=output_config.get('theme', 'dark'))
+            except BaseException:
+                report_instance.close()
+                raise
+            artifact = (f'{result["filename"]}.pdf', "application/pdf", report_instance.pdf_io)
+            return result, artifact
+
+        result = report_instance.generate_report(data["tests"], output_config.get("output_id"), template_group)
+        return result, None
+
+    @classmethod
+    def _delete_expired_jobs(cls) -> None:
+        cls.fail_orphaned_jobs()
+        try:
+            for path in DBReportJobs.delete_finished_before(datetime.utcnow() - cls.retention):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        except Exception as er:
+            logging.warning(f"Failed to delete expired report jobs: {er}")
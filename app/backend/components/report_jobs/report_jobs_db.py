@@ -0,0 +1,232 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import uuid
+import traceback
+import logging
+from datetime import datetime
+
+from app.config                  import db
+from app.backend.pydantic_models import ReportJobModel
+
+
+class DBReportJobs(db.Model):
+    __tablename__     = 'report_jobs'
+    id                = db.Column(db.String(36), primary_key=True)
+    project_id        = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False, index=True)
+    action_type       = db.Column(db.String(120), nullable=False)
+    status            = db.Column(db.String(20), nullable=False, default='queued')
+    cancel_requested  = db.Column(db.Boolean, nullable=False, default=False)
+    request           = db.Column(db.Text, nullable=False)
+    progress          = db.Column(db.Text)
+    result            = db.Column(db.Text)
+    error             = db.Column(db.Text)
+    artifact_path     = db.Column(db.String(500))
+    artifact_name     = db.Column(db.String(500))
+    artifact_mimetype = db.Column(db.String(120))
+    created_at        = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at        = db.Column(db.DateTime)
+    finished_at       = db.Column(db.DateTime)
+    owner_pid         = db.Column(db.Integer)
+    heartbeat_at      = db.Column(db.DateTime)
+
+    final_statuses = ('completed', 'failed', 'cancelled')
+
+    def to_dict(self):
+        data = {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        data['request'] = json.loads(self.request) if self.request else {}
+        data['progress'] = json.loads(self.progress) if self.progress else {}
+        data['result'] = json.loads(self.result) if self.result else None
+        return data
+
+    @classmethod
+    def save(cls, project_id, action_type, request_data):
+        try:
+            validated_data = ReportJobModel(
+                id=str(uuid.uuid4()),
+                project_id=project_id,
+                action_type=action_type,
+                request=request_data
+            )
+            payload = validated_data.model_dump()
+            payload['request'] = json.dumps(payload['request'], default=str)
+            payload['progress'] = json.dumps(payload['progress'])
+            payload['owner_pid'] = os.getpid()
+            payload['heartbeat_at'] = datetime.utcnow()
+            instance = cls(**payload)
+            db.session.add(instance)
+            db.session.commit()
+            return instance.id
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def get_configs(cls, project_id, limit=50):
+        try:
+            query = db.session.query(cls).filter_by(project_id=project_id).order_by(cls.created_at.desc()).limit(limit).all()
+            return [ReportJobModel(**job.to_dict()).model_dump() for job in query]
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def get_config_by_id(cls, project_id, id):
+        try:
+            job = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
+            if job:
+                return ReportJobModel(**job.to_dict()).model_dump()
+            return None
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def mark_running(cls, id):
+        """Move a queued job to running; returns False if it was cancelled while queued."""
+        try:
+            job = db.session.query(cls).filter_by(id=id).one_or_none()
+            if not job or job.status != 'queued':
+                return False
+            if job.cancel_requested:
+                job.status = 'cancelled'
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+                return False
+            job.status = 'running'
+            job.started_at = datetime.utcnow()
+            job.heartbeat_at = job.started_at
+            db.session.commit()
+            return True
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def update_progress(cls, id, progress):
+        """Store the progress of a running job; returns whether cancellation was requested."""
+        try:
+            job = db.session.query(cls).filter_by(id=id).one_or_none()
+            if not job:
+                return True
+            job.progress = json.dumps(progress, default=str)
+            job.heartbeat_at = datetime.utcnow()
+            db.session.commit()
+            return bool(job.cancel_requested)
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def heartbeat(cls, ids):
+        """Mark the given unfinished jobs as still owned by a live worker."""
+        if not ids:
+            return
+        try:
+            db.session.query(cls).filter(cls.id.in_(list(ids)), cls.status.in_(('queued', 'running'))).update(
+                {cls.heartbeat_at: datetime.utcnow()}, synchronize_session=False
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def fail_orphaned(cls, stale_before, is_owner_alive):
+        """
+        Fail queued and running jobs that no worker is executing anymore: their
+        owner process is gone or their heartbeat is older than stale_before.
+        Returns the ids of the failed jobs.
+        """
+        try:
+            jobs = db.session.query(cls).filter(cls.status.in_(('queued', 'running'))).all()
+            failed = []
+            for job in jobs:
+                heartbeat_at = job.heartbeat_at or job.started_at or job.created_at
+                if heartbeat_at is not None and heartbeat_at >= stale_before and is_owner_alive(job.owner_pid):
+                    continue
+                job.status = 'failed'
+                job.error = 'The worker process running this report stopped before it finished.'
+                job.finished_at = datetime.utcnow()
+                failed.append(job.id)
+            db.session.commit()
+            return failed
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def finish(cls, id, status, result=None, error=None, artifact_path=None, artifact_name=None, artifact_mimetype=None, progress=None):
+        try:
+            job = db.session.query(cls).filter_by(id=id).one_or_none()
+            if not job:
+                return
+            job.status = status
+            job.result = json.dumps(result, default=str) if result is not None else None
+            job.error = error
+            job.artifact_path = artifact_path
+            job.artifact_name = artifact_name
+            job.artifact_mimetype = artifact_mimetype
+            if progress is not None:
+                job.progress = json.dumps(progress, default=str)
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def request_cancel(cls, project_id, id):
+        """
+        Ask a job to stop. Queued jobs are cancelled right away, running jobs stop
+        at their next progress update. Returns the job status, or None if not found.
+        """
+        try:
+            job = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
+            if not job:
+                return None
+            if job.status not in cls.final_statuses:
+                job.cancel_requested = True
+                if job.status == 'queued':
+                    job.status = 'cancelled'
+                    job.finished_at = datetime.utcnow()
+                db.session.commit()
+            return job.status
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def delete_finished_before(cls, cutoff):
+        """Delete finished jobs older than cutoff; returns their artifact paths."""
+        try:
+            jobs = db.session.query(cls).filter(cls.status.in_(cls.final_statuses), cls.finished_at < cutoff).all()
+            paths = [job.artifact_path for job in jobs if job.artifact_path]
+            for job in jobs:
+                db.session.delete(job)
+            db.session.commit()
+            return paths
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
@@ -17,6 +17,7 @@ import logging
 
 from app.config                  import db
 from app.backend.pydantic_models import SecretsModel
+from app.backend.config_cache    import ConfigCache, cached_config, invalidates_config
 from sqlalchemy                  import or_, UniqueConstraint
 
 class DBSecrets(db.Model):
@@ -33,6 +34,7 @@ class DBSecrets(db.Model):
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
 
     @classmethod
+    @invalidates_config
     def save(cls, data):
         try:
             validated_data = SecretsModel(**data)
@@ -46,6 +48,7 @@ class DBSecrets(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_configs(cls, project_id):
         try:
             query = db.session.query(cls).filter(
@@ -62,6 +65,7 @@ class DBSecrets(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_id(cls, project_id, id):
         try:
             config = db.session.query(cls).filter(
@@ -78,6 +82,7 @@ class DBSecrets(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_key(cls, project_id, key):
         try:
             # Prioritize project-specific secret over a global one
@@ -95,6 +100,7 @@ class DBSecrets(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def update(cls, data):
         try:
             validated_data = SecretsModel(**data)
@@ -126,6 +132,8 @@ class DBSecrets(db.Model):
             if config:
                 db.session.delete(config)
                 db.session.commit()
+                # Integrations referencing the secret had their token set to NULL
+                ConfigCache.invalidate()
                 return True
             return False
         except Exception:
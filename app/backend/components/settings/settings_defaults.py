@@ -27,6 +27,13 @@ from typing import Dict, Any
 
 
 ML_ANALYSIS_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    # Detectors
+    'detectors_enabled': {
+        'value': ['isolation_forest', 'z_score', 'metric_stability', 'ramp_up'],
+        'type': 'list',
+        'description': 'The anomaly detectors to run: isolation_forest, z_score, metric_stability (trend and stability checks) and ramp_up (saturation point detection). Removing an expensive detector shortens the analysis; the time spent in each detector is written to the application log after every analysis.'
+    },
+
     # Isolation Forest Settings
     'contamination': {
         'value': 0.001,
@@ -48,6 +55,16 @@ ML_ANALYSIS_DEFAULTS: Dict[str, Dict[str, Any]] = {
         'options': ['overalThroughput', 'overalUsers'],
         'description': 'The primary performance metric used for Isolation Forest multi-dimensional analysis. This metric serves as the main feature for detecting anomalies. "overalThroughput" focuses on system capacity, while "overalUsers" focuses on load concurrency.'
     },
+    'isf_shared_model': {
+        'value': False,
+        'type': 'bool',
+        'description': 'Fit one multivariate Isolation Forest over all analyzed overall metrics of the fixed-load period and score every metric with it, instead of fitting a separate model per metric. This makes the analysis faster and takes the relationship between metrics into account.'
+    },
+    'isf_baseline_test_title': {
+        'value': '',
+        'type': 'string',
+        'description': 'Title of a reference test to fit the Isolation Forest on. When set, the model is fitted once on the fixed-load period of this test, cached for the project and reused to score new tests, so anomalies are detected relative to the baseline behavior. Leave empty to fit on the analyzed test itself.'
+    },
     'isf_validation_threshold': {
         'value': 0.1,
         'type': 'float',
@@ -271,6 +288,72 @@ ML_ANALYSIS_DEFAULTS: Dict[str, Dict[str, Any]] = {
         'type': 'list',
         'description': 'The list of specific performance metrics to be analyzed for each transaction. Common metrics include response times (avg, median, p90), error rates, and throughput (RPS). This value affects the type of performance issues detected in transactions.'
     },
+    'per_txn_n_jobs': {
+        'value': 4,
+        'type': 'int',
+        'min': 1,
+        'max': 64,
+        'description': 'The number of parallel workers used for per-transaction anomaly detection. Each (transaction, metric) pair is analyzed independently, so higher values shorten the analysis on multi-core hosts. Set to 1 to analyze transactions sequentially.'
+    },
+
+    # Resolution
+    'ml_max_points': {
+        'value': 5000,
+        'type': 'int',
+        'min': 0,
+        'max': 100000,
+        'description': 'The maximum number of points per metric fed into the anomaly detectors. Longer tests are resampled into equal time buckets (mean for rates and response times, sum for error counts), and the detected anomaly windows are mapped back to the original timestamps. The same budget sets the per-transaction sampling interval. This keeps the analysis time bounded for very long tests. Set to 0 to always analyze at full resolution.'
+    },
+    'chart_max_points': {
+        'value': 5000,
+        'type': 'int',
+        'min': 0,
+        'max': 100000,
+        'description': 'The maximum number of points per overall chart. Longer series are thinned with the method below, always keeping the start of each anomaly. Set to 0 to always draw every point.'
+    },
+    'chart_downsampling_method': {
+        'value': 'lttb',
+        'type': 'string',
+        'options': ['lttb', 'minmax'],
+        'description': 'How overall charts are thinned when they exceed the point budget. "lttb" (largest-triangle-three-buckets) keeps the visual shape of the series, "minmax" keeps the minimum and maximum of every bucket so no spike is lost.'
+    },
+
+    # Test History
+    'history_max_runs': {
+        'value': 20,
+        'type': 'int',
+        'min': 3,
+        'max': 5000,
+        'description': 'The number of latest runs of a test family (tests whose titles differ only by a trailing run number or date) analyzed for cross-test trends, level shifts and regressions. Runs are read from the test history index, which is filled whenever the statistics of a test are collected, and backfilled from the data source on demand.'
+    },
+    'history_min_runs': {
+        'value': 5,
+        'type': 'int',
+        'min': 3,
+        'max': 100,
+        'description': 'The minimum number of indexed runs of a test family required before cross-test trend analysis is performed.'
+    },
+    'history_trend_threshold_pct': {
+        'value': 10.0,
+        'type': 'float',
+        'min': 0.1,
+        'max': 1000.0,
+        'description': 'The minimum change, in percent, for a cross-test trend, level shift or latest-run deviation to be reported. For example, 10 means a 90th percentile response time that crept up by less than 10% across the analyzed runs is considered stable.'
+    },
+    'history_changepoint_penalty': {
+        'value': 3.0,
+        'type': 'float',
+        'min': 0.1,
+        'max': 100.0,
+        'description': 'The penalty of the changepoint (level shift) detection across runs, multiplied by the logarithm of the number of runs. Higher values detect fewer, more pronounced level shifts.'
+    },
+    'history_backfill_max_tests': {
+        'value': 20,
+        'type': 'int',
+        'min': 0,
+        'max': 500,
+        'description': 'The maximum number of runs of a test family added to the test history index per analysis. Runs that are in the data source but were never analyzed (e.g. tests from before the index existed) have their statistics collected on demand, newest first. 0 disables the backfill, so only tests whose statistics were collected before are analyzed.'
+    },
 }
 
 
@@ -332,6 +415,18 @@ DATA_QUERY_DEFAULTS: Dict[str, Dict[str, Any]] = {
         'min': 1,
         'max': 300,
         'description': 'Time granularity (in seconds) for aggregating backend listener metrics in time-series queries. This controls the resolution of data points in charts and statistics. Lower values provide finer detail but may increase query time and data volume. Default is 30 seconds.'
+    },
+    'max_concurrent_queries': {
+        'value': 6,
+        'type': 'int',
+        'min': 1,
+        'max': 16,
+        'description': 'Maximum number of independent data source queries (overall metrics, per-request series) that run in parallel while collecting test data. Each data source may apply its own lower limit. Set to 1 to run queries one after another. Default is 6.'
+    },
+    'query_cache_enabled': {
+        'value': True,
+        'type': 'bool',
+        'description': 'Cache query results of finished tests in memory and under app/data/query_cache, so repeated reports and page visits do not re-query the data source. Statistics, tables and ML results of analyzed tests are kept there as test snapshots, so later reports skip the ML analysis, and rendered Grafana graphs of finished tests are reused from app/data/image_cache. Results are invalidated when test data is deleted or re-uploaded. Default is true.'
     }
 }
 
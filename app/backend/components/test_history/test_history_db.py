@@ -0,0 +1,148 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test history index - one summary row per analyzed test.
+
+Whenever the statistics of a test are collected, its summary vector (peak
+users, median throughput, median and 90th percentile response time, error
+rate) is stored here, keyed by data source, bucket and test title. Cross-test
+trend analysis reads these rows instead of querying the raw data of every
+historical test.
+
+Timestamps are stored as naive UTC and returned as timezone-aware UTC.
+"""
+
+import traceback
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import db
+from app.backend.pydantic_models import TestSummaryModel
+
+
+class DBTestSummaries(db.Model):
+    __tablename__ = 'test_summaries'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    source_type = db.Column(db.String(120), nullable=False)
+    source_id = db.Column(db.String(120), nullable=False)
+    bucket = db.Column(db.String(120), nullable=False, default='')
+    test_title = db.Column(db.String(500), nullable=False)
+    start_time = db.Column(db.DateTime, nullable=False)
+    end_time = db.Column(db.DateTime, nullable=False)
+    duration = db.Column(db.Integer)
+    vu = db.Column(db.Float)
+    throughput = db.Column(db.Float)
+    median = db.Column(db.Float)
+    pct90 = db.Column(db.Float)
+    errors_pct = db.Column(db.Float)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('project_id', 'source_type', 'source_id', 'bucket', 'test_title', name='uq_test_summaries_source_title'),
+        db.Index('ix_test_summaries_source_start', 'project_id', 'source_type', 'source_id', 'bucket', 'start_time'),
+    )
+
+    summary_columns = ('vu', 'throughput', 'median', 'pct90', 'errors_pct')
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        data['start_time'] = self.start_time.replace(tzinfo=timezone.utc) if self.start_time else None
+        data['end_time'] = self.end_time.replace(tzinfo=timezone.utc) if self.end_time else None
+        return data
+
+    @classmethod
+    def upsert(cls, project_id: int, source_type: str, source_id: Any, bucket: str, test_title: str, **summary) -> None:
+        """Insert or refresh the summary of a test."""
+        try:
+            validated_data = TestSummaryModel(
+                project_id=project_id,
+                source_type=source_type,
+                source_id=str(source_id),
+                bucket=bucket or '',
+                test_title=test_title,
+                **summary
+            )
+            payload = validated_data.model_dump(exclude={'id'})
+            for key in ('start_time', 'end_time'):
+                if payload[key].tzinfo is not None:
+                    payload[key] = payload[key].astimezone(timezone.utc).replace(tzinfo=None)
+            row = db.session.query(cls).filter_by(
+                project_id=project_id,
+                source_type=validated_data.source_type,
+                source_id=validated_data.source_id,
+                bucket=validated_data.bucket,
+                test_title=validated_data.test_title
+            ).one_or_none()
+            if row is None:
+                db.session.add(cls(**payload))
+            else:
+                for key, value in payload.items():
+                    setattr(row, key, value)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def get_history(cls, project_id: int, source_type: str, source_id: Any, bucket: str,
+                    title_prefix: str = '', until: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the summaries of a source, oldest test first.
+
+        Args:
+            title_prefix: Only tests whose title starts with this prefix
+            until: Only tests started at or before this time
+            limit: Only the latest tests (applied before the ordering is reversed)
+        """
+        try:
+            query = db.session.query(cls).filter_by(
+                project_id=project_id,
+                source_type=source_type,
+                source_id=str(source_id),
+                bucket=bucket or ''
+            )
+            if title_prefix:
+                escaped = title_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                query = query.filter(cls.test_title.like(f"{escaped}%", escape='\\'))
+            if until is not None:
+                if until.tzinfo is not None:
+                    until = until.astimezone(timezone.utc).replace(tzinfo=None)
+                query = query.filter(cls.start_time <= until)
+            query = query.order_by(cls.start_time.desc())
+            if limit:
+                query = query.limit(limit)
+            return [row.to_dict() for row in reversed(query.all())]
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def delete_entry(cls, project_id: int, source_type: str, source_id: Any, bucket: str, test_title: str) -> None:
+        try:
+            db.session.query(cls).filter_by(
+                project_id=project_id,
+                source_type=source_type,
+                source_id=str(source_id),
+                bucket=bucket or '',
+                test_title=test_title
+            ).delete()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
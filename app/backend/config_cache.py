@@ -0,0 +1,101 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Config Cache - versioned cache of validated integration configs and secrets.
+
+Integration objects (InfluxDB, Grafana, AI support, report outputs) resolve
+their config and secrets from SQLite on every construction. The read
+classmethods of the DB models are wrapped with cached_config, so each config
+is read and validated once; the save/update/delete classmethods bump the
+version of their table, which drops the cached entries of that table.
+
+Versions are per process. Entries also expire after ttl_seconds so other
+gunicorn workers pick up changes made through a different worker.
+"""
+
+import copy
+import time
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ConfigCache:
+    """Versioned in-process cache of DB config reads."""
+
+    ttl_seconds = 60
+
+    # Cache structure: {(namespace, method, args): (version, expires_at, value)}
+    _cache: Dict[Tuple[Any, ...], Tuple[int, float, Any]] = {}
+    _versions: Dict[str, int] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_version(cls, namespace: str) -> int:
+        return cls._versions.get(namespace, 0)
+
+    @classmethod
+    def get_or_load(cls, namespace: str, key: Tuple[Any, ...], loader: Callable[[], Any]) -> Any:
+        """Return a copy of the cached value, loading it on a miss or version change."""
+        cache_key = (namespace,) + key
+        now = time.monotonic()
+        with cls._lock:
+            version = cls.get_version(namespace)
+            entry = cls._cache.get(cache_key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                return copy.deepcopy(entry[2])
+
+        value = loader()
+        with cls._lock:
+            # Skip storing if the table changed while loading
+            if cls.get_version(namespace) == version:
+                cls._cache[cache_key] = (version, now + cls.ttl_seconds, value)
+        return copy.deepcopy(value)
+
+    @classmethod
+    def invalidate(cls, namespace: Optional[str] = None) -> None:
+        """Drop the cached reads of one table, or of all tables if namespace is None."""
+        with cls._lock:
+            namespaces = [namespace] if namespace else {key[0] for key in cls._cache} | set(cls._versions)
+            for name in namespaces:
+                cls._versions[name] = cls.get_version(name) + 1
+            cls._cache = {key: entry for key, entry in cls._cache.items() if key[0] not in namespaces}
+
+
+def cached_config(func: Callable):
+    """
+    Cache a read classmethod of a DB model in ConfigCache under the model's table name.
+    Apply below @classmethod.
+    """
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return ConfigCache.get_or_load(cls.__tablename__, key, lambda: func(cls, *args, **kwargs))
+    return wrapper
+
+
+def invalidates_config(func: Callable):
+    """
+    Bump the ConfigCache version of the model's table after a write classmethod
+    (also when it fails, as it may have committed part of its changes).
+    Apply below @classmethod.
+    """
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        try:
+            return func(cls, *args, **kwargs)
+        finally:
+            ConfigCache.invalidate(cls.__tablename__)
+    return wrapper
@@ -14,17 +14,16 @@
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 from typing import List, Dict, Any, Literal, Tuple, Optional
 import logging
+import math
+import threading
+import time
 from app.backend.errors import ErrorMessages
 from collections import defaultdict
-from app.backend.data_provider.data_analysis.detectors import (
-    IsolationForestDetector,
-    ZScoreDetector,
-    MetricStabilityDetector,
-    RampUpPeriodAnalyzer
-)
+from concurrent.futures import ThreadPoolExecutor
+from app.backend.data_provider.data_analysis.detectors.registry import DetectorRegistry
+from app.backend.data_provider.data_analysis import anomaly_flags, downsampling
 from app.backend.data_provider.data_analysis.constants import OVERALL_METRIC_KEYS, OVERALL_METRIC_DISPLAY, COL_TXN_RPS, COL_OVERALL_RPS, COL_ERR_RATE
 from app.backend.components.settings.settings_defaults import get_defaults_for_category
 from app.backend.components.settings.settings_service import SettingsService
@@ -45,6 +44,13 @@ class AnomalyDetectionEngine:
             project_id: Project ID for loading project-specific settings (optional)
         """
         self.output = []
+        self.project_id = project_id
+        # Scores of the shared/baseline Isolation Forest model for the fixed-load
+        # period, used by IsolationForestDetector instead of per-metric fits
+        self.isf_shared_scores: Optional[pd.Series] = None
+        # Time buckets of the analyzed frame when the test exceeds 'ml_max_points'
+        self.resolution: Optional[downsampling.ResolutionPlan] = None
+        self.analysis_span_seconds = 0.0
         # Internal store for overall metric anomalies (per window), to be
         # enriched with per-transaction attribution before final output is built.
         self.overall_anomalies: List[Dict[str, Any]] = []
@@ -71,16 +77,29 @@ class AnomalyDetectionEngine:
         # Validate and update parameters (explicit params override everything)
         self._validate_and_set_params(params, default_params)
 
-        self.detectors = [
-            IsolationForestDetector(),
-            ZScoreDetector(),
-            MetricStabilityDetector(),
-            RampUpPeriodAnalyzer(
-                threshold_condition=lambda x: x < self.rolling_correlation_threshold,
-                base_metric=self.ramp_up_base_metric
-            )
-        ]
-        self.anomaly_detectors = self.detectors if self.detectors is not None else []
+        # Detectors are created on first use (see anomaly_detectors), so engines used
+        # only for period filtering do not import the ML libraries
+        self._anomaly_detectors = None
+        # Cost of each detector in this engine: {name: {'calls', 'points', 'seconds'}}
+        self.detector_costs: Dict[str, Dict[str, float]] = {}
+        self._costs_lock = threading.Lock()
+
+    @property
+    def anomaly_detectors(self) -> List[Any]:
+        if self._anomaly_detectors is None:
+            enabled = getattr(self, 'detectors_enabled', None)
+            if not isinstance(enabled, (list, tuple)):
+                enabled = DetectorRegistry.get_registered_detectors()
+            self._anomaly_detectors = DetectorRegistry.create_enabled(self, [str(key) for key in enabled])
+        return self._anomaly_detectors
+
+    @anomaly_detectors.setter
+    def anomaly_detectors(self, detectors: List[Any]) -> None:
+        self._anomaly_detectors = detectors
+
+    @property
+    def detectors(self) -> List[Any]:
+        return self.anomaly_detectors
 
     def _validate_and_set_params(self, params: Dict[str, Any], default_params: Dict[str, Any]):
         if not isinstance(params, dict):
@@ -109,6 +128,8 @@ class AnomalyDetectionEngine:
         return df
 
     def normalize_columns(self, df, columns):
+        from sklearn.preprocessing import MinMaxScaler
+
         scaler = MinMaxScaler()
         df[columns] = scaler.fit_transform(df[columns])
         return df
@@ -230,34 +251,38 @@ class AnomalyDetectionEngine:
         compute min/max/mean, and the absolute delta from baseline.
         """
         if values is None or len(values) == 0:
-            return {
-                'baseline': float(baseline_value) if baseline_value is not None else 0.0,
-                'min': float(baseline_value) if baseline_value is not None else 0.0,
-                'max': float(baseline_value) if baseline_value is not None else 0.0,
-                'mean': float(baseline_value) if baseline_value is not None else 0.0,
-                'direction': 'increase',
-                'significant_value': float(baseline_value) if baseline_value is not None else 0.0,
-                'delta_abs': 0.0,
-            }
+            return self._window_summary(baseline_value, 0, 0.0, 0.0, 0.0, 0.0)
 
         # filter out NaNs
         arr = np.array(values, dtype=float)
         arr = arr[~np.isnan(arr)]
         if arr.size == 0:
+            return self._window_summary(baseline_value, 0, 0.0, 0.0, 0.0, 0.0)
+        return self._window_summary(baseline_value, arr.size, np.min(arr), np.max(arr), np.mean(arr), arr[0])
+
+    @staticmethod
+    def _window_summary(baseline_value: Optional[float], count: int, v_min: float, v_max: float, v_mean: float, first_value: float) -> Dict[str, Any]:
+        """
+        Window summary from the statistics of its non-NaN values; without values
+        everything falls back to the baseline. A missing baseline is replaced by
+        the first value of the window.
+        """
+        if count == 0:
+            fallback = float(baseline_value) if baseline_value is not None else 0.0
             return {
-                'baseline': float(baseline_value) if baseline_value is not None else 0.0,
-                'min': float(baseline_value) if baseline_value is not None else 0.0,
-                'max': float(baseline_value) if baseline_value is not None else 0.0,
-                'mean': float(baseline_value) if baseline_value is not None else 0.0,
+                'baseline': fallback,
+                'min': fallback,
+                'max': fallback,
+                'mean': fallback,
                 'direction': 'increase',
-                'significant_value': float(baseline_value) if baseline_value is not None else 0.0,
+                'significant_value': fallback,
                 'delta_abs': 0.0,
             }
 
-        baseline = float(baseline_value) if baseline_value is not None else float(arr[0])
-        v_min = float(np.min(arr))
-        v_max = float(np.max(arr))
-        v_mean = float(np.mean(arr))
+        baseline = float(baseline_value) if baseline_value is not None else float(first_value)
+        v_min = float(v_min)
+        v_max = float(v_max)
+        v_mean = float(v_mean)
 
         delta_up = v_max - baseline
         delta_down = baseline - v_min
@@ -280,6 +305,94 @@ class AnomalyDetectionEngine:
             'delta_abs': delta_abs,
         }
 
+    @staticmethod
+    def _flag_runs(flags: np.ndarray, max_gap: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start and end positions (inclusive) of the runs of flagged points, where
+        runs separated by at most max_gap unflagged points form one window.
+        """
+        positions = np.flatnonzero(np.asarray(flags, dtype=bool))
+        if positions.size == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        breaks = np.flatnonzero(np.diff(positions) - 1 > max_gap)
+        starts = positions[np.concatenate(([0], breaks + 1))]
+        ends = positions[np.concatenate((breaks, [positions.size - 1]))]
+        return starts, ends
+
+    @staticmethod
+    def _window_stats(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Count, min, max, mean and first value of the non-NaN values of every [start, end] window."""
+        valid = np.append(~np.isnan(values), False)
+        padded = np.append(values, np.nan)
+        # Bounds as [s0, e0 + 1, s1, e1 + 1, ...]: reduceat reduces up to the next bound,
+        # so the even results are the windows
+        bounds = np.column_stack((starts, ends + 1)).ravel()
+        count = np.add.reduceat(valid.astype(np.int64), bounds)[::2]
+        total = np.add.reduceat(np.where(valid, padded, 0.0), bounds)[::2]
+        v_min = np.fmin.reduceat(padded, bounds)[::2]
+        v_max = np.fmax.reduceat(padded, bounds)[::2]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            v_mean = total / count
+        valid_positions = np.flatnonzero(valid)
+        if valid_positions.size:
+            first = padded[valid_positions[np.minimum(np.searchsorted(valid_positions, starts), valid_positions.size - 1)]]
+        else:
+            first = np.full(len(starts), np.nan)
+        return count, v_min, v_max, v_mean, first
+
+    @staticmethod
+    def _pre_window_medians(values: np.ndarray, starts: np.ndarray, k: int) -> np.ndarray:
+        """Median of the non-NaN values among the k points before every start (NaN when there are none)."""
+        result = np.full(len(starts), np.nan)
+        if k <= 0 or len(starts) == 0:
+            return result
+        padded = np.concatenate((np.full(k, np.nan), values))
+        rows = np.lib.stride_tricks.sliding_window_view(padded, k)[starts]
+        has_values = ~np.isnan(rows).all(axis=1)
+        if has_values.any():
+            result[has_values] = np.nanmedian(rows[has_values], axis=1)
+        return result
+
+    @staticmethod
+    def _prefix_sums(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Prefix sums and counts of the non-NaN values, for _window_means."""
+        valid = ~np.isnan(values)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(valid)))
+        return sums, counts
+
+    @staticmethod
+    def _window_means(timestamps_ns: np.ndarray, prefix: Tuple[np.ndarray, np.ndarray], starts_ns: np.ndarray, ends_ns: np.ndarray) -> np.ndarray:
+        """Mean of the non-NaN values with sorted timestamps in every [start, end] (NaN for empty windows)."""
+        sums, counts = prefix
+        lo = np.searchsorted(timestamps_ns, starts_ns, side='left')
+        hi = np.searchsorted(timestamps_ns, ends_ns, side='right')
+        n = counts[hi] - counts[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(n > 0, (sums[hi] - sums[lo]) / np.maximum(n, 1), np.nan)
+
+    @classmethod
+    def _transaction_series(cls, annotated: Optional[pd.DataFrame], txn_col: str) -> Dict[Any, Dict[str, Any]]:
+        """
+        Sorted timestamps (ns), prefix sums of 'rps' / 'overall_rps' and the median
+        sample interval of every transaction of the annotated long frame.
+        """
+        series: Dict[Any, Dict[str, Any]] = {}
+        if annotated is None or annotated.empty or txn_col not in annotated.columns:
+            return series
+        for txn, g in annotated.groupby(txn_col, sort=False):
+            g = g.sort_values('timestamp')
+            timestamps = pd.DatetimeIndex(pd.to_datetime(g['timestamp']))
+            entry = {'ts': timestamps.asi8}
+            for col in ('rps', 'overall_rps'):
+                if col in g.columns:
+                    entry[col] = cls._prefix_sums(pd.to_numeric(g[col], errors='coerce').to_numpy(dtype=float))
+            diffs = np.diff(entry['ts']) / 1e9
+            entry['sample_seconds'] = float(np.median(diffs)) if diffs.size else 5.0
+            series[txn] = entry
+        return series
+
     def collect_anomalies(self, df, metric, anomaly_cl):
         """Collect anomaly windows for a metric.
 
@@ -300,15 +413,11 @@ class AnomalyDetectionEngine:
             df_idx = df.copy()
 
         if anomaly_cl in df_idx.columns:
-            flags = df_idx[anomaly_cl].apply(
-                lambda v: isinstance(v, str)
-                and 'Anomaly' in str(v)
-                and 'potential saturation point' not in str(v)
-            )
+            flags = anomaly_flags.is_anomaly(df_idx[anomaly_cl])
         else:
-            flags = pd.Series(False, index=df_idx.index)
+            flags = np.zeros(len(df_idx), dtype=bool)
 
-        df_idx[f'{metric}_anomaly_flag'] = flags.astype(bool)
+        df_idx[f'{metric}_anomaly_flag'] = flags
 
         cols = [c for c in [metric, f'{metric}_anomaly_flag'] if c in df_idx.columns]
         if cols:
@@ -332,29 +441,16 @@ class AnomalyDetectionEngine:
                 continue
 
     def update_anomaly_status(self, df, metric, anomaly_metric, method):
+        """
+        Set the bit of ``method`` in the '<metric>_anomaly' mask column for the
+        points flagged (-1) in ``anomaly_metric``.
+        """
         anomaly_col = f'{metric}_anomaly'
-        anomaly_method_col = anomaly_metric
         df = df.copy()
 
-        if anomaly_col not in df.columns:
-            df[anomaly_col] = ""
-
-        def check_and_update(row):
-            if row[anomaly_method_col] == -1:
-                if 'Anomaly' in str(row[anomaly_col]):
-                    if method not in str(row[anomaly_col]):
-                        return f"{row[anomaly_col]}, {method}"
-                    else:
-                        return row[anomaly_col]
-                else:
-                    return f"Anomaly: {method}"
-            else:
-                if 'Anomaly' in str(row[anomaly_col]):
-                    return row[anomaly_col]
-                else:
-                    return "Normal"
-
-        df[anomaly_col] = df.apply(check_and_update, axis=1)
+        mask = anomaly_flags.as_mask(df[anomaly_col]) if anomaly_col in df.columns else np.zeros(len(df), dtype=np.int64)
+        flagged = df[anomaly_metric].to_numpy() == -1
+        df[anomaly_col] = np.where(flagged, mask | anomaly_flags.method_bit(method), mask)
         return df
 
     def filter_contextual_anomalies(self, df: pd.DataFrame, metric: str, method_flag_col: str) -> pd.DataFrame:
@@ -382,52 +478,80 @@ class AnomalyDetectionEngine:
         window = int(getattr(self, 'context_median_window', 20))
         pct = float(getattr(self, 'context_median_pct', 0.15))
 
-        values = df[metric].to_numpy()
-        n = len(df)
-
-        # Only evaluate indices flagged as anomalies by the method
+        values = df[metric].to_numpy(dtype=float)
         flags = df[method_flag_col].to_numpy(copy=True)
 
-        for i in range(n):
-            if flags[i] != -1:
-                continue
-
-            start = max(0, i - window)
-            end = min(n, i + window + 1)
-
-            # neighbors excluding the current point
-            prev_vals = values[start:i]
-            next_vals = values[i + 1:end]
-
-            if prev_vals.size == 0 and next_vals.size == 0:
-                continue
-
-            neighbors = np.concatenate([prev_vals, next_vals]) if prev_vals.size and next_vals.size else (
-                prev_vals if prev_vals.size else next_vals
-            )
+        # Only evaluate indices flagged as anomalies by the method
+        candidates = np.flatnonzero(flags == -1)
+        if candidates.size == 0:
+            return df
 
-            # Remove NaNs
-            neighbors = neighbors[~np.isnan(neighbors)]
-            if neighbors.size == 0:
-                continue
+        neighbor_median = self._neighbor_median(values, candidates, window)
+        current = values[candidates]
+        # Use current point magnitude as denominator to match "15% of metric"
+        denom = np.maximum(np.abs(current), 1e-12)
+        diff = np.abs(current - neighbor_median)
 
-            neighbor_median = float(np.median(neighbors))
-            # Use current point magnitude as denominator to match "15% of metric"
-            denom = max(abs(float(values[i])), 1e-12)
-            diff = abs(float(values[i]) - neighbor_median)
+        # Reclassify as normal; points without neighbors (NaN median) are kept
+        reclassify = ~np.isnan(neighbor_median) & (diff <= pct * denom)
+        flags[candidates[reclassify]] = 1
+        df[method_flag_col] = flags
+        return df
 
-            if diff <= pct * denom:
-                # Reclassify as normal
-                df.iloc[i, df.columns.get_loc(method_flag_col)] = 1
+    @staticmethod
+    def _neighbor_median(values: np.ndarray, positions: np.ndarray, window: int) -> np.ndarray:
+        """
+        Median of up to `window` points before and after each position, excluding
+        the point itself and NaNs (NaN if there are no such neighbors).
 
-        return df
+        The neighborhoods of all positions are gathered from a strided view of the
+        NaN-padded series and sorted row-wise (NaNs sort last), so the median is
+        read from the middle of the valid part of each row. Positions are
+        processed in chunks to bound memory on long tests with dense anomaly clusters.
+        """
+        window = max(int(window), 0)
+        result = np.full(positions.size, np.nan)
+        if window == 0 or values.size == 0:
+            return result
+        padded = np.concatenate([np.full(window, np.nan), values, np.full(window, np.nan)])
+        # Row i of the view is values[i - window:i + window + 1]; drop the centre column
+        windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * window + 1)
+        neighbor_cols = np.r_[0:window, window + 1:2 * window + 1]
+        chunk = 4096
+        for start in range(0, positions.size, chunk):
+            rows = positions[start:start + chunk]
+            neighbors = np.sort(windows[rows][:, neighbor_cols], axis=1)
+            counts = np.count_nonzero(~np.isnan(neighbors), axis=1)
+            valid = counts > 0
+            idx = np.arange(rows.size)[valid]
+            lower = neighbors[idx, (counts[valid] - 1) // 2]
+            upper = neighbors[idx, counts[valid] // 2]
+            result[start + idx] = (lower + upper) / 2.0
+        return result
 
-    def detect_anomalies(self, df, metric, period_type):
-        for detector in self.anomaly_detectors:
+    def detect_anomalies(self, df, metric, period_type, detectors=None):
+        for detector in (self.anomaly_detectors if detectors is None else detectors):
             if detector.type == period_type:
+                started = time.perf_counter()
+                points = len(df)
                 df = detector.detect(df, metric, self)
+                self._record_detector_cost(detector.name, points, time.perf_counter() - started)
         return df
 
+    def _record_detector_cost(self, name: str, points: int, seconds: float) -> None:
+        with self._costs_lock:
+            cost = self.detector_costs.setdefault(name, {'calls': 0, 'points': 0, 'seconds': 0.0})
+            cost['calls'] += 1
+            cost['points'] += points
+            cost['seconds'] += seconds
+
+    def log_detector_costs(self, label: str = '') -> None:
+        for name, cost in sorted(self.detector_costs.items(), key=lambda item: -item[1]['seconds']):
+            logging.info(
+                f"Anomaly detector '{name}'{f' ({label})' if label else ''}: "
+                f"{cost['seconds']:.3f}s, {cost['calls']} runs, {cost['points']} points"
+            )
+
     def filter_ramp_up_and_down_periods(self, df, metric):
         df['is_ramp_up_down'] = df[metric].diff().fillna(0).apply(
             lambda x: 'Ramp-up' if x > 0 else ('Ramp-down' if x < 0 else 'Stable')
@@ -454,6 +578,24 @@ class AnomalyDetectionEngine:
         # x-values to be sorted or they will draw backtracking lines.
         sorted_df = merged_df.sort_index()
 
+        # Long series are thinned for charts; the start of every anomaly run is kept
+        anomaly_cols = [col for col in sorted_df.columns if col.endswith('_anomaly')]
+        positions = downsampling.select_chart_positions(
+            sorted_df,
+            [col for col in sorted_df.columns if col not in anomaly_cols],
+            int(getattr(self, 'chart_max_points', 0) or 0),
+            str(getattr(self, 'chart_downsampling_method', 'lttb')),
+            keep=self._anomaly_run_starts(sorted_df, anomaly_cols)
+        )
+        if positions is not None:
+            sorted_df = sorted_df.iloc[positions]
+
+        # Anomaly masks are rendered to their labels only here, once per metric
+        labels = {
+            col: anomaly_flags.render_labels(sorted_df[col])
+            for col in sorted_df.columns if col.endswith('_anomaly')
+        }
+
         for col in sorted_df.columns:
             if '_anomaly' not in col:
                 anomaly_col = col + '_anomaly'
@@ -463,9 +605,9 @@ class AnomalyDetectionEngine:
                     'data': []
                 }
 
-                for timestamp, row in sorted_df.iterrows():
-                    anomaly_value = row[anomaly_col] if anomaly_col in row and pd.notna(row[anomaly_col]) else 'Normal'
-                    value = row[col] if pd.notna(row[col]) else 0.0
+                anomaly_values = labels[anomaly_col].tolist() if anomaly_col in labels else [anomaly_flags.NORMAL_LABEL] * len(sorted_df)
+                for timestamp, value, anomaly_value in zip(sorted_df.index, sorted_df[col].tolist(), anomaly_values):
+                    value = value if pd.notna(value) else 0.0
                     metrics[col]['data'].append({
                         'timestamp': timestamp.isoformat(),
                         'value': value,
@@ -474,6 +616,76 @@ class AnomalyDetectionEngine:
 
         return metrics
 
+    @staticmethod
+    def _anomaly_run_starts(df: pd.DataFrame, anomaly_cols: List[str]) -> Optional[np.ndarray]:
+        """Boolean array marking the first point of every run of flagged points in any anomaly column."""
+        if not anomaly_cols:
+            return None
+        starts = np.zeros(len(df), dtype=bool)
+        for col in anomaly_cols:
+            flagged = anomaly_flags.as_mask(df[col]) != 0
+            starts |= flagged & ~np.concatenate(([False], flagged[:-1]))
+        return starts
+
+    def _plan_detection_resolution(self, merged_df: pd.DataFrame) -> Optional[downsampling.ResolutionPlan]:
+        """Time buckets for detection when the test has more points than 'ml_max_points'."""
+        if not isinstance(merged_df.index, pd.DatetimeIndex):
+            return None
+        plan = downsampling.plan_resolution(merged_df.index, int(getattr(self, 'ml_max_points', 0) or 0))
+        if plan is not None:
+            logging.info(
+                f"Analyzing {len(merged_df)} points in {plan.n_buckets} buckets of {plan.bucket_seconds:g}s "
+                f"(ml_max_points={self.ml_max_points})"
+            )
+        return plan
+
+    @staticmethod
+    def _expand_to_full_resolution(reduced_df: pd.DataFrame, full_df: pd.DataFrame, plan: downsampling.ResolutionPlan) -> pd.DataFrame:
+        """
+        Full-resolution samples of the buckets in reduced_df, with the anomaly
+        masks of each bucket applied to all of its samples.
+        """
+        labels = plan.sample_labels
+        keep = labels.isin(reduced_df.index)
+        expanded = full_df[keep].copy()
+        bucket_rows = reduced_df.reindex(labels[keep])
+        for col in reduced_df.columns:
+            if col not in expanded.columns:
+                expanded[col] = bucket_rows[col].to_numpy()
+        return expanded
+
+    def _map_overall_windows_to_full_resolution(self, full_df: pd.DataFrame, plan: downsampling.ResolutionPlan) -> None:
+        """Move the recorded overall windows to full-resolution timestamps and summarize them from the original samples."""
+        for anomaly in self.overall_anomalies:
+            if anomaly.get('start_time') is None or anomaly.get('end_time') is None:
+                continue
+            start, end = plan.window_bounds(anomaly['start_time'], anomaly['end_time'])
+            anomaly['start_time'], anomaly['end_time'] = start, end
+            metric = anomaly.get('metric')
+            if metric not in full_df.columns:
+                continue
+            values = pd.to_numeric(full_df.loc[start:end, metric], errors='coerce')
+            if values.empty:
+                continue
+            summary = dict(anomaly.get('summary') or {})
+            summary.update(self._summarize_anomaly_window(anomaly.get('baseline'), values.tolist()))
+            summary.update({
+                'start': start.isoformat(),
+                'end': end.isoformat(),
+                'durationSec': float((end - start).total_seconds()),
+                'points': int(len(values)),
+            })
+            anomaly['summary'] = summary
+            anomaly['direction'] = summary.get('direction')
+            anomaly['significant_value'] = summary.get('significant_value', anomaly.get('baseline'))
+
+    def _per_transaction_sampling_seconds(self, base_seconds: int = 30) -> int:
+        """Per-transaction sampling interval: base_seconds, coarsened so a transaction stays within 'ml_max_points'."""
+        max_points = int(getattr(self, 'ml_max_points', 0) or 0)
+        if max_points <= 0 or self.analysis_span_seconds <= 0:
+            return base_seconds
+        return int(max(1, math.ceil(self.analysis_span_seconds / max_points / base_seconds)) * base_seconds)
+
     def _analyze_results(self, analysis_output: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze the test results and return a dictionary of findings.
@@ -607,6 +819,14 @@ class AnomalyDetectionEngine:
             - HTML summary
             - Performance status
         """
+        # Long tests are analyzed in time buckets; results are mapped back to the original samples
+        full_df = merged_df.sort_index() if isinstance(merged_df.index, pd.DatetimeIndex) else merged_df
+        self.resolution = self._plan_detection_resolution(full_df)
+        if self.resolution is not None:
+            merged_df = self.resolution.resample(full_df)
+        if isinstance(full_df.index, pd.DatetimeIndex) and len(full_df):
+            self.analysis_span_seconds = float((full_df.index[-1] - full_df.index[0]).total_seconds())
+
         # Analyze data periods
         fixed_load_period, ramp_up_period, is_fixed_load = self.filter_ramp_up_and_down_periods(df=merged_df.copy(), metric="overalUsers")
 
@@ -617,6 +837,7 @@ class AnomalyDetectionEngine:
             logging.warning("Skipping ramp-up anomaly detection: 'overalThroughput' metric not available")
 
         if is_fixed_load:
+            self.isf_shared_scores = self._get_shared_isolation_forest_scores(fixed_load_period, standard_metrics, data_provider)
             for metric in standard_metrics:
                 if standard_metrics[metric]['analysis']:
                     # Only detect anomalies if the metric exists in the DataFrame
@@ -628,6 +849,7 @@ class AnomalyDetectionEngine:
                         )
                     else:
                         logging.warning(f"Skipping anomaly detection for '{metric}': metric not available in data")
+            self.isf_shared_scores = None
             try:
                 self.fixed_load_period_annotated = fixed_load_period.copy()
             except Exception:
@@ -636,10 +858,12 @@ class AnomalyDetectionEngine:
         # Ensure columns match between periods
         missing_columns = set(fixed_load_period.columns) - set(ramp_up_period.columns)
         for col in missing_columns:
-            ramp_up_period[col] = 'Normal'
+            ramp_up_period[col] = 0
 
         # Merge periods and prepare results
         merged_df = pd.concat([ramp_up_period, fixed_load_period], axis=0)
+        if self.resolution is not None:
+            merged_df = self._expand_to_full_resolution(merged_df, full_df, self.resolution)
         metrics = self.prepare_final_metrics(merged_df, standard_metrics)
 
         has_any_overall_anomaly = False
@@ -647,6 +871,8 @@ class AnomalyDetectionEngine:
             # For gating and attribution we only consider anomalies detected
             # in the fixed-load period, not during ramp-up.
             self.process_anomalies(fixed_load_period)
+            if self.resolution is not None:
+                self._map_overall_windows_to_full_resolution(full_df, self.resolution)
             has_any_overall_anomaly = self._has_overall_anomalies(fixed_load_period)
 
         self._run_per_transaction_pipeline(
@@ -662,6 +888,58 @@ class AnomalyDetectionEngine:
 
         return metrics, is_fixed_load, self.output
 
+    def _get_shared_isolation_forest_scores(self, fixed_load_period: pd.DataFrame, standard_metrics: Dict[str, Dict[str, Any]], data_provider=None) -> Optional[pd.Series]:
+        """
+        Score the fixed-load period with one multivariate Isolation Forest over all
+        analyzed overall metrics, instead of fitting one model per metric.
+
+        With 'isf_baseline_test_title' set, the model is fitted on the fixed-load
+        period of that test and cached per project (BaselineModelStore), so new
+        tests are scored relative to the baseline without refitting. Otherwise,
+        with 'isf_shared_model' enabled, the model is fitted on the current test.
+        Returns None to keep per-metric models.
+        """
+        baseline_title = str(getattr(self, 'isf_baseline_test_title', '') or '').strip()
+        if not baseline_title and not getattr(self, 'isf_shared_model', False):
+            return None
+        if not any(d.__class__.__name__ == 'IsolationForestDetector' for d in self.anomaly_detectors):
+            return None
+        from app.backend.data_provider.data_analysis.detectors.isolation_forest_detector import IsolationForestModel
+
+        features = [m for m, config in standard_metrics.items() if config.get('analysis') and m in fixed_load_period.columns]
+        if not features:
+            return None
+        try:
+            if baseline_title and data_provider is not None:
+                model = self._get_baseline_isolation_forest(baseline_title, features, data_provider)
+            else:
+                model = IsolationForestModel(features, self.contamination).fit(fixed_load_period)
+            return model.score(fixed_load_period)
+        except Exception as e:
+            logging.warning(f"Shared Isolation Forest model failed, using per-metric models: {e}")
+            return None
+
+    def _get_baseline_isolation_forest(self, baseline_title: str, features: List[str], data_provider):
+        from app.backend.data_provider.data_analysis.detectors.isolation_forest_detector import IsolationForestModel
+        from app.backend.data_provider.data_analysis.model_store import BaselineModelStore
+        from app.backend.integrations.data_sources.query_cache import QueryResultCache
+
+        bounds = data_provider.ds_obj.get_test_time_bounds(test_title=baseline_title)
+        start, end = bounds['start_time_iso'], bounds['end_time_iso']
+        key = BaselineModelStore.make_key(
+            data_provider.source_type, QueryResultCache.get_scope_of(data_provider.ds_obj),
+            baseline_title, start, end, tuple(features), self.contamination
+        )
+
+        def fit():
+            baseline_df, _ = data_provider.get_overall_frame(baseline_title, start, end)
+            baseline_fixed, _, _ = self.filter_ramp_up_and_down_periods(df=baseline_df.copy(), metric="overalUsers")
+            available = [f for f in features if f in baseline_fixed.columns]
+            logging.info(f"Fitting baseline Isolation Forest on test '{baseline_title}' ({len(baseline_fixed)} points)")
+            return IsolationForestModel(available, self.contamination).fit(baseline_fixed)
+
+        return BaselineModelStore.get_or_fit(self.project_id, key, fit)
+
     def _run_per_transaction_pipeline(self, *, is_fixed_load: bool, has_any_overall_anomaly: bool, data_provider=None, test_obj=None) -> None:
         try:
             # Respect project setting for per-transaction analysis. If disabled,
@@ -672,7 +950,7 @@ class AnomalyDetectionEngine:
 
             if is_fixed_load and has_any_overall_anomaly and data_provider is not None and test_obj is not None:
                 try:
-                    data_provider.build_per_transaction_long_frame(test_obj=test_obj, sampling_interval_sec=30)
+                    data_provider.build_per_transaction_long_frame(test_obj=test_obj, sampling_interval_sec=self._per_transaction_sampling_seconds())
                 except Exception as e:
                     logging.warning(f"Failed to build per-transaction long frame: {e}")
 
@@ -822,7 +1100,7 @@ class AnomalyDetectionEngine:
         self.transaction_selection = result
         return result
 
-    def _detect_group(self, g: pd.DataFrame, metric: str) -> pd.DataFrame:
+    def _detect_group(self, g: pd.DataFrame, metric: str, detectors=None) -> pd.DataFrame:
         if metric in g.columns:
             cols = ["timestamp", metric]
             for extra in (COL_TXN_RPS, COL_OVERALL_RPS, COL_ERR_RATE):
@@ -836,104 +1114,103 @@ class AnomalyDetectionEngine:
             df[f'{metric}_anomaly_flag'] = False
             return df
         df.set_index('timestamp', inplace=True)
-        # For per-transaction analysis, run anomaly detectors only (exclude trend/stability)
-        original_detectors = self.anomaly_detectors
-        try:
-            self.anomaly_detectors = [d for d in original_detectors if d.__class__.__name__ != 'MetricStabilityDetector']
-            df = self.detect_anomalies(df, metric=metric, period_type='fixed_load')
-        finally:
-            self.anomaly_detectors = original_detectors
+        # For per-transaction analysis, run anomaly detectors only (exclude trend/stability).
+        # The list is passed explicitly so groups can be detected concurrently.
+        if detectors is None:
+            detectors = self._per_transaction_detectors()
+        df = self.detect_anomalies(df, metric=metric, period_type='fixed_load', detectors=detectors)
         col = f'{metric}_anomaly'
         if col in df.columns:
-            flags = df[col].apply(lambda v: isinstance(v, str) and 'Anomaly' in v and 'potential saturation point' not in str(v))
+            df[f'{metric}_anomaly_flag'] = anomaly_flags.is_anomaly(df[col])
         else:
-            flags = pd.Series(False, index=df.index)
-        df[f'{metric}_anomaly_flag'] = flags.astype(bool)
+            df[f'{metric}_anomaly_flag'] = False
         return df
 
     def _extract_anomaly_windows(self, df_idx: pd.DataFrame, metric: str) -> List[Dict[str, Any]]:
         if df_idx.empty or f'{metric}_anomaly_flag' not in df_idx.columns:
             return []
-        flags = df_idx[f'{metric}_anomaly_flag'].to_numpy()
-        ts = df_idx.index.to_numpy()
-        n = len(flags)
-        if n == 0:
-            return []
         max_gap = int(getattr(self, 'merge_gap_samples', 1))
-        windows = []
-        in_win = False
-        start_i = None
-        gap = 0
-        last_true_i = None
-        for i in range(n):
-            if flags[i]:
-                if not in_win:
-                    in_win = True
-                    start_i = i
-                    gap = 0
-                last_true_i = i
-                gap = 0
-            else:
-                if in_win:
-                    gap += 1
-                    if gap > max_gap:
-                        end_i = last_true_i if last_true_i is not None else i - 1
-                        if start_i is not None and end_i is not None and end_i >= start_i:
-                            windows.append((start_i, end_i))
-                        in_win = False
-                        start_i = None
-                        gap = 0
-        if in_win and start_i is not None:
-            end_i = last_true_i if last_true_i is not None else n - 1
-            if end_i >= start_i:
-                windows.append((start_i, end_i))
+        starts, ends = self._flag_runs(df_idx[f'{metric}_anomaly_flag'].to_numpy(), max_gap)
+        if starts.size == 0:
+            return []
+
+        start_ts = df_idx.index[starts]
+        end_ts = df_idx.index[ends]
+        try:
+            durations = np.asarray((end_ts - start_ts).total_seconds(), dtype=float)
+        except Exception:
+            durations = (ends - starts).astype(float)
 
         # Prepare metric series if available for window summarization
         vals = None
         if metric in df_idx.columns:
             try:
-                vals = pd.to_numeric(df_idx[metric], errors='coerce')
+                vals = pd.to_numeric(df_idx[metric], errors='coerce').to_numpy(dtype=float)
             except Exception:
                 vals = None
 
-        result = []
-        for s_i, e_i in windows:
-            ts_start = ts[s_i]
-            ts_end = ts[e_i]
+        if vals is not None:
             try:
-                duration_sec = float((pd.Timestamp(ts_end) - pd.Timestamp(ts_start)).total_seconds())
+                # Use a simple pre-window baseline from previous points
+                k = int(getattr(self, 'baseline_window', 5))
             except Exception:
-                duration_sec = float(e_i - s_i)
+                k = 5
+            baselines = self._pre_window_medians(vals, starts, k)
+            # Without previous values the first value of the window is the baseline
+            baselines = np.where(np.isnan(baselines), vals[starts], baselines)
+            count, v_min, v_max, v_mean, first = self._window_stats(vals, starts, ends)
 
+        result = []
+        for i in range(starts.size):
             window_payload = {
-                'start': pd.Timestamp(ts_start).isoformat() if hasattr(pd.Timestamp(ts_start), 'isoformat') else str(ts_start),
-                'end': pd.Timestamp(ts_end).isoformat() if hasattr(pd.Timestamp(ts_end), 'isoformat') else str(ts_end),
-                'durationSec': duration_sec,
-                'points': int(e_i - s_i + 1),
+                'start': pd.Timestamp(start_ts[i]).isoformat(),
+                'end': pd.Timestamp(end_ts[i]).isoformat(),
+                'durationSec': float(durations[i]),
+                'points': int(ends[i] - starts[i] + 1),
                 'metric': metric
             }
 
             # Attach direction / min / max / mean / delta_abs when we have metric values
             if vals is not None:
-                try:
-                    # Use a simple pre-window baseline from previous points
-                    k = int(getattr(self, 'baseline_window', 5))
-                except Exception:
-                    k = 5
-                pre_start = max(0, s_i - k)
-                pre_vals = vals.iloc[pre_start:s_i]
-                if pre_vals.notna().any():
-                    baseline_value = float(pre_vals.median())
-                else:
-                    cur_val = vals.iloc[s_i] if s_i < len(vals) else np.nan
-                    baseline_value = float(cur_val) if not np.isnan(cur_val) else None
-                win_vals = vals.iloc[s_i:e_i + 1]
-                summary = self._summarize_anomaly_window(baseline_value, win_vals.tolist())
-                window_payload.update(summary)
+                baseline_value = None if np.isnan(baselines[i]) else float(baselines[i])
+                window_payload.update(self._window_summary(baseline_value, count[i], v_min[i], v_max[i], v_mean[i], first[i]))
 
             result.append(window_payload)
         return result
 
+    def _per_transaction_detectors(self) -> List[Any]:
+        return [d for d in self.anomaly_detectors if d.__class__.__name__ != 'MetricStabilityDetector']
+
+    def _detect_and_window_metric(self, g: pd.DataFrame, metric: str, detectors) -> Tuple[pd.Series, List[Dict[str, Any]]]:
+        """Detect anomalies of one metric of one transaction and extract its windows."""
+        g_idx = g.set_index('timestamp')
+        det_df = self._detect_group(g, metric, detectors)
+        # align detected flags back to group timestamps
+        flags = det_df.get(f'{metric}_anomaly_flag', pd.Series(False, index=det_df.index))
+        aligned_flags = flags.reindex(g_idx.index, method=None, fill_value=False).astype(bool)
+        g_idx = (g_idx[[metric]] if metric in g_idx.columns else g_idx[[]]).copy()
+        g_idx[f'{metric}_anomaly_flag'] = aligned_flags
+        windows = self._extract_anomaly_windows(g_idx, metric)
+        return aligned_flags, windows
+
+    def _map_per_transaction_tasks(self, func, tasks: List[Any]) -> List[Any]:
+        """
+        Run func over the per-transaction tasks, in parallel when per_txn_n_jobs > 1.
+
+        Threads are used instead of processes: the engine is not picklable and the
+        heavy parts (IsolationForest fitting, NumPy/pandas kernels) release the GIL.
+        Results are returned in task order.
+        """
+        try:
+            n_jobs = int(getattr(self, 'per_txn_n_jobs', 1))
+        except (TypeError, ValueError):
+            n_jobs = 1
+        n_jobs = max(1, min(n_jobs, len(tasks)))
+        if n_jobs == 1:
+            return [func(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="perforge-anomaly") as executor:
+            return list(executor.map(func, tasks))
+
     def detect_and_window_per_transaction(self, df_long_selected: pd.DataFrame, metrics: List[str] = None, txn_col: str = 'transaction') -> Dict[str, Any]:
         if df_long_selected is None or df_long_selected.empty:
             self.transaction_windows = {'by_txn': {}, 'annotated': df_long_selected}
@@ -954,21 +1231,25 @@ class AnomalyDetectionEngine:
                 metrics = ['rt_ms_median', 'rt_ms_avg', 'rt_ms_p90', 'error_rate', 'rps']
 
         m_present = [m for m in metrics if m in df.columns]
+        groups = [(txn, g.sort_values('timestamp').copy()) for txn, g in df.groupby(txn_col, dropna=True)]
+        detectors = self._per_transaction_detectors()
+
+        # Every (transaction, metric) pair is detected independently; results are
+        # collected in task order, so the output does not depend on n_jobs.
+        tasks = [(g, metric) for _, g in groups for metric in m_present]
+        results = iter(self._map_per_transaction_tasks(
+            lambda task: self._detect_and_window_metric(task[0], task[1], detectors),
+            tasks
+        ))
+
         by_txn = {}
         annotated_parts = []
-        for txn, g in df.groupby(txn_col, dropna=True):
-            g = g.sort_values('timestamp').copy()
+        for txn, g in groups:
             g_idx = g.set_index('timestamp')
             windows_by_metric = {}
             for metric in m_present:
-                det_df = self._detect_group(g, metric)
-                # align detected flags back to group timestamps
-                flags = det_df.get(f'{metric}_anomaly_flag', pd.Series(False, index=det_df.index))
-                # merge flags into g_idx
-                aligned_flags = flags.reindex(g_idx.index, method=None, fill_value=False)
-                aligned_flags = aligned_flags.astype(bool)
+                aligned_flags, windows = next(results)
                 g_idx[f'{metric}_anomaly_flag'] = aligned_flags
-                windows = self._extract_anomaly_windows(g_idx[[c for c in [metric, f'{metric}_anomaly_flag'] if c in g_idx.columns]], metric)
                 if windows:
                     windows_by_metric[metric] = windows
             by_txn[txn] = {'windows_by_metric': windows_by_metric}
@@ -979,54 +1260,47 @@ class AnomalyDetectionEngine:
 
     def _merge_windows_across_metrics(self, windows_by_metric: Dict[str, List[Dict[str, Any]]], sample_seconds: float, merge_gap_samples: int) -> List[Dict[str, Any]]:
         # Flatten windows across metrics
-        all_wins = []
+        metrics, directions, starts, ends = [], [], [], []
         for metric, wins in windows_by_metric.items():
             for w in wins:
-                try:
-                    s = pd.to_datetime(w['start'])
-                    e = pd.to_datetime(w['end'])
-                except Exception:
-                    s = pd.Timestamp(w['start'])
-                    e = pd.Timestamp(w['end'])
-                all_wins.append({
-                    'start': s,
-                    'end': e,
-                    'metric': metric,
-                    'direction': w.get('direction')
-                })
-        if not all_wins:
+                metrics.append(metric)
+                directions.append(w.get('direction'))
+                starts.append(w['start'])
+                ends.append(w['end'])
+        if not metrics:
             return []
-        all_wins.sort(key=lambda x: x['start'])
+        try:
+            start_ts = pd.DatetimeIndex(pd.to_datetime(starts))
+            end_ts = pd.DatetimeIndex(pd.to_datetime(ends))
+        except (TypeError, ValueError):
+            # Mixed timezones: compare on UTC
+            start_ts = pd.DatetimeIndex(pd.to_datetime(starts, utc=True))
+            end_ts = pd.DatetimeIndex(pd.to_datetime(ends, utc=True))
+        start_ns = start_ts.asi8
+        end_ns = end_ts.asi8
+
+        # A window opens a new cluster when it starts more than tol seconds after
+        # the furthest end of the windows before it
+        order = np.argsort(start_ns, kind='stable')
         tol = float(max(0, merge_gap_samples)) * float(sample_seconds)
+        furthest_end = np.maximum.accumulate(end_ns[order])
+        new_cluster = np.concatenate(([True], (start_ns[order][1:] - furthest_end[:-1]) / 1e9 > tol))
+
         merged = []
-        # maintain current cluster
         cur = None
-        for w in all_wins:
-            if cur is None:
-                cur = {
-                    'start': w['start'],
-                    'end': w['end'],
-                    'metrics': {w['metric']: {'count': 1, 'direction': w.get('direction')}}
-                }
-                continue
-            gap_sec = (w['start'] - cur['end']).total_seconds()
-            if gap_sec <= tol and (w['start'] <= cur['end'] or gap_sec <= tol):
-                # extend cluster
-                if w['end'] > cur['end']:
-                    cur['end'] = w['end']
-                entry = cur['metrics'].setdefault(w['metric'], {'count': 0, 'direction': None})
-                entry['count'] += 1
-                if w.get('direction') is not None:
-                    entry['direction'] = w.get('direction')
-            else:
+        cur_end_ns = None
+        for i, is_new in zip(order, new_cluster):
+            if is_new:
+                cur = {'start': start_ts[i], 'end': end_ts[i], 'metrics': {}}
+                cur_end_ns = end_ns[i]
                 merged.append(cur)
-                cur = {
-                    'start': w['start'],
-                    'end': w['end'],
-                    'metrics': {w['metric']: {'count': 1, 'direction': w.get('direction')}}
-                }
-        if cur is not None:
-            merged.append(cur)
+            elif end_ns[i] > cur_end_ns:
+                cur['end'] = end_ts[i]
+                cur_end_ns = end_ns[i]
+            entry = cur['metrics'].setdefault(metrics[i], {'count': 0, 'direction': None})
+            entry['count'] += 1
+            if directions[i] is not None:
+                entry['direction'] = directions[i]
         return merged
 
     def _severity_label(self, score: float) -> str:
@@ -1050,31 +1324,27 @@ class AnomalyDetectionEngine:
         by_txn = transaction_windows['by_txn']
         merged_by_txn: Dict[str, Any] = {}
         events: List[Dict[str, Any]] = []
+        txn_series = self._transaction_series(annotated, txn_col)
         # per transaction processing
         for txn, data in by_txn.items():
-            g = annotated[annotated[txn_col] == txn].copy()
-            g = g.sort_values('timestamp')
-            g_idx = g.set_index('timestamp')
-            # derive sample seconds from index
-            try:
-                diffs = g_idx.index.to_series().diff().dropna().dt.total_seconds()
-                sample_seconds = float(diffs.median()) if len(diffs) else 5.0
-            except Exception:
-                sample_seconds = 5.0
+            series = txn_series.get(txn, {'ts': np.empty(0, dtype=np.int64), 'sample_seconds': 5.0})
             mg = int(getattr(self, 'merge_gap_samples', 1))
-            merged_windows = self._merge_windows_across_metrics(data.get('windows_by_metric', {}), sample_seconds, mg)
+            merged_windows = self._merge_windows_across_metrics(data.get('windows_by_metric', {}), series['sample_seconds'], mg)
             merged_by_txn[txn] = merged_windows
+            # mean rps of the transaction and overall within every merged window
+            starts_ns = np.array([w['start'].value for w in merged_windows], dtype=np.int64)
+            ends_ns = np.array([w['end'].value for w in merged_windows], dtype=np.int64)
+            means = {
+                col: self._window_means(series['ts'], series[col], starts_ns, ends_ns) if col in series else np.zeros(len(merged_windows))
+                for col in ('rps', 'overall_rps')
+            }
             # score each merged window
-            for w in merged_windows:
+            for i, w in enumerate(merged_windows):
                 w_start = w['start']
                 w_end = w['end']
                 # compute weight within window
-                try:
-                    slice_df = g_idx[(g_idx.index >= w_start) & (g_idx.index <= w_end)]
-                except Exception:
-                    slice_df = g_idx
-                mean_rps = float(pd.to_numeric(slice_df.get('rps'), errors='coerce').mean()) if 'rps' in slice_df.columns else 0.0
-                mean_overall = float(pd.to_numeric(slice_df.get('overall_rps'), errors='coerce').mean()) if 'overall_rps' in slice_df.columns else 0.0
+                mean_rps = float(means['rps'][i])
+                mean_overall = float(means['overall_rps'][i])
                 weight = (mean_rps / mean_overall) if (mean_overall and mean_overall > 0) else 0.0
                 # aggregate metric contributions for this window (names only)
                 metrics_list = []
@@ -1112,39 +1382,13 @@ class AnomalyDetectionEngine:
         col = f"{metric}_anomaly"
         if df_idx is None or df_idx.empty or col not in df_idx.columns:
             return []
-        flags = df_idx[col].apply(lambda v: isinstance(v, str) and 'Anomaly' in v and 'potential saturation point' not in str(v)).to_numpy()
+        flags = anomaly_flags.is_anomaly(df_idx[col])
         ts = df_idx.index.to_numpy()
         n = len(flags)
         if n == 0:
             return []
         max_gap = int(getattr(self, 'merge_gap_samples', 1))
-        windows = []
-        in_win = False
-        start_i = None
-        gap = 0
-        last_true_i = None
-        for i in range(n):
-            if flags[i]:
-                if not in_win:
-                    in_win = True
-                    start_i = i
-                    gap = 0
-                last_true_i = i
-                gap = 0
-            else:
-                if in_win:
-                    gap += 1
-                    if gap > max_gap:
-                        end_i = last_true_i if last_true_i is not None else i - 1
-                        if start_i is not None and end_i is not None and end_i >= start_i:
-                            windows.append((start_i, end_i))
-                        in_win = False
-                        start_i = None
-                        gap = 0
-        if in_win and start_i is not None:
-            end_i = last_true_i if last_true_i is not None else n - 1
-            if end_i >= start_i:
-                windows.append((start_i, end_i))
+        windows = zip(*self._flag_runs(flags, max_gap))
         result: List[Dict[str, Any]] = []
         for s_i, e_i in windows:
             ts_start = ts[s_i]
@@ -1171,6 +1415,25 @@ class AnomalyDetectionEngine:
         merged_by_txn = per_txn.get('by_txn', {}) if isinstance(per_txn, dict) else {}
         annotated_txn = per_txn.get('annotated') if isinstance(per_txn, dict) else None
         result_by_metric: Dict[str, Any] = {}
+        txn_series = self._transaction_series(annotated_txn, txn_col)
+
+        # Bounds of every transaction's clusters, converted once for all overall anomalies
+        txn_clusters: Dict[Any, Tuple[List[Any], np.ndarray, np.ndarray]] = {}
+        for txn, clusters in merged_by_txn.items():
+            kept, starts_ns, ends_ns = [], [], []
+            for c in clusters or []:
+                if c.get('start') is None or c.get('end') is None:
+                    continue
+                try:
+                    c_start_ts = pd.to_datetime(c.get('start'))
+                    c_end_ts = pd.to_datetime(c.get('end'))
+                except Exception:
+                    continue
+                kept.append((c, c_start_ts, c_end_ts))
+                starts_ns.append(c_start_ts.value)
+                ends_ns.append(c_end_ts.value)
+            if kept:
+                txn_clusters[txn] = (kept, np.array(starts_ns, dtype=np.int64), np.array(ends_ns, dtype=np.int64))
 
         # Initialise per-metric containers
         for m in overall_metrics:
@@ -1194,47 +1457,26 @@ class AnomalyDetectionEngine:
             if 'transactions' not in oa or oa['transactions'] is None:
                 oa['transactions'] = []
 
-            for txn, clusters in merged_by_txn.items():
-                if not clusters:
-                    continue
-                best_overlap = 0.0
-                best_metrics = None
-                best_window = None
-                for c in clusters:
-                    c_start = c.get('start')
-                    c_end = c.get('end')
-                    if c_start is None or c_end is None:
-                        continue
-                    try:
-                        c_start_ts = pd.to_datetime(c_start)
-                        c_end_ts = pd.to_datetime(c_end)
-                    except Exception:
-                        continue
-                    # overlap between overall anomaly window and txn cluster
-                    s = max(o_start_ts, c_start_ts)
-                    e = min(o_end_ts, c_end_ts)
-                    overlap = (e - s).total_seconds() if e > s else 0.0
-                    if overlap > best_overlap:
-                        best_overlap = overlap
-                        best_metrics = c.get('metrics', {})
-                        best_window = (s, e)
-                if best_overlap <= 0.0 or best_window is None:
+            for txn, (kept, c_starts_ns, c_ends_ns) in txn_clusters.items():
+                # overlap between overall anomaly window and every txn cluster; the first best one wins
+                overlaps = np.minimum(o_end_ts.value, c_ends_ns) - np.maximum(o_start_ts.value, c_starts_ns)
+                best = int(np.argmax(overlaps))
+                if overlaps[best] <= 0:
                     continue
+                c, c_start_ts, c_end_ts = kept[best]
+                best_overlap = float(overlaps[best]) / 1e9
+                best_metrics = c.get('metrics', {})
+                best_window = (max(o_start_ts, c_start_ts), min(o_end_ts, c_end_ts))
 
                 # Compute transaction share within the overlapping window
                 share = 0.0
-                if annotated_txn is not None and not annotated_txn.empty:
-                    g = annotated_txn[annotated_txn[txn_col] == txn].copy()
-                    if not g.empty:
-                        g_idx = g.set_index('timestamp')
-                        try:
-                            slice_df = g_idx[(g_idx.index >= best_window[0]) & (g_idx.index <= best_window[1])]
-                        except Exception:
-                            slice_df = g_idx
-                        mean_rps = float(pd.to_numeric(slice_df.get('rps'), errors='coerce').mean()) if 'rps' in slice_df.columns else 0.0
-                        mean_overall = float(pd.to_numeric(slice_df.get('overall_rps'), errors='coerce').mean()) if 'overall_rps' in slice_df.columns else 0.0
-                        if mean_overall and mean_overall > 0:
-                            share = mean_rps / mean_overall
+                series = txn_series.get(txn)
+                if series is not None:
+                    bounds = (np.array([best_window[0].value]), np.array([best_window[1].value]))
+                    mean_rps = float(self._window_means(series['ts'], series['rps'], *bounds)[0]) if 'rps' in series else 0.0
+                    mean_overall = float(self._window_means(series['ts'], series['overall_rps'], *bounds)[0]) if 'overall_rps' in series else 0.0
+                    if mean_overall and mean_overall > 0:
+                        share = mean_rps / mean_overall
 
                 # Choose anomaly direction from the best_metrics (if any)
                 direction = None
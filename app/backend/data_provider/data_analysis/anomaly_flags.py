@@ -0,0 +1,72 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Anomaly flags - bitmask encoding of the '<metric>_anomaly' columns.
+
+During detection every '<metric>_anomaly' column holds an integer bitmask with
+one bit per detection method that flagged the point (0 means normal). The
+human-readable labels ("Anomaly: isf, z_score") are rendered only once, when
+the final metrics are prepared.
+"""
+
+import threading
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+
+NORMAL_LABEL: str = 'Normal'
+SATURATION_METHOD: str = 'potential saturation point'
+
+# Bits of the known methods; methods of custom detectors get the next free bit
+_METHOD_BITS: Dict[str, int] = {
+    'isf': 1,
+    'z_score': 2,
+    SATURATION_METHOD: 4,
+}
+_lock = threading.Lock()
+
+
+def method_bit(method: str) -> int:
+    """Return the bit of a detection method, registering unknown methods."""
+    bit = _METHOD_BITS.get(method)
+    if bit is not None:
+        return bit
+    with _lock:
+        if method not in _METHOD_BITS:
+            _METHOD_BITS[method] = 1 << len(_METHOD_BITS)
+        return _METHOD_BITS[method]
+
+
+def as_mask(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Return an anomaly column as an int64 mask array (missing values are normal)."""
+    arr = pd.to_numeric(pd.Series(values), errors='coerce').fillna(0).to_numpy()
+    return arr.astype(np.int64)
+
+
+def is_anomaly(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Boolean array of points flagged by any method except the saturation point marker."""
+    return (as_mask(values) & ~method_bit(SATURATION_METHOD)) != 0
+
+
+def render_labels(values: pd.Series) -> pd.Series:
+    """Render an anomaly mask column as the 'Normal' / 'Anomaly: <methods>' labels."""
+    masks = pd.Series(as_mask(values), index=values.index)
+    methods = sorted(_METHOD_BITS.items(), key=lambda item: item[1])
+    labels = {}
+    for mask in masks.unique():
+        names = [name for name, bit in methods if mask & bit]
+        labels[mask] = f"Anomaly: {', '.join(names)}" if names else NORMAL_LABEL
+    return masks.map(labels)
@@ -15,14 +15,48 @@
 from .base import BaseDetector
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
-from typing import Literal
+from typing import List, Literal, Optional
 from app.backend.data_provider.data_analysis.constants import (
     COL_OVERALL_THROUGHPUT,
     COL_TXN_RPS,
 )
 
+
+class IsolationForestModel:
+    """
+    A fitted scaler + Isolation Forest over a fixed list of features.
+
+    Used to fit one multivariate model and score many metrics with it, and
+    stored with joblib as a per-project baseline model.
+    """
+    def __init__(self, features: List[str], contamination: float):
+        self.features = list(features)
+        self.contamination = contamination
+        self.scaler = None
+        self.model = None
+
+    def fit(self, df: pd.DataFrame) -> 'IsolationForestModel':
+        # scikit-learn is imported on first use to keep app startup light
+        from sklearn.ensemble import IsolationForest
+        from sklearn.preprocessing import StandardScaler
+
+        rows = df[self.features].dropna()
+        if rows.empty:
+            raise ValueError("No complete rows to fit the Isolation Forest model")
+        self.scaler = StandardScaler()
+        self.model = IsolationForest(contamination=self.contamination, random_state=42)
+        self.model.fit(self.scaler.fit_transform(rows))
+        return self
+
+    def score(self, df: pd.DataFrame) -> pd.Series:
+        """Decision function of the rows of df that have all features (NaN elsewhere)."""
+        scores = pd.Series(np.nan, index=df.index)
+        rows = df[self.features].dropna()
+        if not rows.empty:
+            scores.loc[rows.index] = self.model.decision_function(self.scaler.transform(rows))
+        return scores
+
+
 class IsolationForestDetector(BaseDetector):
     """
     Anomaly detection using Isolation Forest algorithm.
@@ -56,24 +90,30 @@ class IsolationForestDetector(BaseDetector):
         """
         df = df.copy()
         median_value = df[metric].median()
+        values = df[metric].to_numpy(dtype=float)
 
-        for idx in df.index:
-            if df.at[idx, anomaly_column] == -1:
-                current_value = df.at[idx, metric]
-
-                # Handle zero or near-zero median to avoid division by zero
-                if abs(median_value) < 1e-9:
-                    # If median is zero, use absolute difference instead
-                    deviation = abs(current_value - median_value) / (threshold + 1e-9)
-                else:
-                    deviation = abs(current_value - median_value) / median_value
-
-                # If deviation is less than threshold, mark as normal
-                if deviation < threshold:
-                    df.at[idx, anomaly_column] = 1
+        # Handle zero or near-zero median to avoid division by zero:
+        # if median is zero, use absolute difference instead
+        if abs(median_value) < 1e-9:
+            deviation = np.abs(values - median_value) / (threshold + 1e-9)
+        else:
+            deviation = np.abs(values - median_value) / median_value
 
+        # Flagged points deviating less than threshold are marked as normal
+        flags = df[anomaly_column].to_numpy()
+        df[anomaly_column] = np.where((flags == -1) & (deviation < threshold), 1, flags)
         return df
 
+    def _get_shared_scores(self, engine, index: pd.Index) -> Optional[np.ndarray]:
+        """Scores of the engine's shared model for the given rows, if it covers all of them."""
+        shared = getattr(engine, 'isf_shared_scores', None)
+        if shared is None:
+            return None
+        scores = shared.reindex(index)
+        if scores.isna().any():
+            return None
+        return scores.to_numpy()
+
     def detect(self, df: pd.DataFrame, metric: str, engine) -> pd.DataFrame:
         """
         Detect anomalies in time series data using Isolation Forest.
@@ -102,24 +142,24 @@ class IsolationForestDetector(BaseDetector):
 
         available_features = [f for f in features if f in df.columns]
 
-        # If no expected features are available, return with default 'Normal' anomaly column
+        # If no expected features are available, return with a default normal (0) anomaly mask
         if not available_features:
             result = df.copy()
-            result[f'{metric}_anomaly'] = 'Normal'
+            result[f'{metric}_anomaly'] = 0
             return result
 
         # Separate rows: keep only rows that have no NaNs in the used features
         non_missing_rows = df.dropna(subset=available_features).copy()
         missing_rows = df[~df.index.isin(non_missing_rows.index)].copy()
         if not non_missing_rows.empty and (metric in non_missing_rows.columns):
-            # Prepare and normalize features for Isolation Forest
-            scaler = StandardScaler()
-            normalized_features = scaler.fit_transform(non_missing_rows[available_features])
-
-            # Train Isolation Forest and get anomaly scores
-            iso_forest = IsolationForest(contamination=engine.contamination, random_state=42)
-            iso_forest.fit(normalized_features)
-            anomaly_scores = iso_forest.decision_function(normalized_features)
+            # Overall metrics may be scored by the shared (or baseline) model fitted by the engine
+            shared_scores = None if per_txn_context else self._get_shared_scores(engine, non_missing_rows.index)
+            if shared_scores is not None:
+                anomaly_scores = shared_scores
+            else:
+                # Train Isolation Forest on this metric and get anomaly scores
+                iso_forest = IsolationForestModel(available_features, engine.contamination).fit(non_missing_rows)
+                anomaly_scores = iso_forest.score(non_missing_rows).to_numpy()
 
             # Convert scores to binary labels (-1: anomaly, 1: normal)
             non_missing_rows.loc[:, f'{metric}_anomaly_isf'] = np.where(anomaly_scores < engine.isf_threshold, -1, 1)
@@ -149,11 +189,11 @@ class IsolationForestDetector(BaseDetector):
         # Combine processed rows with missing rows and sort by index
         combined_df = pd.concat([non_missing_rows, missing_rows], axis=0).sort_index()
 
-        # Ensure anomaly column exists and default to 'Normal' where missing
+        # Ensure anomaly mask exists and default to normal (0) where missing
         if f'{metric}_anomaly' not in combined_df.columns:
-            combined_df[f'{metric}_anomaly'] = 'Normal'
+            combined_df[f'{metric}_anomaly'] = 0
         else:
-            combined_df.loc[:, f'{metric}_anomaly'] = combined_df.loc[:, f'{metric}_anomaly'].fillna('Normal')
+            combined_df[f'{metric}_anomaly'] = combined_df[f'{metric}_anomaly'].fillna(0).astype('int64')
 
         # Clean up temporary columns if present
         if f'{metric}_anomaly_isf' in combined_df.columns:
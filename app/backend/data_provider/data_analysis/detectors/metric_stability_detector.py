@@ -15,9 +15,7 @@
 from .base import BaseDetector
 import pandas as pd
 from typing import Literal
-from sklearn.linear_model import LinearRegression
 import numpy as np
-from scipy import stats
 from app.backend.data_provider.data_analysis.constants import OVERALL_METRIC_DISPLAY
 
 class MetricStabilityDetector(BaseDetector):
@@ -54,6 +52,8 @@ class MetricStabilityDetector(BaseDetector):
         Returns:
             Numpy array with outliers removed (|z-score| < threshold)
         """
+        from scipy import stats
+
         z_scores = stats.zscore(data)
         return data[np.abs(z_scores) < threshold]
 
@@ -147,6 +147,10 @@ class MetricStabilityDetector(BaseDetector):
             return df
 
         # Step 4: Perform linear regression for trend analysis
+        # (scikit-learn and SciPy are imported on first use to keep app startup light)
+        from sklearn.linear_model import LinearRegression
+        from scipy import stats
+
         X = np.arange(len(cleaned_data)).reshape(-1, 1)
         model = LinearRegression().fit(X, cleaned_data)
         slope = model.coef_[0]
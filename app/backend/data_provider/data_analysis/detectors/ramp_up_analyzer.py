@@ -14,6 +14,7 @@
 
 from .base import BaseDetector
 import pandas as pd
+from app.backend.data_provider.data_analysis import anomaly_flags
 from typing import Literal, Callable
 
 class RampUpPeriodAnalyzer(BaseDetector):
@@ -60,7 +61,7 @@ class RampUpPeriodAnalyzer(BaseDetector):
 
         anomaly_col = f'{metric}_anomaly'
         if anomaly_col not in df.columns:
-            df[anomaly_col] = 'Normal'
+            df[anomaly_col] = 0
 
         if df is not None:
             # Calculate rolling correlation between metric and base_metric (e.g., response time vs users)
@@ -103,7 +104,7 @@ class RampUpPeriodAnalyzer(BaseDetector):
                     description=f"Tipping point was reached at load of {str(int(tipping_point_rt[metric]))} requests per second according to throughput analysis.",
                     value=int(tipping_point_rt[metric])
                 )
-                df.loc[tipping_point_index, anomaly_col] = 'Anomaly: potential saturation point'
+                df.loc[tipping_point_index, anomaly_col] = anomaly_flags.method_bit(anomaly_flags.SATURATION_METHOD)
             else:
                 engine.add_output(
                     status='passed',
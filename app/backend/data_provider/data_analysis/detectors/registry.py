@@ -0,0 +1,81 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _build_ramp_up_analyzer(detector_class, engine):
+    return detector_class(
+        threshold_condition=lambda x: x < engine.rolling_correlation_threshold,
+        base_metric=engine.ramp_up_base_metric
+    )
+
+
+class DetectorRegistry:
+    """
+    Registry of anomaly detectors, keyed by the names used in the
+    'detectors_enabled' setting.
+
+    Detectors are registered by import path, so their modules (and the
+    libraries they use) are imported only when an engine creates them.
+    """
+
+    # Registry structure: {key: (import path "module:Class", factory or None)}
+    _detectors: Dict[str, Tuple[str, Optional[Callable]]] = {}
+
+    @classmethod
+    def register(cls, key: str, import_path: str, factory: Optional[Callable] = None) -> None:
+        """
+        Register a detector.
+
+        Args:
+            key: Name of the detector in the 'detectors_enabled' setting
+            import_path: "package.module:ClassName" of the detector class
+            factory: Optional callable(detector_class, engine) building the detector;
+                     by default the class is instantiated without arguments
+        """
+        cls._detectors[key] = (import_path, factory)
+
+    @classmethod
+    def get_registered_detectors(cls) -> List[str]:
+        return list(cls._detectors.keys())
+
+    @classmethod
+    def load_class(cls, key: str):
+        import_path, _ = cls._detectors[key]
+        module_name, class_name = import_path.split(':')
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @classmethod
+    def create(cls, key: str, engine) -> Any:
+        _, factory = cls._detectors[key]
+        detector_class = cls.load_class(key)
+        return factory(detector_class, engine) if factory else detector_class()
+
+    @classmethod
+    def create_enabled(cls, engine, keys: List[str]) -> List[Any]:
+        """Create the detectors of the given keys, in registry order."""
+        enabled = set(keys)
+        for key in enabled - set(cls._detectors):
+            logging.warning(f"Unknown anomaly detector '{key}' in settings, skipping")
+        return [cls.create(key, engine) for key in cls._detectors if key in enabled]
+
+
+_package = 'app.backend.data_provider.data_analysis.detectors'
+DetectorRegistry.register('isolation_forest', f'{_package}.isolation_forest_detector:IsolationForestDetector')
+DetectorRegistry.register('z_score', f'{_package}.zscore_detector:ZScoreDetector')
+DetectorRegistry.register('metric_stability', f'{_package}.metric_stability_detector:MetricStabilityDetector')
+DetectorRegistry.register('ramp_up', f'{_package}.ramp_up_analyzer:RampUpPeriodAnalyzer', factory=_build_ramp_up_analyzer)
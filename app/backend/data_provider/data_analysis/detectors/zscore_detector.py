@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .base import BaseDetector
+import numpy as np
 import pandas as pd
 from typing import Literal
 
@@ -47,13 +48,12 @@ class ZScoreDetector(BaseDetector):
             DataFrame with added median validation column
         """
         median = df[metric].median()
+        values = df[metric].to_numpy(dtype=float)
 
-        def is_anomaly(value):
-            # Calculate percentage difference from median
-            diff_percentage = abs(value - median) / median
-            return -1 if diff_percentage > threshold else 1
-
-        df[f'{metric}_median_valid'] = df[metric].apply(is_anomaly)
+        # Percentage difference from median (inf/NaN for a zero median, as before)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_percentage = np.abs(values - median) / median
+        df[f'{metric}_median_valid'] = np.where(diff_percentage > threshold, -1, 1)
         return df
 
     def detect(self, df: pd.DataFrame, metric: str, engine) -> pd.DataFrame:
@@ -93,8 +93,8 @@ class ZScoreDetector(BaseDetector):
 
         # Step 1: Z-Score calculation and anomaly detection
         df[f'{metric}_z_score'] = (df[metric] - df[metric].mean()) / df[metric].std()
-        df[f'{metric}_anomaly_z_score'] = df[f'{metric}_z_score'].apply(
-            lambda x: -1 if abs(x) > engine.z_score_threshold else 1
+        df[f'{metric}_anomaly_z_score'] = np.where(
+            np.abs(df[f'{metric}_z_score'].to_numpy()) > engine.z_score_threshold, -1, 1
         )
 
         # Step 2: Apply median-based validation
@@ -102,10 +102,9 @@ class ZScoreDetector(BaseDetector):
 
         # Step 3: Combine both detection methods
         # Point is anomalous only if both methods agree
-        df[f'{metric}_anomaly_z_score'] = df.apply(
-            lambda row: -1 if row[f'{metric}_anomaly_z_score'] == -1 and
-                            row[f'{metric}_median_valid'] == -1 else 1,
-            axis=1
+        df[f'{metric}_anomaly_z_score'] = np.where(
+            (df[f'{metric}_anomaly_z_score'].to_numpy() == -1) &
+            (df[f'{metric}_median_valid'].to_numpy() == -1), -1, 1
         )
 
         # Step 3.5: Apply contextual validator (20 before/after median, 15% of current metric)
@@ -0,0 +1,164 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adaptive resolution - keeps the number of points bounded for very long tests.
+
+Detectors get an aggregate-preserving resampling: the samples are grouped
+into equal time buckets and each metric is reduced with its own aggregate
+(mean for rates and response times, sum for counts, min for users so that a
+bucket which is still ramping up is not taken as fixed load). The bucket of
+every sample is kept in a ResolutionPlan, so anomaly flags and windows found
+on the buckets are mapped back to full-resolution timestamps.
+
+Charts get a shape-preserving selection of the original samples, either
+largest-triangle-three-buckets (LTTB) or the min and max of each bucket, so
+spikes stay visible at a fraction of the payload.
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Aggregates of the overall metrics when buckets are built; other columns use the mean
+DETECTION_AGGREGATES: Dict[str, str] = {
+    'overalUsers': 'min',
+    'overalErrors': 'sum',
+}
+
+
+class ResolutionPlan:
+    """Time buckets of a downsampled frame and their full-resolution samples."""
+
+    def __init__(self, full_index: pd.DatetimeIndex, codes: np.ndarray, bucket_seconds: float):
+        self.full_index = full_index
+        # Bucket number of every full-resolution sample (0..n_buckets-1, non-decreasing)
+        self.codes = codes
+        self.bucket_seconds = bucket_seconds
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        first = np.concatenate(([0], boundaries))
+        last = np.concatenate((boundaries - 1, [len(codes) - 1]))
+        # Buckets are labelled with their first sample, so labels are real timestamps
+        self.bucket_start = full_index[first]
+        self.bucket_end = full_index[last]
+
+    @property
+    def n_buckets(self) -> int:
+        return len(self.bucket_start)
+
+    @property
+    def sample_labels(self) -> pd.DatetimeIndex:
+        """Bucket label of every full-resolution sample."""
+        return self.bucket_start[self.codes]
+
+    def resample(self, df: pd.DataFrame, aggregates: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """Reduce a frame indexed like full_index to one row per bucket."""
+        aggregates = DETECTION_AGGREGATES if aggregates is None else aggregates
+        how = {col: aggregates.get(col, 'mean') for col in df.columns}
+        reduced = df.groupby(self.codes, sort=True).agg(how)
+        reduced.index = self.bucket_start[reduced.index.to_numpy()]
+        reduced.index.name = df.index.name
+        return reduced
+
+    def window_bounds(self, start, end) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Full-resolution bounds of a window between two bucket labels."""
+        start_pos = max(int(self.bucket_start.searchsorted(pd.Timestamp(start), side='right')) - 1, 0)
+        end_pos = max(int(self.bucket_start.searchsorted(pd.Timestamp(end), side='right')) - 1, 0)
+        return self.bucket_start[start_pos], self.bucket_end[end_pos]
+
+
+def plan_resolution(index: pd.DatetimeIndex, max_points: int) -> Optional[ResolutionPlan]:
+    """
+    Build the buckets that bring a sorted time index down to at most max_points
+    rows. Returns None when the index already fits (or max_points is 0).
+    """
+    n = len(index)
+    if max_points <= 0 or n <= max_points or n < 2:
+        return None
+    elapsed = (index - index[0]).total_seconds().to_numpy()
+    span = float(elapsed[-1])
+    if span <= 0:
+        return None
+    # Bucket width is a whole multiple of the sampling step, so buckets hold equal sample counts
+    step = float(np.median(np.diff(elapsed))) or 1.0
+    bucket_seconds = math.ceil(span / max(max_points - 1, 1) / step) * step
+    raw_codes = np.floor(elapsed / bucket_seconds).astype(np.int64)
+    # Empty buckets (gaps in the data) are dropped
+    _, codes = np.unique(raw_codes, return_inverse=True)
+    return ResolutionPlan(index, codes, bucket_seconds)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions of the points kept by largest-triangle-three-buckets."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        # Triangle area of (previous point, candidate, average of the next bucket), up to a factor
+        areas = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(np.argmax(areas))
+        selected[i + 1] = prev
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions of the first point and the min and max of each bucket (about n_out points)."""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    edges = np.linspace(0, n, max(n_out // 2, 1) + 1).astype(np.int64)
+    positions = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi > lo:
+            positions.append(lo + int(np.argmin(y[lo:hi])))
+            positions.append(lo + int(np.argmax(y[lo:hi])))
+    return np.unique(positions)
+
+
+def select_chart_positions(df: pd.DataFrame, columns: Iterable[str], max_points: int, method: str = 'lttb',
+                           keep: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """
+    Row positions of a time-indexed frame to draw in charts.
+
+    Every column gets an equal share of max_points and the selections are
+    combined, so all series keep common timestamps. Rows marked in keep (e.g.
+    the first point of each anomaly run) are always included. Returns None
+    when the frame already fits.
+    """
+    n = len(df)
+    columns = [c for c in columns if c in df.columns]
+    if max_points <= 0 or n <= max_points or not columns:
+        return None
+    per_column = max(max_points // len(columns), 3)
+    x = (df.index - df.index[0]).total_seconds().to_numpy() if isinstance(df.index, pd.DatetimeIndex) else np.arange(n, dtype=float)
+    parts = []
+    for col in columns:
+        values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+        parts.append(minmax_indices(values, per_column) if method == 'minmax' else lttb_indices(x, values, per_column))
+    if keep is not None:
+        parts.append(np.flatnonzero(keep))
+    return np.unique(np.concatenate(parts))
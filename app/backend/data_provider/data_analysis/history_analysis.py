@@ -0,0 +1,388 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test History Analysis - regression detection across the runs of a test family.
+
+The summary vectors of the previous runs come from the test history index
+(DBTestSummaries), so no raw data is queried. A test family is the set of
+tests whose titles only differ by a trailing run identifier ("checkout_41",
+"checkout_42", ...). Over the latest runs of the family the analyzer reports:
+- trends: Theil-Sen slope and Kendall's tau per metric, e.g. p90 creep or
+  throughput decay;
+- changepoints: level shifts found with ruptures (PELT) over all metrics;
+- latest run: the change of the analyzed test against the median of the
+  runs before it.
+
+Runs of the family that are in the data source but not in the index yet
+(e.g. tests that finished before the index existed) are backfilled on demand:
+the analyzer collects the statistics of the missing runs within the analyzed
+window, newest first and at most history_backfill_max_tests per analysis.
+"""
+
+import re
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.backend.components.test_history.test_history_db import DBTestSummaries
+from app.backend.components.settings.settings_defaults import get_defaults_for_category
+from app.backend.components.settings.settings_service import SettingsService
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
+
+# Analyzed summary metrics and the direction of a regression
+HISTORY_METRICS: Dict[str, Dict[str, str]] = {
+    'throughput': {'name': 'Throughput', 'worse': 'decrease'},
+    'median': {'name': 'Median Response Time', 'worse': 'increase'},
+    'pct90': {'name': '90th Percentile Response Time', 'worse': 'increase'},
+    'errors_pct': {'name': 'Error Rate', 'worse': 'increase'},
+}
+
+# Minimum |Kendall's tau| for a change over the runs to be reported as a trend
+TREND_MIN_TAU = 0.3
+
+# Pairs of runs used by the Theil-Sen and Kendall estimates; longer histories use a fixed random sample of pairs
+TREND_MAX_PAIRS = 200_000
+
+_RUN_SUFFIX = re.compile(r'[\s_\-.:#/]*\d[\d\s_\-.:#/T]*$')
+
+
+def test_family(test_title: str) -> str:
+    """Family of a test: its title without the trailing run identifier (digits, dates)."""
+    family = _RUN_SUFFIX.sub('', test_title or '').strip()
+    return family or (test_title or '')
+
+
+class TestHistoryAnalyzer:
+    """Trend, changepoint and latest-run regression detection over a test family."""
+
+    def __init__(self, project_id: Optional[int] = None, params: Optional[Dict[str, Any]] = None):
+        self.project_id = project_id
+        settings = {key: config['value'] for key, config in get_defaults_for_category('ml_analysis').items()}
+        if project_id is not None:
+            try:
+                settings.update(SettingsService.get_project_settings(project_id, 'ml_analysis'))
+            except Exception as e:
+                logging.warning(f"Failed to load ML settings for project {project_id}, using defaults: {e}")
+        settings.update(params or {})
+        self.max_runs = int(settings.get('history_max_runs', 20))
+        self.min_runs = int(settings.get('history_min_runs', 5))
+        self.threshold_pct = float(settings.get('history_trend_threshold_pct', 10.0))
+        self.changepoint_penalty = float(settings.get('history_changepoint_penalty', 3.0))
+        self.backfill_max_tests = int(settings.get('history_backfill_max_tests', 20))
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+    def get_runs(self, data_provider, family: str, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Latest indexed runs of a family from the test history index, oldest first."""
+        scope = QueryResultCache.get_scope_of(data_provider.ds_obj)
+        if scope is None:
+            return []
+        source_id, bucket = scope
+        rows = DBTestSummaries.get_history(
+            project_id=data_provider.project,
+            source_type=data_provider.source_type,
+            source_id=source_id,
+            bucket=bucket,
+            title_prefix=family,
+            until=until
+        )
+        # The prefix also matches longer families ("checkout" and "checkout_heavy")
+        rows = [row for row in rows if test_family(row['test_title']) == family]
+        return rows[-self.max_runs:] if self.max_runs > 0 else rows
+
+    def backfill(self, data_provider, family: str, until: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Index the runs of a family that are in the data source but missing in the
+        test history index. Only the latest history_max_runs runs (started at or
+        before until) are considered; at most history_backfill_max_tests of them
+        are collected per call, newest first.
+
+        Returns the index coverage of that window: runs found in the data source,
+        runs backfilled now and runs still not indexed.
+        """
+        coverage = {'source_runs': 0, 'backfilled': 0, 'not_indexed': 0}
+        scope = QueryResultCache.get_scope_of(data_provider.ds_obj)
+        # Only backend tests are indexed
+        if scope is None or data_provider.test_type != "back_end":
+            return coverage
+        source_id, bucket = scope
+
+        titles = [title for title in data_provider.get_tests_titles(search=family) if test_family(title) == family]
+        if not titles:
+            return coverage
+        runs = []
+        for entry in data_provider.get_test_log(titles):
+            start_time = pd.to_datetime(entry.get('start_time'), utc=True, errors='coerce')
+            if pd.isna(start_time):
+                continue
+            start_time = start_time.to_pydatetime()
+            if until is None or start_time <= until:
+                runs.append((start_time, entry['test_title']))
+        runs.sort(reverse=True)
+        if self.max_runs > 0:
+            runs = runs[:self.max_runs]
+        coverage['source_runs'] = len(runs)
+
+        def missing_titles():
+            indexed = {
+                row['test_title'] for row in DBTestSummaries.get_history(
+                    project_id=data_provider.project,
+                    source_type=data_provider.source_type,
+                    source_id=source_id,
+                    bucket=bucket,
+                    title_prefix=family
+                )
+            }
+            return [title for _, title in runs if title not in indexed]
+
+        missing = missing_titles()
+        if not missing:
+            return coverage
+        for title in missing[:max(self.backfill_max_tests, 0)]:
+            try:
+                # Collecting the statistics of a backend test indexes its summary
+                data_provider.collect_test_obj(title)
+            except Exception as e:
+                logging.warning(f"Test history: could not backfill '{title}': {e}")
+        # Tests without throughput are collected but never indexed
+        coverage['not_indexed'] = len(missing_titles())
+        coverage['backfilled'] = len(missing) - coverage['not_indexed']
+        if coverage['backfilled']:
+            logging.info(f"Test history: backfilled {coverage['backfilled']} run(s) of '{family}'")
+        return coverage
+
+    def analyze_test(self, data_provider, test_title: str, family: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze the family of a test over the runs up to (and including) that test."""
+        family = family or test_family(test_title)
+        until = None
+        try:
+            bounds = data_provider.ds_obj.get_test_time_bounds(test_title=test_title)
+            until = datetime.fromtimestamp(float(bounds['start_time_timestamp']) / 1000, tz=timezone.utc)
+        except Exception as e:
+            logging.warning(f"Test history: could not get the start time of '{test_title}', using all runs: {e}")
+        coverage = None
+        if self.backfill_max_tests > 0:
+            try:
+                coverage = self.backfill(data_provider, family, until=until)
+            except Exception as e:
+                logging.warning(f"Test history: backfill of '{family}' failed: {e}")
+        runs = self.get_runs(data_provider, family, until=until)
+        result = self.analyze_runs(runs, family=family, test_title=test_title)
+        result['index'] = coverage
+        if coverage and coverage['not_indexed']:
+            result['summary'] += (
+                f"\n{coverage['not_indexed']} run(s) of '{family}' in the data source are not in the "
+                f"test history index and were not analyzed."
+            )
+        return result
+
+    # ------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------
+    def analyze_runs(self, runs: List[Dict[str, Any]], family: str = '', test_title: Optional[str] = None) -> Dict[str, Any]:
+        metrics = list(HISTORY_METRICS)
+        result: Dict[str, Any] = {
+            'family': family,
+            'test_title': test_title,
+            'runs': [self._run_payload(run) for run in runs],
+            'trends': {},
+            'changepoints': [],
+            'latest': {},
+            'regressions': [],
+            'status': 'insufficient_data',
+        }
+        if len(runs) < max(self.min_runs, 3):
+            result['summary'] = (
+                f"Test history: {len(runs)} indexed run(s) of '{family}', "
+                f"at least {max(self.min_runs, 3)} are needed for trend analysis."
+            )
+            return result
+
+        # Runs x metrics matrix; missing values are carried from the previous run
+        values = np.array([[np.nan if run.get(m) is None else float(run[m]) for m in metrics] for run in runs], dtype=float)
+        values = self._fill_missing(values)
+
+        result['trends'] = self._trends(values, metrics)
+        result['changepoints'] = self._changepoints(values, metrics, runs)
+        result['latest'] = self._latest(values, metrics)
+
+        regressions = []
+        for metric in metrics:
+            trend = result['trends'][metric]
+            if trend['status'] == 'regression':
+                regressions.append({'type': 'trend', 'metric': metric, 'change_pct': trend['change_pct']})
+            latest = result['latest'][metric]
+            if latest['status'] == 'regression':
+                regressions.append({'type': 'latest', 'metric': metric, 'change_pct': latest['change_pct']})
+        for changepoint in result['changepoints']:
+            for metric, shift in changepoint['shifts'].items():
+                if shift['status'] == 'regression':
+                    regressions.append({'type': 'changepoint', 'metric': metric, 'change_pct': shift['change_pct'], 'test_title': changepoint['test_title']})
+        result['regressions'] = regressions
+        result['status'] = 'regression' if regressions else 'stable'
+        result['summary'] = self._summary(result, len(runs))
+        return result
+
+    @staticmethod
+    def _run_payload(run: Dict[str, Any]) -> Dict[str, Any]:
+        start_time = run.get('start_time')
+        return {
+            'test_title': run.get('test_title'),
+            'start_time': start_time.isoformat() if hasattr(start_time, 'isoformat') else start_time,
+            'duration': run.get('duration'),
+            'vu': run.get('vu'),
+            **{metric: run.get(metric) for metric in HISTORY_METRICS},
+        }
+
+    @staticmethod
+    def _fill_missing(values: np.ndarray) -> np.ndarray:
+        values = values.copy()
+        for j in range(values.shape[1]):
+            column = values[:, j]
+            valid = ~np.isnan(column)
+            if not valid.any():
+                values[:, j] = 0.0
+                continue
+            # Forward-fill, then back-fill the leading gap
+            positions = np.where(valid, np.arange(len(column)), 0)
+            np.maximum.accumulate(positions, out=positions)
+            filled = column[positions]
+            filled[:np.argmax(valid)] = column[np.argmax(valid)]
+            values[:, j] = filled
+        return values
+
+    def _status(self, metric: str, change_pct: float, significant: bool = True) -> str:
+        if not significant or abs(change_pct) < self.threshold_pct:
+            return 'stable'
+        increase = change_pct > 0
+        worse = HISTORY_METRICS[metric]['worse'] == ('increase' if increase else 'decrease')
+        return 'regression' if worse else 'improvement'
+
+    @staticmethod
+    def _pct(change: np.ndarray, reference: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct = np.where(np.abs(reference) > 1e-12, change / np.abs(reference) * 100.0, 0.0)
+        return np.nan_to_num(pct)
+
+    def _trends(self, values: np.ndarray, metrics: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Theil-Sen slope and Kendall's tau of every metric over the run order."""
+        n = values.shape[0]
+        i, j = self._run_pairs(n)
+        diffs = values[j] - values[i]
+        slopes = np.median(diffs / (j - i)[:, None], axis=0)
+        signs = np.sign(diffs)
+        tau = signs.sum(axis=0) / len(i)
+        # Change of the robust fit between the first and the last run, relative to the first
+        intercepts = np.median(values - slopes * np.arange(n)[:, None], axis=0)
+        change_pct = self._pct(slopes * (n - 1), intercepts)
+        trends = {}
+        for k, metric in enumerate(metrics):
+            significant = abs(tau[k]) >= TREND_MIN_TAU
+            trends[metric] = {
+                'name': HISTORY_METRICS[metric]['name'],
+                'slope_per_run': float(slopes[k]),
+                'change_pct': round(float(change_pct[k]), 2),
+                'tau': round(float(tau[k]), 3),
+                'status': self._status(metric, float(change_pct[k]), significant),
+            }
+        return trends
+
+    @staticmethod
+    def _run_pairs(n: int):
+        """All pairs (i < j) of n runs, or a reproducible sample of TREND_MAX_PAIRS of them."""
+        if n * (n - 1) // 2 <= TREND_MAX_PAIRS:
+            return np.triu_indices(n, k=1)
+        rng = np.random.default_rng(0)
+        a = rng.integers(0, n, TREND_MAX_PAIRS)
+        b = rng.integers(0, n - 1, TREND_MAX_PAIRS)
+        b = b + (b >= a)
+        return np.minimum(a, b), np.maximum(a, b)
+
+    def _changepoints(self, values: np.ndarray, metrics: List[str], runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Level shifts over all metrics (PELT on the standardized runs).
+
+        KernelCPD with a linear kernel is the l2 cost of Pelt(model='l2') with
+        a compiled search, which keeps thousands of runs well under a second.
+        """
+        import ruptures as rpt
+
+        n = values.shape[0]
+        std = values.std(axis=0)
+        scaled = (values - values.mean(axis=0)) / np.where(std > 0, std, 1.0)
+        try:
+            breakpoints = rpt.KernelCPD(kernel='linear', min_size=2, jump=1).fit(scaled).predict(pen=self.changepoint_penalty * np.log(n))
+        except Exception as e:
+            logging.warning(f"Test history: changepoint detection failed: {e}")
+            return []
+
+        bounds = [0] + [int(b) for b in breakpoints]
+        changepoints = []
+        for k in range(1, len(bounds) - 1):
+            before = values[bounds[k - 1]:bounds[k]].mean(axis=0)
+            after = values[bounds[k]:bounds[k + 1]].mean(axis=0)
+            change_pct = self._pct(after - before, before)
+            shifts = {
+                metric: {
+                    'name': HISTORY_METRICS[metric]['name'],
+                    'before': float(before[m]),
+                    'after': float(after[m]),
+                    'change_pct': round(float(change_pct[m]), 2),
+                    'status': self._status(metric, float(change_pct[m])),
+                }
+                for m, metric in enumerate(metrics)
+            }
+            # Only shifts beyond the threshold are reported
+            shifts = {metric: shift for metric, shift in shifts.items() if shift['status'] != 'stable'}
+            if shifts:
+                run = self._run_payload(runs[bounds[k]])
+                changepoints.append({'index': bounds[k], 'test_title': run['test_title'], 'start_time': run['start_time'], 'shifts': shifts})
+        return changepoints
+
+    def _latest(self, values: np.ndarray, metrics: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Latest run against the median of the runs before it."""
+        reference = np.median(values[:-1], axis=0)
+        change_pct = self._pct(values[-1] - reference, reference)
+        return {
+            metric: {
+                'name': HISTORY_METRICS[metric]['name'],
+                'value': float(values[-1, k]),
+                'reference': float(reference[k]),
+                'change_pct': round(float(change_pct[k]), 2),
+                'status': self._status(metric, float(change_pct[k])),
+            }
+            for k, metric in enumerate(metrics)
+        }
+
+    @staticmethod
+    def _summary(result: Dict[str, Any], n_runs: int) -> str:
+        lines = [f"Test history of '{result['family']}' over the last {n_runs} runs:"]
+        for trend in result['trends'].values():
+            if trend['status'] != 'stable':
+                word = 'increased' if trend['change_pct'] > 0 else 'decreased'
+                lines.append(f"- {trend['name']} {word} by {abs(trend['change_pct']):.1f}% across the runs ({trend['status']}).")
+        for changepoint in result['changepoints']:
+            shifts = ", ".join(f"{s['name']} {s['change_pct']:+.1f}%" for s in changepoint['shifts'].values())
+            lines.append(f"- Level shift starting with run '{changepoint['test_title']}': {shifts}.")
+        for latest in result['latest'].values():
+            if latest['status'] != 'stable':
+                lines.append(f"- {latest['name']} of the latest run is {latest['change_pct']:+.1f}% against the median of the previous runs ({latest['status']}).")
+        if len(lines) == 1:
+            lines.append("- No trends, level shifts or regressions were detected.")
+        return "\n".join(lines)
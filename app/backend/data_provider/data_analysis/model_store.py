@@ -0,0 +1,91 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Baseline Model Store - per-project cache of fitted anomaly models.
+
+Models fitted on a reference (baseline) test are stored with joblib under
+app/data/ml_models/<project id>/ and kept in memory, so later tests are
+scored without refitting. The key covers everything the fit depends on
+(data source, reference test and its time range, features, parameters),
+so a changed reference test or setting simply leads to a new model.
+"""
+
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+
+class BaselineModelStore:
+    """Process-wide, file-backed store of fitted baseline models."""
+
+    models_dir = os.path.join('app', 'data', 'ml_models')
+    max_memory_entries = 32
+
+    _memory: Dict[Tuple[str, str], Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def make_key(cls, *parts: Any) -> str:
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _path(cls, project_id: Any, key: str) -> str:
+        return os.path.join(cls.models_dir, str(project_id), f"{key}.joblib")
+
+    @classmethod
+    def get_or_fit(cls, project_id: Any, key: str, fit: Callable[[], Any]) -> Any:
+        """Return the stored model of the key, fitting and storing it with fit() on a miss."""
+        import joblib
+
+        project_id = str(project_id)
+        with cls._lock:
+            model = cls._memory.get((project_id, key))
+        if model is not None:
+            return model
+
+        path = cls._path(project_id, key)
+        if os.path.exists(path):
+            try:
+                model = joblib.load(path)
+            except Exception as er:
+                logging.warning(f"BaselineModelStore: failed to load {path}, refitting: {er}")
+                model = None
+        if model is None:
+            model = fit()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                joblib.dump(model, tmp_path)
+                os.replace(tmp_path, path)
+            except Exception as er:
+                logging.warning(f"BaselineModelStore: failed to store {path}: {er}")
+
+        with cls._lock:
+            if len(cls._memory) >= cls.max_memory_entries:
+                cls._memory.pop(next(iter(cls._memory)))
+            cls._memory[(project_id, key)] = model
+        return model
+
+    @classmethod
+    def invalidate(cls, project_id: Any) -> None:
+        """Drop the stored models of a project."""
+        project_id = str(project_id)
+        with cls._lock:
+            for memory_key in [k for k in cls._memory if k[0] == project_id]:
+                del cls._memory[memory_key]
+        shutil.rmtree(os.path.join(cls.models_dir, str(project_id)), ignore_errors=True)
@@ -0,0 +1,302 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Streaming anomaly detection for tests that are still running.
+
+Each poll fetches only the samples after the test's watermark (the last
+processed timestamp) and feeds them one by one into per-metric state:
+running mean/variance (Welford) and a rolling median of the latest points.
+A sample is flagged with the same rules as the batch Z-Score detector
+(Z-Score and median deviation must agree, the contextual median filter may
+suppress it), except that only past samples are available as context.
+Flagged samples are merged into anomaly windows like in the batch engine.
+
+State is kept per test in the current process, so the cost of a poll is
+proportional to the new samples, not to the length of the test.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.backend.data_provider.data_analysis.anomaly_detection import AnomalyDetectionEngine
+from app.backend.data_provider.data_analysis.constants import COL_OVERALL_USERS
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
+
+
+class _RunningStats:
+    """Welford's online mean and variance."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def std(self) -> float:
+        # Sample standard deviation, as pandas' Series.std()
+        return float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else 0.0
+
+
+class _RollingMedian:
+    """Median of the last `size` values, kept in a sorted list."""
+
+    def __init__(self, size: int):
+        self._values = deque(maxlen=max(1, size))
+        self._sorted: List[float] = []
+
+    def update(self, value: float) -> None:
+        if len(self._values) == self._values.maxlen:
+            oldest = self._values[0]
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._values.append(value)
+        bisect.insort(self._sorted, value)
+
+    @property
+    def median(self) -> Optional[float]:
+        n = len(self._sorted)
+        if n == 0:
+            return None
+        mid = n // 2
+        return self._sorted[mid] if n % 2 else (self._sorted[mid - 1] + self._sorted[mid]) / 2.0
+
+
+class _MetricStream:
+    """Incremental detection state of one metric of a running test."""
+
+    def __init__(self, metric: str, name: str, engine: AnomalyDetectionEngine):
+        self.metric = metric
+        self.name = name
+        self.stats = _RunningStats()
+        self.context = _RollingMedian(int(getattr(engine, 'context_median_window', 10)))
+        self.windows: List[Dict[str, Any]] = []
+        self._open: Optional[Dict[str, Any]] = None
+        self._gap = 0
+
+    def process(self, timestamp: pd.Timestamp, value: float, engine: AnomalyDetectionEngine, warmup_points: int) -> bool:
+        """Classify one sample against the state built from the previous ones, then add it."""
+        flagged = False
+        median = self.context.median
+        if self.stats.count >= warmup_points and median is not None:
+            std = self.stats.std
+            z_flag = std > 0 and abs(value - self.stats.mean) / std > float(engine.z_score_threshold)
+            median_flag = median != 0 and abs(value - median) / abs(median) > float(engine.z_score_median_validation_threshold)
+            flagged = bool(z_flag and median_flag)
+            # Contextual filter: small deviations from the local median are noise
+            if flagged and getattr(engine, 'context_median_enabled', True):
+                pct = float(getattr(engine, 'context_median_pct', 0.15))
+                flagged = abs(value - median) > pct * max(abs(value), 1e-12)
+
+        self._update_windows(timestamp, value, median, flagged, int(getattr(engine, 'merge_gap_samples', 1)))
+        self.stats.update(value)
+        self.context.update(value)
+        return flagged
+
+    def _update_windows(self, timestamp: pd.Timestamp, value: float, baseline: Optional[float], flagged: bool, max_gap: int) -> None:
+        if flagged:
+            if self._open is None:
+                self._open = {
+                    'metric': self.metric,
+                    'name': self.name,
+                    'start': timestamp,
+                    'end': timestamp,
+                    'points': 0,
+                    'baseline': baseline,
+                    'min': value,
+                    'max': value,
+                }
+                self.windows.append(self._open)
+            window = self._open
+            window['end'] = timestamp
+            window['points'] += 1
+            window['min'] = min(window['min'], value)
+            window['max'] = max(window['max'], value)
+            self._gap = 0
+        elif self._open is not None:
+            self._gap += 1
+            if self._gap > max_gap:
+                self._open = None
+                self._gap = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'points': self.stats.count,
+            'mean': self.stats.mean,
+            'std': self.stats.std,
+            'median': self.context.median,
+        }
+
+    def windows_snapshot(self) -> List[Dict[str, Any]]:
+        result = []
+        for window in self.windows:
+            baseline = window['baseline'] if window['baseline'] is not None else window['min']
+            increase = (window['max'] - baseline) >= (baseline - window['min'])
+            result.append({
+                'metric': window['metric'],
+                'name': window['name'],
+                'start': window['start'].isoformat(),
+                'end': window['end'].isoformat(),
+                'points': window['points'],
+                'baseline': baseline,
+                'min': window['min'],
+                'max': window['max'],
+                'direction': 'increase' if increase else 'decrease',
+                'significant_value': window['max'] if increase else window['min'],
+                'open': window is self._open,
+            })
+        return result
+
+
+class _TestStream:
+    """Streaming state of one running test."""
+
+    def __init__(self, test_title: str, engine: AnomalyDetectionEngine):
+        self.test_title = test_title
+        self.engine = engine
+        self.watermark: Optional[pd.Timestamp] = None
+        self.last_users: Optional[float] = None
+        self.phase = 'ramp_up'
+        self.streams: Dict[str, _MetricStream] = {}
+        self.points = 0
+        self.polls = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class StreamingAnomalyDetector:
+    """Process-wide registry of streaming detection states, one per running test."""
+
+    # Samples a metric needs in the fixed-load phase before points are classified
+    warmup_points = 10
+    idle_timeout_seconds = 3600
+
+    _tests: Dict[Tuple[Any, ...], _TestStream] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def poll(cls, data_provider, test_title: str) -> Dict[str, Any]:
+        """
+        Process the samples of a running test recorded since the last poll
+        and return the current anomalies.
+        """
+        key = cls._key(data_provider, test_title)
+        state = cls._get_state(key, data_provider, test_title)
+        with state.lock:
+            state.last_used = time.monotonic()
+            start = cls._next_start(data_provider, test_title, state)
+            end = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            new_points = 0
+            try:
+                frame, standard_metrics = data_provider.get_overall_frame(test_title, start, end)
+            except ValueError:
+                # No samples in the new time range yet
+                frame, standard_metrics = None, {}
+            if frame is not None and not frame.empty:
+                new_points = cls._process_frame(state, frame, standard_metrics)
+            state.polls += 1
+            return cls._snapshot(state, new_points)
+
+    @classmethod
+    def reset(cls, data_provider, test_title: str) -> None:
+        with cls._lock:
+            cls._tests.pop(cls._key(data_provider, test_title), None)
+
+    @classmethod
+    def _key(cls, data_provider, test_title: str) -> Tuple[Any, ...]:
+        return (data_provider.project, data_provider.source_type, QueryResultCache.get_scope_of(data_provider.ds_obj), test_title)
+
+    @classmethod
+    def _get_state(cls, key: Tuple[Any, ...], data_provider, test_title: str) -> _TestStream:
+        with cls._lock:
+            now = time.monotonic()
+            for idle_key in [k for k, s in cls._tests.items() if now - s.last_used > cls.idle_timeout_seconds]:
+                del cls._tests[idle_key]
+            state = cls._tests.get(key)
+            if state is None:
+                engine = AnomalyDetectionEngine(params={}, project_id=data_provider.project)
+                state = cls._tests[key] = _TestStream(test_title, engine)
+            return state
+
+    @classmethod
+    def _next_start(cls, data_provider, test_title: str, state: _TestStream) -> str:
+        if state.watermark is None:
+            return data_provider.ds_obj.get_test_time_bounds(test_title=test_title)['start_time_iso']
+        watermark = state.watermark
+        watermark = watermark.tz_localize('UTC') if watermark.tzinfo is None else watermark.tz_convert('UTC')
+        # The query start is inclusive; already processed samples are skipped by timestamp
+        return watermark.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    @classmethod
+    def _process_frame(cls, state: _TestStream, frame: pd.DataFrame, standard_metrics: Dict[str, Dict[str, Any]]) -> int:
+        frame = frame.sort_index()
+        if state.watermark is not None:
+            frame = frame[frame.index > state.watermark]
+        # The newest sample may still be aggregating; it is processed by the next poll
+        frame = frame.iloc[:-1]
+        if frame.empty:
+            return 0
+
+        metrics = [m for m, config in standard_metrics.items() if config.get('analysis') and m in frame.columns]
+        for metric in metrics:
+            if metric not in state.streams:
+                state.streams[metric] = _MetricStream(metric, standard_metrics[metric].get('name', metric), state.engine)
+
+        users = frame[COL_OVERALL_USERS].to_numpy(dtype=float) if COL_OVERALL_USERS in frame.columns else None
+        values = {metric: frame[metric].to_numpy(dtype=float) for metric in metrics}
+        for i, timestamp in enumerate(frame.index):
+            # Like the batch engine, only the fixed-load phase (constant users) is analyzed
+            if users is not None:
+                stable = state.last_users is not None and users[i] == state.last_users
+                state.last_users = users[i]
+                state.phase = 'fixed_load' if stable else ('ramp_up' if state.phase == 'ramp_up' else 'load_change')
+                if not stable:
+                    continue
+            else:
+                state.phase = 'fixed_load'
+            for metric in metrics:
+                value = values[metric][i]
+                if not np.isnan(value):
+                    state.streams[metric].process(timestamp, float(value), state.engine, cls.warmup_points)
+        state.watermark = frame.index[-1]
+        state.points += len(frame)
+        return len(frame)
+
+    @classmethod
+    def _snapshot(cls, state: _TestStream, new_points: int) -> Dict[str, Any]:
+        anomalies = [w for stream in state.streams.values() for w in stream.windows_snapshot()]
+        anomalies.sort(key=lambda w: w['start'])
+        return {
+            'test_title': state.test_title,
+            'watermark': state.watermark.isoformat() if state.watermark is not None else None,
+            'phase': state.phase,
+            'points_processed': state.points,
+            'new_points': new_points,
+            'polls': state.polls,
+            'metrics': {metric: stream.snapshot() for metric, stream in state.streams.items()},
+            'anomalies': anomalies,
+        }
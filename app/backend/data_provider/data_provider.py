@@ -14,21 +14,26 @@
 
 # Standard library imports
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Tuple, Optional, Type
 import logging
 
 # Third-party imports
 import pandas as pd
 from datetime import datetime
 from dateutil import tz
+from flask import current_app, has_app_context
 
 # Local application imports
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_extraction import InfluxdbV2
 from app.backend.integrations.data_sources.influxdb_v1_8.influxdb_extraction_1_8 import InfluxdbV18
 from app.backend.data_provider.data_analysis.anomaly_detection import AnomalyDetectionEngine
 from app.backend.integrations.data_sources.base_extraction import DataExtractionBase
-from app.backend.data_provider.test_data import BaseTestData, BackendTestData, FrontendTestData, MetricsTable, TestDataFactory
+from app.backend.data_provider.test_data import BaseTestData, BackendTestData, FrontendTestData, MetricsTable, TestDataFactory, TestSnapshot, TestSnapshotStore
 from app.backend.data_provider.data_analysis.constants import METRIC_DISPLAY_NAMES
+from app.backend.components.settings.settings_service import SettingsService
+from app.backend.components.test_history.test_history_db import DBTestSummaries
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 
 class DataProvider:
     """
@@ -74,20 +79,14 @@ class DataProvider:
 
         # Apply bucket override (optional) in a source-type aware manner
         # For InfluxDB v2, bucket is used in Flux queries and does not affect the client.
-        # For InfluxDB 1.8, bucket corresponds to the database on the client.
+        # For InfluxDB 1.8, bucket corresponds to the database, which every query passes explicitly;
+        # the client itself is pooled per integration and must not be switched to another database.
         if bucket:
             try:
                 if source_type == "influxdb_v2":
                     # Simple override of the bucket used in queries
                     setattr(self.ds_obj, "bucket", bucket)
                 elif source_type == "influxdb_v1.8":
-                    # For classic InfluxDB 1.8, switch the active database on the existing client
-                    client = getattr(self.ds_obj, "influxdb_connection", None)
-                    if client is not None:
-                        try:
-                            client.switch_database(bucket)
-                        except Exception as er:
-                            logging.warning(f"DataProvider: failed to switch InfluxDB 1.8 database to '{bucket}': {er}")
                     setattr(self.ds_obj, "database", bucket)
                 else:
                     # Fallback: try to set a generic bucket attribute if present
@@ -165,21 +164,22 @@ class DataProvider:
         # Create appropriate test data object
         test_obj = TestDataFactory.create_test_data(effective_test_type)
 
+        # Start/end times in all formats come from a single bounds query (a test catalog lookup)
+        time_bounds = self.ds_obj.get_test_time_bounds(test_title=test_title)
+
+        # Finished tests analyzed before are restored from their snapshot without any further query
+        snapshot = self._load_test_snapshot(test_title, test_obj, time_bounds)
+        if snapshot is not None:
+            TestSnapshot.apply(test_obj, snapshot)
+            test_obj.data_provider = self
+            return test_obj
+
         # Set common data for all test types
         if hasattr(test_obj, 'test_title'):
             test_obj.set_metric('test_title', test_title)
-        if hasattr(test_obj, 'start_time_human'):
-            test_obj.set_metric('start_time_human', self.ds_obj.get_start_time(test_title=test_title, time_format='human'))
-        if hasattr(test_obj, 'end_time_human'):
-            test_obj.set_metric('end_time_human', self.ds_obj.get_end_time(test_title=test_title, time_format='human'))
-        if hasattr(test_obj, 'start_time_iso'):
-            test_obj.set_metric('start_time_iso', self.ds_obj.get_start_time(test_title=test_title, time_format='iso'))
-        if hasattr(test_obj, 'end_time_iso'):
-            test_obj.set_metric('end_time_iso', self.ds_obj.get_end_time(test_title=test_title, time_format='iso'))
-        if hasattr(test_obj, 'start_time_timestamp'):
-            test_obj.set_metric('start_time_timestamp', self.ds_obj.get_start_time(test_title=test_title, time_format='timestamp'))
-        if hasattr(test_obj, 'end_time_timestamp'):
-            test_obj.set_metric('end_time_timestamp', self.ds_obj.get_end_time(test_title=test_title, time_format='timestamp'))
+        for key, value in time_bounds.items():
+            if hasattr(test_obj, key):
+                test_obj.set_metric(key, value)
         # Calculate duration
         test_obj.calculate_duration()
 
@@ -190,6 +190,7 @@ class DataProvider:
         # Dispatch to specialized collection methods based on test type
         if effective_test_type == "back_end":
             self._collect_backend_test_data(test_obj)
+            self._index_test_summary(test_obj)
         elif effective_test_type == "front_end":
             self._collect_frontend_test_data(test_obj)
 
@@ -197,8 +198,72 @@ class DataProvider:
             for custom_var in self.ds_obj.custom_vars:
                 value = self.ds_obj.get_custom_var(test_title=test_title, custom_var=custom_var, start=test_obj.start_time_iso, end=test_obj.end_time_iso)
                 test_obj.append_metric("custom_vars", {"name": custom_var, "value": value})
+
+        test_obj._snapshot_dirty = True
+        self.save_test_snapshot(test_obj)
         return test_obj
 
+    def _test_snapshot_key(self) -> Optional[str]:
+        """
+        Settings key of the test snapshots of this data source, or None if
+        snapshots are disabled (they follow the 'query_cache_enabled' setting).
+        """
+        if not SettingsService.get_setting(self.project, 'data_query', 'query_cache_enabled', default=True):
+            return None
+        ml_settings = SettingsService.get_project_settings(self.project, 'ml_analysis')
+        return TestSnapshotStore.make_key(self.source_type, sorted(ml_settings.items()), self.ds_obj._query_context())
+
+    def _load_test_snapshot(self, test_title: str, test_obj: BaseTestData, time_bounds: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot of a test for the current settings, or None. A snapshot taken
+        with other time bounds (more data was written under the title since,
+        e.g. by a rerun) is ignored and replaced once the test is collected again.
+        """
+        scope = QueryResultCache.get_scope_of(self.ds_obj)
+        if scope is None or not has_app_context():
+            return None
+        try:
+            key = self._test_snapshot_key()
+            if key is None:
+                return None
+            snapshot = TestSnapshotStore.load(scope, test_title, key)
+        except Exception as e:
+            logging.warning(f"Failed to load the snapshot of test '{test_title}': {e}")
+            return None
+        if snapshot is None or snapshot.get('data_type') != test_obj.__class__.__name__:
+            return None
+        statistics = snapshot.get('statistics', {})
+        for key in ('start_time_timestamp', 'end_time_timestamp'):
+            if statistics.get(key) != time_bounds.get(key):
+                logging.info(f"The snapshot of test '{test_title}' is outdated ({key} changed), collecting the test again")
+                return None
+        return snapshot
+
+    def save_test_snapshot(self, test_obj: BaseTestData) -> None:
+        """
+        Persist what was computed for a test (statistics, loaded tables, ML
+        results) so later reports of the test skip the queries and the ML
+        analysis. Only finished tests are stored, and only when something new
+        was computed since the last save.
+        """
+        if not test_obj._snapshot_dirty:
+            return
+        scope = QueryResultCache.get_scope_of(self.ds_obj)
+        if scope is None or not has_app_context():
+            return
+        try:
+            # Same rule as the query cache: the test must have ended and settled
+            if self.ds_obj._query_cache_key('test_snapshot', {'test_title': test_obj.test_title, 'end': test_obj.end_time_iso}) is None:
+                return
+            key = self._test_snapshot_key()
+            if key is None:
+                return
+            snapshot = TestSnapshot.build(test_obj, chart_keys=self.initialize_metrics().keys())
+            TestSnapshotStore.save(scope, test_obj.test_title, key, snapshot)
+            test_obj._snapshot_dirty = False
+        except Exception as e:
+            logging.warning(f"Failed to store the snapshot of test '{test_obj.test_title}': {e}")
+
     def _collect_backend_test_data(self, test_obj: BackendTestData) -> None:
         """
         Collect data specific to backend tests
@@ -250,6 +315,38 @@ class DataProvider:
         test_obj.set_metric('errors_pct_stats', value)
 
 
+    def _index_test_summary(self, test_obj: BackendTestData) -> None:
+        """
+        Store the summary statistics of a test in the test history index used by
+        cross-test trend analysis. Tests without throughput (failed or empty
+        queries) are not indexed.
+        """
+        scope = QueryResultCache.get_scope_of(self.ds_obj)
+        if scope is None or not has_app_context():
+            return
+        try:
+            throughput = float(test_obj.median_throughput or 0)
+            if throughput <= 0 or not test_obj.start_time_timestamp or not test_obj.end_time_timestamp:
+                return
+            source_id, bucket = scope
+            DBTestSummaries.upsert(
+                project_id=self.project,
+                source_type=self.source_type,
+                source_id=source_id,
+                bucket=bucket,
+                test_title=test_obj.test_title,
+                start_time=datetime.fromtimestamp(float(test_obj.start_time_timestamp) / 1000, tz=tz.tzutc()),
+                end_time=datetime.fromtimestamp(float(test_obj.end_time_timestamp) / 1000, tz=tz.tzutc()),
+                duration=int(test_obj.duration) if test_obj.duration else None,
+                vu=test_obj.max_active_users,
+                throughput=throughput,
+                median=test_obj.median_response_time_stats,
+                pct90=test_obj.pct90_response_time_stats,
+                errors_pct=test_obj.errors_pct_stats
+            )
+        except Exception as e:
+            logging.warning(f"Failed to index the summary of test '{test_obj.test_title}': {e}")
+
     def _collect_frontend_test_data(self, test_obj: FrontendTestData) -> None:
         """
         Collect data specific to frontend tests
@@ -277,6 +374,50 @@ class DataProvider:
             "overalErrors": {"func": self.ds_obj.get_error_count, "name": "Errors", "analysis": False}
         }
 
+    # Concurrent query execution
+    def _get_query_concurrency(self) -> int:
+        """
+        Number of data source queries that may run at the same time.
+
+        The project setting is capped by the data source's own limit
+        (`max_query_concurrency`), so a source can opt out of parallel queries.
+        """
+        try:
+            configured = int(SettingsService.get_setting(self.project, 'data_query', 'max_concurrent_queries', default=6))
+        except Exception:
+            configured = 1
+        source_limit = getattr(self.ds_obj, 'max_query_concurrency', configured) or 1
+        return max(1, min(configured, source_limit))
+
+    def _run_queries(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent data source queries on a bounded thread pool.
+
+        Args:
+            tasks: Ordered mapping of task name to a zero-argument callable
+
+        Returns:
+            Dictionary of task name to result, in the same order as `tasks`.
+            If any task fails, the exception of the first failing task (in
+            `tasks` order) is raised, as a sequential loop would.
+        """
+        workers = min(self._get_query_concurrency(), len(tasks))
+        if workers <= 1:
+            return {name: func() for name, func in tasks.items()}
+
+        # Worker threads need the app context for settings and DB lookups
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def call(func: Callable[[], Any]) -> Any:
+            if app is None:
+                return func()
+            with app.app_context():
+                return func()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="perforge-query") as executor:
+            futures = {name: executor.submit(call, func) for name, func in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     # Data transformation methods
     def transform_to_json(self, result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -436,10 +577,38 @@ class DataProvider:
         return test_details
 
     def _get_test_results(self, test_obj: BaseTestData):
+        return self.get_overall_frame(test_obj.test_title, test_obj.start_time_iso, test_obj.end_time_iso)
+
+    def get_overall_frame(self, test_title: str, start: str, end: str) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+        """
+        Fetch the standard overall metrics of a test between start and end as one frame.
+
+        Returns:
+            Tuple of the merged DataFrame (one column per metric, rows with
+            missing values dropped) and the standard metrics configuration.
+        """
         standard_metrics = self.initialize_metrics()
 
-        # Fetch and merge the data for all standard metrics
-        dataframes = {metric: self.fetch_metric(metric, details["func"], test_obj.test_title, test_obj.start_time_iso, test_obj.end_time_iso) for metric, details in standard_metrics.items()}
+        def fetch(metric: str) -> Callable[[], pd.DataFrame]:
+            return lambda: self.fetch_metric(metric, standard_metrics[metric]["func"], test_title, start, end)
+
+        # Metrics covered by the combined overall query are fetched in one scan;
+        # the remaining metrics run alongside it
+        combined = set(getattr(self.ds_obj, "overall_timeseries_columns", ())) & set(standard_metrics)
+        tasks = {metric: fetch(metric) for metric in standard_metrics if metric not in combined}
+        if combined:
+            tasks["_overall"] = lambda: self.ds_obj.get_overall_timeseries(test_title=test_title, start=start, end=end)
+        results = self._run_queries(tasks)
+        overall_df = results.pop("_overall", None)
+
+        # Per-metric queries stay as the fallback for anything the combined query did not return
+        for metric in combined:
+            if overall_df is not None and metric in overall_df.columns:
+                results[metric] = overall_df[[metric]].dropna()
+        missing = [metric for metric in standard_metrics if metric not in results]
+        if missing:
+            results.update(self._run_queries({metric: fetch(metric) for metric in missing}))
+        dataframes = {metric: results[metric] for metric in standard_metrics}
 
         # NaN values to 0
         dataframes = {metric: self.df_nan_to_zero(df) for metric, df in dataframes.items()}
@@ -499,6 +668,11 @@ class DataProvider:
         if test_obj.ml_anomalies is not None:
             return test_obj.ml_metrics
 
+        # Results restored from a test snapshot need neither the data nor the detectors
+        if TestSnapshot.apply_ml(test_obj):
+            self.anomaly_detection_engine = None
+            return test_obj.ml_metrics
+
         merged_df, standard_metrics = self._get_test_results(test_obj=test_obj)
 
         ML_MIN_POINTS = 10
@@ -515,7 +689,10 @@ class DataProvider:
             test_obj.ml_summary = "ML analysis skipped: insufficient data points."
             test_obj.performance_status = "insufficient_data"
             test_obj.ml_metrics = self._build_chart_metrics_from_df(merged_df, standard_metrics)
+            test_obj.ml_anomaly_windows = []
             self.anomaly_detection_engine = None
+            test_obj._snapshot_dirty = True
+            self.save_test_snapshot(test_obj)
             return test_obj.ml_metrics
 
         # Initialize engine with detectors
@@ -533,6 +710,9 @@ class DataProvider:
             test_obj=test_obj
         )
 
+        test_obj.ml_detector_costs = self.anomaly_detection_engine.detector_costs
+        self.anomaly_detection_engine.log_detector_costs(test_obj.test_title)
+
         if is_fixed_load:
             test_obj.test_type = "fixed load"
         else:
@@ -546,7 +726,13 @@ class DataProvider:
         test_obj.ml_summary = ml_summary
         test_obj.performance_status = performance_status
         test_obj.ml_metrics = metrics
+        test_obj.ml_anomaly_windows = [
+            {"metric": oa.get("metric"), "start_time": oa.get("start_time"), "end_time": oa.get("end_time")}
+            for oa in (getattr(self.anomaly_detection_engine, "overall_anomalies", None) or [])
+        ]
 
+        test_obj._snapshot_dirty = True
+        self.save_test_snapshot(test_obj)
         return metrics
 
 
@@ -623,31 +809,29 @@ class DataProvider:
         # Collect overall anomaly windows from the anomaly detection engine for
         # visualization (e.g. shaded bands on charts).
         overall_anomaly_windows: Dict[str, List[Dict[str, str]]] = {}
-        engine = getattr(self, "anomaly_detection_engine", None)
-        if engine is not None:
-            overall_list = getattr(engine, "overall_anomalies", []) or []
-            for oa in overall_list:
-                metric = oa.get("metric")
-                start_time = oa.get("start_time")
-                end_time = oa.get("end_time")
-                if not metric or start_time is None or end_time is None:
-                    continue
-                try:
-                    start_iso = pd.to_datetime(start_time).isoformat()
-                except Exception:
-                    start_iso = str(start_time)
-                try:
-                    end_iso = pd.to_datetime(end_time).isoformat()
-                except Exception:
-                    end_iso = str(end_time)
-                overall_anomaly_windows.setdefault(metric, []).append(
-                    {"start": start_iso, "end": end_iso}
-                )
+        for oa in test_obj.ml_anomaly_windows or []:
+            metric = oa.get("metric")
+            start_time = oa.get("start_time")
+            end_time = oa.get("end_time")
+            if not metric or start_time is None or end_time is None:
+                continue
+            try:
+                start_iso = pd.to_datetime(start_time).isoformat()
+            except Exception:
+                start_iso = str(start_time)
+            try:
+                end_iso = pd.to_datetime(end_time).isoformat()
+            except Exception:
+                end_iso = str(end_time)
+            overall_anomaly_windows.setdefault(metric, []).append(
+                {"start": start_iso, "end": end_iso}
+            )
 
         # Collect per-transaction anomaly windows for transaction-level charts
         per_transaction_anomaly_windows = self._collect_per_transaction_anomaly_windows(test_obj)
 
         # Fetch additional response time per request data
+        self._prefetch_per_req_series(test_obj, ['rt_avg', 'rt_median', 'rt_p90', 'rps'], test_title, test_obj.start_time_iso, test_obj.end_time_iso)
         avgResponseTimePerReq = self._get_per_req_series(test_obj, 'rt_avg', test_title, test_obj.start_time_iso, test_obj.end_time_iso)
         metrics["avgResponseTimePerReq"] = self.transform_to_json(avgResponseTimePerReq)
 
@@ -667,7 +851,7 @@ class DataProvider:
             if metrics_table:
                 test_obj.aggregated_table = metrics_table.format_metrics()
 
-
+        self.save_test_snapshot(test_obj)
 
         # Collect the outputs
         statistics = self.get_statistics(test_title=test_title, test_obj=test_obj)
@@ -684,12 +868,42 @@ class DataProvider:
             per_transaction_anomaly_windows,
         )
 
+    # Per-request series keys and the matching columns of the long per-transaction frame
+    per_req_frame_columns: Dict[str, str] = {
+        'rps': 'rps',
+        'rt_avg': 'rt_avg',
+        'rt_median': 'rt_median',
+        'rt_p90': 'rt_p90',
+    }
+
+    def _get_per_transaction_frame(self, test_obj: BaseTestData, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """Long per-transaction frame from the combined query, cached on the test object (None if unsupported)."""
+        cache_key = ('per_txn_frame', start, end)
+        cache = getattr(test_obj, '_per_req_cache', None)
+        if cache is not None and cache_key in cache:
+            return cache[cache_key]
+        frame = self.ds_obj.get_per_transaction_metrics(test_title=test_title, start=start, end=end)
+        if cache is not None:
+            cache[cache_key] = frame
+        return frame
+
+    def _per_req_series_from_frame(self, frame: pd.DataFrame, column: str) -> List[Dict[str, Any]]:
+        data = frame[['timestamp', 'transaction', column]].dropna(subset=[column])
+        data = data.rename(columns={column: 'value'}).set_index('timestamp')
+        return [
+            {'transaction': transaction, 'data': group[['value']]}
+            for transaction, group in data.groupby('transaction', sort=False)
+        ]
+
     def _get_per_req_series(self, test_obj: BaseTestData, key: str, test_title: str, start: str, end: str):
         cache_key = (key, start, end)
         cache = getattr(test_obj, '_per_req_cache', None)
         if cache is not None and cache_key in cache:
             return cache[cache_key]
-        if key == 'rps':
+        frame = cache.get(('per_txn_frame', start, end)) if cache is not None else None
+        if frame is not None and key in self.per_req_frame_columns:
+            data = self._per_req_series_from_frame(frame, self.per_req_frame_columns[key])
+        elif key == 'rps':
             data = self.ds_obj.get_throughput_per_req(test_title=test_title, start=start, end=end)
         elif key == 'rt_avg':
             data = self.ds_obj.get_average_response_time_per_req(test_title=test_title, start=start, end=end)
@@ -703,6 +917,53 @@ class DataProvider:
             cache[cache_key] = data
         return data
 
+    def _prefetch_per_req_series(self, test_obj: BaseTestData, keys: List[str], test_title: str, start: str, end: str) -> None:
+        """
+        Make several per-request series available in the test object's per-request cache.
+
+        The combined per-transaction query serves all of them at once; sources
+        without it fetch the series concurrently, one query each.
+        """
+        cache = getattr(test_obj, '_per_req_cache', None)
+        if cache is None:
+            return
+        missing = [key for key in keys if (key, start, end) not in cache]
+        if not missing:
+            return
+        if self._get_per_transaction_frame(test_obj, test_title, start, end) is not None:
+            return
+        if len(missing) < 2:
+            return
+        self._run_queries({
+            key: (lambda key=key: self._get_per_req_series(test_obj, key, test_title, start, end))
+            for key in missing
+        })
+
+    def _get_per_transaction_raw_frame(self, test_obj: BaseTestData, test_title: str, start: str, end: str, keys: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Raw long frame (timestamp, transaction and one column per metric) at the
+        source granularity, from the combined query or assembled from the
+        per-request series when the source has no combined query.
+        """
+        frame = self._get_per_transaction_frame(test_obj, test_title, start, end)
+        if frame is not None:
+            return frame
+
+        self._prefetch_per_req_series(test_obj, keys, test_title, start, end)
+        parts = []
+        for key in keys:
+            column = self.per_req_frame_columns[key]
+            for entry in self._get_per_req_series(test_obj, key, test_title, start, end) or []:
+                df = entry.get('data')
+                if df is None or df.empty:
+                    continue
+                part = df[['value']].rename(columns={'value': column}).reset_index()
+                part['transaction'] = entry.get('transaction') or entry.get('name')
+                parts.append(part)
+        if not parts:
+            return None
+        return pd.concat(parts, axis=0, ignore_index=True)
+
     def build_per_transaction_long_frame(self, test_obj: BaseTestData, sampling_interval_sec: int = 5, per_txn_rt_metrics: list[str] | None = None) -> None:
         test_title = test_obj.test_title
         start = test_obj.start_time_iso
@@ -710,26 +971,32 @@ class DataProvider:
 
         if per_txn_rt_metrics is None:
             per_txn_rt_metrics = ['median', 'avg', 'p90']
-        rps_per_req = self._get_per_req_series(test_obj, 'rps', test_title, start, end)
-        rt_series = {}
-        if 'avg' in per_txn_rt_metrics:
-            rt_series['avg'] = self._get_per_req_series(test_obj, 'rt_avg', test_title, start, end)
-        if 'median' in per_txn_rt_metrics:
-            rt_series['median'] = self._get_per_req_series(test_obj, 'rt_median', test_title, start, end)
-        if 'p90' in per_txn_rt_metrics or 'pct90' in per_txn_rt_metrics:
-            rt_series['p90'] = self._get_per_req_series(test_obj, 'rt_p90', test_title, start, end)
-
-        # Build lookup by transaction
-        rps_map = {entry.get('transaction') or entry.get('name'): entry.get('data') for entry in (rps_per_req or [])}
-        rt_maps = {k: {e.get('transaction') or e.get('name'): e.get('data') for e in (v or [])} for k, v in rt_series.items()}
-        all_rt_txns = set().union(*[set(m.keys()) for m in rt_maps.values()]) if rt_maps else set()
-        all_txns = sorted(set(rps_map.keys()) | all_rt_txns)
-        if 'all' in all_txns:
-            all_txns.remove('all')
-        if not all_txns:
+        rt_columns = {'avg': 'rt_ms_avg', 'median': 'rt_ms_median', 'p90': 'rt_ms_p90', 'pct90': 'rt_ms_p90'}
+        rt_keys = {'avg': 'rt_avg', 'median': 'rt_median', 'p90': 'rt_p90', 'pct90': 'rt_p90'}
+        keys = ['rps'] + sorted({rt_keys[m] for m in per_txn_rt_metrics if m in rt_keys})
+
+        raw = self._get_per_transaction_raw_frame(test_obj, test_title, start, end, keys)
+        if raw is None or raw.empty:
             test_obj.per_txn_df_long = None
             return
 
+        # Source columns to long-frame columns; error_rate is kept when the source provides it
+        column_map = {'rps': 'rps'}
+        for metric in per_txn_rt_metrics:
+            if metric in rt_keys:
+                column_map[rt_keys[metric]] = rt_columns[metric]
+        if 'error_rate' in raw.columns and raw['error_rate'].notna().any():
+            column_map['error_rate'] = 'error_rate'
+        column_map = {src: dst for src, dst in column_map.items() if src in raw.columns}
+
+        raw = raw[raw['transaction'].notna() & (raw['transaction'] != 'all')]
+        raw = raw[['timestamp', 'transaction'] + list(column_map)].rename(columns=column_map)
+        metric_cols = list(column_map.values())
+        raw[metric_cols] = raw[metric_cols].apply(pd.to_numeric, errors='coerce')
+        raw = raw.dropna(subset=metric_cols, how='all')
+        if raw.empty:
+            test_obj.per_txn_df_long = None
+            return
 
         # Get project_id from test_obj's data_provider context
         # DataProvider.project is the project_id (integer)
@@ -741,31 +1008,19 @@ class DataProvider:
         fixed_start = fixed_index.min() if len(fixed_index) else None
         fixed_end = fixed_index.max() if len(fixed_index) else None
 
-        frames = []
+        # Resample every transaction in one groupby. Each metric is forward-filled
+        # only up to its own last observation, as if resampled on its own.
         rule = f"{int(sampling_interval_sec)}s"
-        for txn in all_txns:
-            df_rps = rps_map.get(txn)
-            parts = []
-            if df_rps is not None and not df_rps.empty:
-                sr = df_rps['value'].resample(rule).mean().ffill().rename('rps')
-                parts.append(sr)
-            for k, m in rt_maps.items():
-                df_rt = m.get(txn)
-                if df_rt is not None and not df_rt.empty:
-                    col = 'rt_ms_median' if k == 'median' else ('rt_ms_avg' if k == 'avg' else 'rt_ms_p90')
-                    sr = df_rt['value'].resample(rule).mean().ffill().rename(col)
-                    parts.append(sr)
-            if not parts:
-                continue
-            df = pd.concat(parts, axis=1)
-            df['transaction'] = txn
-            frames.append(df.reset_index().rename(columns={'index': 'timestamp'}))
-
-        if not frames:
-            test_obj.per_txn_df_long = None
-            return
-
-        long_df = pd.concat(frames, axis=0, ignore_index=True)
+        resampled = (
+            raw.set_index('timestamp')
+            .groupby('transaction')[metric_cols]
+            .resample(rule)
+            .mean()
+        )
+        by_txn = resampled.groupby(level='transaction')
+        in_range = by_txn.bfill().notna()
+        resampled = by_txn.ffill().where(in_range)
+        long_df = resampled.dropna(how='all').reset_index()
 
         # Normalize timestamps while preserving the data source timezone.
         # If the incoming timestamps are already timezone-aware (as provided
@@ -781,8 +1036,8 @@ class DataProvider:
             long_df['timestamp'] = pd.to_datetime(long_df['timestamp'], utc=True)
 
         if 'rps' in long_df.columns:
-            overall = long_df.groupby('timestamp')['rps'].sum(min_count=1).rename('overall_rps')
-            long_df = long_df.merge(overall.reset_index(), on='timestamp', how='left')
+            by_ts = long_df.groupby('timestamp')['rps']
+            long_df['overall_rps'] = by_ts.transform('sum').where(by_ts.transform('count') > 0)
         else:
             long_df['overall_rps'] = pd.NA
 
@@ -0,0 +1,186 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Graph Image Cache - content-addressed cache of rendered graph images.
+
+The same graph of a test is rendered for every template, every output
+(PDF, Confluence, SMTP, Azure Wiki) and every rerun. Images are stored under
+a hash of what fully determines them:
+
+- internal Plotly graphs: the figure JSON (chart spec and data) and the
+  image options, so an image is reused exactly when it would look the same
+- Grafana graphs: the final render URL, which holds the dashboard, panel,
+  size, variables and the time range of the test; only used for finished
+  tests, whose data no longer changes
+
+Images are kept in two tiers, both evicted least recently used first:
+
+- an in-process tier bounded by total image size
+- an on-disk tier under app/data/image_cache bounded by total file size
+"""
+
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import plotly
+import plotly.io as pio
+
+# Bump when the rendering pipeline changes the output of an unchanged figure
+IMAGE_CACHE_VERSION = 1
+
+
+class GraphImageCache:
+    """Two-tier (memory LRU + disk) cache of rendered graph images."""
+
+    cache_dir = os.path.join('app', 'data', 'image_cache')
+    file_suffix = '.img'
+
+    memory_max_bytes = 128 * 1024 * 1024
+    disk_max_bytes = 512 * 1024 * 1024
+
+    # Cache structure: {key: image}
+    _memory: "OrderedDict[str, bytes]" = OrderedDict()
+    _memory_bytes = 0
+    _lock = threading.RLock()
+
+    # Scanning the disk tier is not free; only check its size every few writes
+    disk_eviction_every = 50
+    _writes_since_eviction = 0
+
+    @classmethod
+    def make_key(cls, *parts: Any) -> str:
+        return hashlib.sha256(repr((IMAGE_CACHE_VERSION,) + parts).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def figure_key(cls, fig: Any, opts: Dict[str, Any]) -> str:
+        """Key of a Plotly figure rendered with kaleido options (format/width/height/scale)."""
+        # The stdlib engine keeps the JSON identical whether or not orjson is installed
+        spec = pio.to_json(fig, validate=False, engine='json')
+        return cls.make_key('plotly', plotly.__version__, spec, sorted(opts.items()))
+
+    @classmethod
+    def url_key(cls, url: str) -> str:
+        """Key of an image rendered by a remote service (e.g. a Grafana render URL)."""
+        return cls.make_key('url', url)
+
+    @classmethod
+    def _path(cls, key: str) -> str:
+        return os.path.join(cls.cache_dir, key[:2], f"{key}{cls.file_suffix}")
+
+    @classmethod
+    def get(cls, key: str) -> Optional[bytes]:
+        """Return a cached image, or None."""
+        with cls._lock:
+            image = cls._memory.get(key)
+            if image is not None:
+                cls._memory.move_to_end(key)
+                return image
+
+        path = cls._path(key)
+        try:
+            with open(path, 'rb') as f:
+                image = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as er:
+            logging.warning(f"GraphImageCache: failed to read {path}: {er}")
+            return None
+        if not image:
+            return None
+        cls._put_memory(key, image)
+        return image
+
+    @classmethod
+    def set(cls, key: str, image: bytes) -> None:
+        """Store an image in both tiers."""
+        if not image:
+            return
+        path = cls._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(image)
+            os.replace(tmp_path, path)
+        except Exception as er:
+            logging.warning(f"GraphImageCache: failed to write cache entry: {er}")
+        cls._put_memory(key, image)
+        with cls._lock:
+            cls._writes_since_eviction += 1
+            run_eviction = cls._writes_since_eviction >= cls.disk_eviction_every
+            if run_eviction:
+                cls._writes_since_eviction = 0
+        if run_eviction:
+            cls._evict_disk()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached image."""
+        with cls._lock:
+            cls._memory.clear()
+            cls._memory_bytes = 0
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
+
+    @classmethod
+    def _put_memory(cls, key: str, image: bytes) -> None:
+        size = len(image)
+        if size > cls.memory_max_bytes:
+            return
+        with cls._lock:
+            previous = cls._memory.pop(key, None)
+            if previous is not None:
+                cls._memory_bytes -= len(previous)
+            cls._memory[key] = image
+            cls._memory_bytes += size
+            while cls._memory and cls._memory_bytes > cls.memory_max_bytes:
+                _, evicted = cls._memory.popitem(last=False)
+                cls._memory_bytes -= len(evicted)
+
+    @classmethod
+    def _evict_disk(cls) -> None:
+        """Remove least recently used image files until the disk tier fits its budget."""
+        try:
+            files = []
+            total = 0
+            with os.scandir(cls.cache_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and entry.name.endswith(cls.file_suffix):
+                                stat = entry.stat()
+                                files.append((stat.st_mtime, stat.st_size, entry.path))
+                                total += stat.st_size
+            if total <= cls.disk_max_bytes:
+                return
+            for _, size, path in sorted(files):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= cls.disk_max_bytes:
+                    break
+        except FileNotFoundError:
+            return
+        except Exception as er:
+            logging.warning(f"GraphImageCache: disk eviction failed: {er}")
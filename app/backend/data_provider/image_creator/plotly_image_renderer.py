@@ -32,22 +32,25 @@ Requirements:
     - Windows: Download Chrome from https://www.google.com/chrome/
     - Linux: sudo apt-get install chromium-browser
 
-Note: This implementation includes retry logic for Windows subprocess cleanup issues.
+Note: Figures are rendered on the warm Chromium of KaleidoRenderPool (see
+render_pool.py); failed renders are retried once on a restarted browser.
+Images of figures rendered before are taken from GraphImageCache
+(see image_cache.py) instead.
 """
 from __future__ import annotations
 from typing import Any, Dict, List, Optional
 import re
 import os
 import logging
-import tempfile
-import time
 
 # Third-party
 import plotly.graph_objects as go
-import kaleido
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 
+from app.backend.data_provider.image_creator.image_cache import GraphImageCache
+from app.backend.data_provider.image_creator.render_pool import KaleidoRenderPool
+
 # --------------------------------------------------------------------------------------
 # Defaults matching frontend styling
 # --------------------------------------------------------------------------------------
@@ -98,9 +101,12 @@ class PlotlyImageRenderer:
         *,
         quiet_logs: bool = True,
         log_level: int = logging.WARNING,
+        use_cache: bool = True,
     ):
         self.styling: Dict[str, Any] = {**_DEFAULT_STYLING, **(styling or {})}
         self.layout_config: Dict[str, Any] = {**_DEFAULT_LAYOUT, **(layout_config or {})}
+        # Reuse images of identical figures (see GraphImageCache)
+        self.use_cache = use_cache
         # Reduce very chatty INFO logs from Kaleido/Choreographer by default
         if quiet_logs:
             self._configure_third_party_logging(log_level)
@@ -453,103 +459,41 @@ class PlotlyImageRenderer:
 
     def _save(self, fig: go.Figure, output_path: str, width: int, height: int, image_format: str) -> str:
         os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        # Retry logic for transient failures (especially Windows subprocess cleanup issues)
-        max_retries = 3
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                # Use higher pixel density by default for crisper images (no external config)
-                kaleido.write_fig_sync(
-                    fig,
-                    path=output_path,
-                    opts={"format": image_format, "width": width, "height": height, "scale": 3},
-                )
-                break  # Success
-            except RuntimeError as e:
-                last_error = e
-                error_msg = str(e)
-
-                # Handle subprocess cleanup errors (known issue on Windows)
-                if "browser subprocess" in error_msg.lower():
-                    # Check if file was actually created despite the error
-                    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                        logging.warning(
-                            f"Kaleido subprocess cleanup error (attempt {attempt + 1}), "
-                            "but image was saved successfully"
-                        )
-                        break  # Image created successfully despite cleanup error
-                    elif attempt < max_retries - 1:
-                        logging.warning(f"Kaleido subprocess error on attempt {attempt + 1}, retrying...")
-                        time.sleep(0.5)  # Brief delay before retry
-                        continue
-                raise  # Re-raise if not a known issue or last attempt
-            except Exception as e:
-                last_error = e
-                # Re-raise non-RuntimeError exceptions immediately
-                raise RuntimeError(
-                    "Failed to write image. Ensure 'kaleido' is installed and Chrome is available.\n"
-                    "Install Chrome: python -c 'import kaleido; kaleido.get_chrome_sync()'\n"
-                    f"Original error: {e}"
-                ) from e
-
-        # Verify file exists and has content
-        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
-            raise RuntimeError(
-                f"Image file was not created successfully at {output_path}. Last error: {last_error}"
-            )
-
+        data = self._to_image_bytes(fig, width=width, height=height, image_format=image_format)
+        with open(output_path, "wb") as f:
+            f.write(data)
         return output_path
 
+    @staticmethod
+    def _image_opts(width: int, height: int, image_format: str) -> Dict[str, Any]:
+        # Use higher pixel density by default for crisper images (no external config)
+        return {"format": image_format, "width": width, "height": height, "scale": 3}
+
     def _to_image_bytes(self, fig: go.Figure, *, width: int, height: int, image_format: str = "png") -> bytes:
-        tmp_path = None
+        return self._render_figures([(fig, self._image_opts(width, height, image_format))])[0]
+
+    def _render_figures(self, figures: List[tuple]) -> List[bytes]:
+        """Render (figure, options) pairs, in input order; only figures missing from the image cache are rendered."""
+        if not self.use_cache:
+            return self._render_uncached(figures)
+        keys = [GraphImageCache.figure_key(fig, opts) for fig, opts in figures]
+        images: List[Optional[bytes]] = [GraphImageCache.get(key) for key in keys]
+        missing = [i for i, image in enumerate(images) if image is None]
+        if missing:
+            # Identical figures in one batch are rendered once
+            unique: Dict[str, int] = {}
+            for i in missing:
+                unique.setdefault(keys[i], i)
+            rendered = dict(zip(unique, self._render_uncached([figures[i] for i in unique.values()])))
+            for key, image in rendered.items():
+                GraphImageCache.set(key, image)
+            for i in missing:
+                images[i] = rendered[keys[i]]
+        return images
+
+    def _render_uncached(self, figures: List[tuple]) -> List[bytes]:
         try:
-            # Use higher pixel density by default for crisper images (no external config)
-            suffix = f".{image_format}"
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                tmp_path = tmp.name
-
-            # Retry logic for transient failures (especially Windows subprocess cleanup issues)
-            max_retries = 3
-            last_error = None
-
-            for attempt in range(max_retries):
-                try:
-                    kaleido.write_fig_sync(
-                        fig,
-                        path=tmp_path,
-                        opts={"format": image_format, "width": width, "height": height, "scale": 3},
-                    )
-                    break  # Success
-                except RuntimeError as e:
-                    last_error = e
-                    error_msg = str(e)
-
-                    # Handle subprocess cleanup errors (known issue on Windows)
-                    if "browser subprocess" in error_msg.lower():
-                        # Check if file was actually created despite the error
-                        if os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0:
-                            logging.warning(
-                                f"Kaleido subprocess cleanup error (attempt {attempt + 1}), "
-                                "but image was generated successfully"
-                            )
-                            break  # Image created successfully despite cleanup error
-                        elif attempt < max_retries - 1:
-                            logging.warning(f"Kaleido subprocess error on attempt {attempt + 1}, retrying...")
-                            time.sleep(0.5)  # Brief delay before retry
-                            continue
-                    raise  # Re-raise if not a known issue or last attempt
-
-            # Verify file exists and has content
-            if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
-                raise RuntimeError(
-                    f"Image file was not created successfully. Last error: {last_error}"
-                )
-
-            with open(tmp_path, "rb") as f:
-                data = f.read()
-
+            images = KaleidoRenderPool.get().render_many(figures)
         except Exception as e:
             # Provide helpful guidance for common issues
             raise RuntimeError(
@@ -557,20 +501,29 @@ class PlotlyImageRenderer:
                 "Install Chrome: python -c 'import kaleido; kaleido.get_chrome_sync()'\n"
                 f"Original error: {e}"
             ) from e
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
-
-        return data
+        for image in images:
+            if not image:
+                raise RuntimeError("Image was not rendered successfully (empty output).")
+        return images
 
     # ----------------------------------------------------------------------------------
     # Public API - In-memory rendering methods
     # ----------------------------------------------------------------------------------
 
     def create_throughput_users_bytes(self, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 400, image_format: str = "png") -> bytes:
+        return self._to_image_bytes(self.throughput_users_figure(chart_data), width=width, height=height, image_format=image_format)
+
+    def create_response_time_bytes(self, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 400, image_format: str = "png") -> bytes:
+        return self._to_image_bytes(self.response_time_figure(chart_data), width=width, height=height, image_format=image_format)
+
+    def create_errors_bytes(self, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 320, image_format: str = "png") -> bytes:
+        return self._to_image_bytes(self.errors_figure(chart_data), width=width, height=height, image_format=image_format)
+
+    # ----------------------------------------------------------------------------------
+    # Figure builders (shared by the single and batch in-memory renderers)
+    # ----------------------------------------------------------------------------------
+
+    def throughput_users_figure(self, chart_data: Dict[str, Any]) -> go.Figure:
         timestamps = self._extract_timestamps(chart_data, "overalAvgResponseTime") or self._extract_timestamps(chart_data, "overalThroughput")
         throughput = self._extract_values(chart_data, "overalThroughput")
         users = self._extract_values(chart_data, "overalUsers")
@@ -587,9 +540,9 @@ class PlotlyImageRenderer:
             metrics=metrics,
             anomaly_windows=overall_windows,
         )
-        return self._to_image_bytes(fig, width=width, height=height, image_format=image_format)
+        return fig
 
-    def create_response_time_bytes(self, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 400, image_format: str = "png") -> bytes:
+    def response_time_figure(self, chart_data: Dict[str, Any]) -> go.Figure:
         timestamps = self._extract_timestamps(chart_data, "overalAvgResponseTime")
         avg_vals, avg_ano, avg_msgs = self._extract_series(chart_data, "overalAvgResponseTime")
         med_vals, med_ano, med_msgs = self._extract_series(chart_data, "overalMedianResponseTime")
@@ -611,9 +564,9 @@ class PlotlyImageRenderer:
             metrics=metrics,
             anomaly_windows=overall_windows_rt,
         )
-        return self._to_image_bytes(fig, width=width, height=height, image_format=image_format)
+        return fig
 
-    def create_errors_bytes(self, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 320, image_format: str = "png") -> bytes:
+    def errors_figure(self, chart_data: Dict[str, Any]) -> go.Figure:
         timestamps = self._extract_timestamps(chart_data, "overalErrors") or self._extract_timestamps(chart_data, "overalAvgResponseTime")
         err_vals = self._extract_values(chart_data, "overalErrors")
         metrics = [
@@ -626,7 +579,7 @@ class PlotlyImageRenderer:
             metrics=metrics,
             anomaly_windows=overall_windows,
         )
-        return self._to_image_bytes(fig, width=width, height=height, image_format=image_format)
+        return fig
 
     # ----------------------------------------------------------------------------------
     # Name-to-function mapping
@@ -654,6 +607,15 @@ class PlotlyImageRenderer:
             "errors": self.create_errors_bytes,
         }
 
+    def figure_map(self):
+        """Normalized name-to-figure-builder mapping, with the same keys as renderer_map()."""
+        return {
+            "throughput_and_users": self.throughput_users_figure,
+            "throughput_users": self.throughput_users_figure,
+            "response_time": self.response_time_figure,
+            "errors": self.errors_figure,
+        }
+
     def render_bytes_by_name(self, name: str, chart_data: Dict[str, Any], *, width: int = 1024, height: int = 400, image_format: str = "png") -> bytes:
         key = self._normalize_key(name)
         mapping = self.renderer_map()
@@ -665,6 +627,32 @@ class PlotlyImageRenderer:
             height = 320
         return func(chart_data, width=width, height=height, image_format=image_format)
 
+    def render_many_by_name(self, graphs: List[Dict[str, Any]], chart_data: Dict[str, Any], *, image_format: str = "png") -> List[bytes]:
+        """
+        Render several internal graphs of one test in a single batch.
+
+        Args:
+            graphs: Dicts with 'name' and optional 'width'/'height' (as in template graph data)
+            chart_data: Metrics dictionary shared by all graphs
+
+        Returns:
+            Image bytes of every graph, in input order
+        """
+        mapping = self.figure_map()
+        figures = []
+        for graph in graphs:
+            name = graph.get("name", "")
+            key = self._normalize_key(name)
+            build = mapping.get(key)
+            if not build:
+                raise KeyError(f"No internal renderer found for graph name '{name}' (normalized key '{key}').")
+            width = int(graph.get("width") or 1024)
+            height = int(graph.get("height") or 400)
+            if key == "errors" and height == 400:
+                height = 320
+            figures.append((build(chart_data), self._image_opts(width, height, image_format)))
+        return self._render_figures(figures)
+
     # ------------------------------- Extraction helpers -------------------------------
 
     def _extract_timestamps(self, chart_data: Dict[str, Any], key: str) -> List[datetime]:
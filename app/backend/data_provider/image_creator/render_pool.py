@@ -0,0 +1,232 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Kaleido render pool - a warm headless Chromium shared by all chart renders.
+
+Calling kaleido.write_fig_sync() without a server starts Chromium and loads
+the Plotly page for every single figure. The pool keeps one Kaleido browser
+per worker process, running on its own event loop thread, with one tab per
+render slot, so figures only pay the render itself:
+
+- bounded concurrency: at most `size` figures render at once (one per tab),
+  however many threads submit figures
+- health check: a browser whose process exited (or whose render failed) is
+  replaced before the next render
+- recycling: the browser is restarted after `max_renders` renders, so a long
+  running worker does not accumulate Chromium memory
+
+The pool starts on the first render and is re-created in forked processes.
+"""
+
+import os
+import atexit
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import kaleido
+
+# (figure, kaleido layout options such as format/width/height/scale)
+RenderRequest = Tuple[Any, Dict[str, Any]]
+
+
+def _render_settings() -> Dict[str, int]:
+    defaults = {'RENDER_POOL_SIZE': 2, 'RENDER_POOL_MAX_RENDERS': 200, 'RENDER_TIMEOUT': 90}
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            return {key: int(current_app.config.get(key, value)) for key, value in defaults.items()}
+    except Exception:
+        pass
+    return defaults
+
+
+class KaleidoRenderPool:
+    """Process-wide pool of warm Kaleido tabs."""
+
+    _instance: Optional["KaleidoRenderPool"] = None
+    _instance_lock = threading.Lock()
+
+    # Seconds to wait for Chromium to start
+    start_timeout = 60
+
+    def __init__(self, size: int = 2, max_renders: int = 200, timeout: int = 90):
+        self.size = max(1, int(size))
+        self.max_renders = max(0, int(max_renders))
+        self.timeout = timeout
+        self._pid = os.getpid()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._browser = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._healthy = False
+        self._renders = 0
+        self._in_flight = 0
+        self._state = threading.Condition()
+
+    @classmethod
+    def get(cls) -> "KaleidoRenderPool":
+        """The pool of the current process, created on first use."""
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._pid != os.getpid():
+                settings = _render_settings()
+                cls._instance = cls(
+                    size=settings['RENDER_POOL_SIZE'],
+                    max_renders=settings['RENDER_POOL_MAX_RENDERS'],
+                    timeout=settings['RENDER_TIMEOUT'],
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._instance_lock:
+            if cls._instance is not None and cls._instance._pid == os.getpid():
+                cls._instance.close()
+            cls._instance = None
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def render(self, fig: Any, opts: Dict[str, Any]) -> bytes:
+        return self.render_many([(fig, opts)])[0]
+
+    def render_many(self, figures: Sequence[RenderRequest]) -> List[bytes]:
+        """
+        Render figures concurrently on the warm tabs, in input order.
+
+        A figure whose render fails is retried once on a restarted browser;
+        the error of the retry is raised.
+        """
+        if not figures:
+            return []
+        results = self._run_batch(figures)
+        failed = [i for i, result in enumerate(results) if isinstance(result, BaseException)]
+        if failed:
+            logging.warning(f"KaleidoRenderPool: {len(failed)} of {len(figures)} renders failed, retrying on a new browser: {results[failed[0]]}")
+            retried = self._run_batch([figures[i] for i in failed])
+            for i, result in zip(failed, retried):
+                results[i] = result
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _run_batch(self, figures: Sequence[RenderRequest]) -> List[Any]:
+        """Render figures on the current browser; failed renders are returned as exceptions."""
+        loop, browser, slots = self._acquire(len(figures))
+        results: List[Any] = []
+        try:
+            futures: List[Future] = [
+                asyncio.run_coroutine_threadsafe(self._render(browser, slots, fig, opts), loop)
+                for fig, opts in figures
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as er:
+                    results.append(er)
+        finally:
+            failed = len(results) < len(figures) or any(isinstance(r, BaseException) for r in results)
+            self._release(len(figures), failed)
+        return results
+
+    async def _render(self, browser, slots: asyncio.Semaphore, fig: Any, opts: Dict[str, Any]) -> bytes:
+        async with slots:
+            # The timeout also covers waiting for a tab, which a failed render may never give back
+            return await asyncio.wait_for(browser.calc_fig(fig, opts=opts), self.timeout)
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle
+    # ------------------------------------------------------------------
+    def is_healthy(self) -> bool:
+        """Whether the browser is running and its last renders succeeded."""
+        if not self._healthy or self._browser is None or self._thread is None or not self._thread.is_alive():
+            return False
+        process = getattr(self._browser, 'subprocess', None)
+        return process is None or process.poll() is None
+
+    def _acquire(self, count: int):
+        with self._state:
+            needs_restart = not self.is_healthy() or (self.max_renders and self._renders >= self.max_renders)
+            if needs_restart:
+                # Renders already running finish on the current browser first
+                while self._in_flight:
+                    self._state.wait()
+                if not self.is_healthy() or (self.max_renders and self._renders >= self.max_renders):
+                    self._restart()
+            self._in_flight += count
+            return self._loop, self._browser, self._slots
+
+    def _release(self, count: int, failed: bool) -> None:
+        with self._state:
+            self._in_flight -= count
+            self._renders += count
+            if failed:
+                self._healthy = False
+            self._state.notify_all()
+
+    def _restart(self) -> None:
+        """Replace the browser (called with the state lock held and nothing in flight)."""
+        if self._browser is not None:
+            reason = "recycling" if self._healthy else "restarting"
+            logging.info(f"KaleidoRenderPool: {reason} the browser after {self._renders} renders")
+            self._close_browser()
+        if self._loop is None or self._thread is None or not self._thread.is_alive():
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="perforge-kaleido", daemon=True)
+            self._thread.start()
+        try:
+            self._browser, self._slots = asyncio.run_coroutine_threadsafe(self._open_browser(), self._loop).result(self.start_timeout)
+        except Exception as e:
+            self._browser = None
+            raise RuntimeError(
+                "Failed to start the Kaleido renderer. Ensure 'kaleido' is installed and Chrome is available.\n"
+                "Install Chrome: python -c 'import kaleido; kaleido.get_chrome_sync()'\n"
+                f"Original error: {e}"
+            ) from e
+        self._renders = 0
+        self._healthy = True
+
+    async def _open_browser(self):
+        browser = kaleido.Kaleido(n=self.size, timeout=self.timeout)
+        await browser.open()
+        # One render per tab at a time
+        return browser, asyncio.Semaphore(self.size)
+
+    def _close_browser(self) -> None:
+        browser, self._browser = self._browser, None
+        self._healthy = False
+        if browser is None or self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(browser.close(), self._loop).result(30)
+        except Exception as er:
+            logging.warning(f"KaleidoRenderPool: failed to close the browser: {er}")
+
+    def close(self) -> None:
+        """Close the browser and stop the event loop thread."""
+        with self._state:
+            self._close_browser()
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                if self._thread is not None:
+                    self._thread.join(timeout=10)
+                self._loop = None
+                self._thread = None
+
+
+atexit.register(KaleidoRenderPool.shutdown)
@@ -19,6 +19,7 @@ from .backend_test_data import BackendTestData
 from .frontend_test_data import FrontendTestData
 from .factory import TestDataFactory
 from .transaction_status import TransactionStatus, TransactionStatusTable, TransactionStatusConfig
+from .snapshot import TestSnapshot, TestSnapshotStore
 
 __all__ = [
     'Metric',
@@ -30,5 +31,7 @@ __all__ = [
     'TestDataFactory',
     'TransactionStatus',
     'TransactionStatusTable',
-    'TransactionStatusConfig'
+    'TransactionStatusConfig',
+    'TestSnapshot',
+    'TestSnapshotStore'
 ]
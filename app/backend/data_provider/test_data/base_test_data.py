@@ -43,6 +43,8 @@ class BaseTestData(ABC):
         'ml_summary',
         'ml_html_summary',
         'ml_anomalies',
+        'ml_detector_costs',
+        'ml_anomaly_windows',
         'custom_vars'
     }
 
@@ -66,6 +68,9 @@ class BaseTestData(ABC):
         self.ml_summary: Optional[str] = None
         self.ml_html_summary: Optional[str] = None
         self.ml_anomalies: Optional[Dict[str, Any]] = None
+        self.ml_detector_costs: Dict[str, Dict[str, float]] = {}
+        # Overall anomaly windows ({metric, start_time, end_time}) for chart shading
+        self.ml_anomaly_windows: List[Dict[str, Any]] = []
         self.custom_vars: List[Dict[str, Any]] = []
         self._per_req_cache = {}
 
@@ -76,6 +81,12 @@ class BaseTestData(ABC):
         # Format: {(table_name, aggregation): table_obj}
         self._loaded_tables = {}
 
+        # Snapshot state (see test_data/snapshot.py): raw table rows by (table_name, aggregation),
+        # ML results not restored yet, and whether anything new was computed since the last save
+        self._snapshot_tables: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._snapshot_ml: Optional[Dict[str, Any]] = None
+        self._snapshot_dirty = False
+
         # Data provider reference - will be set by DataProvider.collect_test_obj
         self.data_provider = None
 
@@ -251,6 +262,14 @@ class BaseTestData(ABC):
         if cache_key in self._loaded_tables:
             return self._loaded_tables[cache_key]
 
+        # Tables restored from a test snapshot are rebuilt without querying the data source
+        snapshot_data = self._snapshot_tables.get(cache_key)
+        if snapshot_data is not None:
+            table = MetricsTable(name=table_name, aggregation=aggregation)
+            table.set_metrics_from_data(snapshot_data, None)
+            self._loaded_tables[cache_key] = table
+            return table
+
         # Load the table if we have a data provider reference
         if self.data_provider:
             try:
@@ -271,6 +290,9 @@ class BaseTestData(ABC):
 
                     # Cache the table
                     self._loaded_tables[cache_key] = table
+                    if current_data:
+                        self._snapshot_tables[cache_key] = current_data
+                        self._snapshot_dirty = True
                     return table
 
             except Exception as e:
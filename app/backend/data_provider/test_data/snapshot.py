@@ -0,0 +1,201 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test snapshots - computed data of a finished test, persisted for later reports.
+
+A snapshot holds what is derived from the raw data of a test: the statistics,
+the raw rows of the loaded tables, and the ML results (summaries, anomalies,
+anomaly windows, per-transaction windows and the downsampled chart series).
+A test object hydrated from a snapshot needs neither data source queries nor
+the anomaly detectors.
+
+Snapshots are gzipped JSON files stored next to the query cache entries of
+the test (see QueryResultCache.test_dir), so deleting or re-uploading a test
+drops them together with the cached queries. The file name is the settings
+key, so changed analysis settings simply lead to a new snapshot.
+"""
+
+import os
+import glob
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
+from app.backend.data_provider.test_data.base_test_data import BaseTestData
+
+# Bump when the snapshot layout or the meaning of a stored field changes
+SNAPSHOT_VERSION = 1
+
+# Statistics collected by DataProvider.collect_test_obj
+SNAPSHOT_STATISTICS = (
+    'test_title',
+    'start_time_human',
+    'end_time_human',
+    'start_time_iso',
+    'end_time_iso',
+    'start_time_timestamp',
+    'end_time_timestamp',
+    'duration',
+    'max_active_users',
+    'median_throughput',
+    'median_response_time_stats',
+    'pct90_response_time_stats',
+    'errors_pct_stats',
+)
+
+# Results of DataProvider.get_ml_analysis_to_test_obj
+SNAPSHOT_ML_ATTRS = (
+    'test_type',
+    'performance_status',
+    'ml_summary',
+    'ml_html_summary',
+    'ml_anomalies',
+    'ml_detector_costs',
+    'ml_anomaly_windows',
+    'per_txn_windows',
+    'per_txn_events_raw',
+)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class TestSnapshot:
+    """Conversion between test data objects and snapshot dictionaries."""
+
+    @staticmethod
+    def build(test_obj: BaseTestData, chart_keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Snapshot of a test object.
+
+        Args:
+            test_obj: Collected test object
+            chart_keys: Keys of the ML chart series to keep; other entries added to
+                        ml_metrics by callers (per-request series) are not stored
+        """
+        snapshot: Dict[str, Any] = {
+            'version': SNAPSHOT_VERSION,
+            'data_type': test_obj.__class__.__name__,
+            'statistics': {key: getattr(test_obj, key) for key in SNAPSHOT_STATISTICS if hasattr(test_obj, key)},
+            'custom_vars': list(test_obj.custom_vars or []),
+            'tables': [
+                {'name': name, 'aggregation': aggregation, 'data': data}
+                for (name, aggregation), data in test_obj._snapshot_tables.items()
+            ],
+            'ml': test_obj._snapshot_ml,
+        }
+        if test_obj.ml_anomalies is not None:
+            chart_keys = set(chart_keys)
+            ml = {attr: getattr(test_obj, attr, None) for attr in SNAPSHOT_ML_ATTRS}
+            ml['ml_metrics'] = {key: value for key, value in (test_obj.ml_metrics or {}).items() if key in chart_keys}
+            # Window bounds are kept as strings, which consumers format exactly like timestamps
+            ml['ml_anomaly_windows'] = [
+                {'metric': window['metric'], 'start_time': str(window['start_time']), 'end_time': str(window['end_time'])}
+                for window in (test_obj.ml_anomaly_windows or [])
+            ]
+            snapshot['ml'] = ml
+        return snapshot
+
+    @staticmethod
+    def apply(test_obj: BaseTestData, snapshot: Dict[str, Any]) -> None:
+        """
+        Restore the statistics of a snapshot. Tables and ML results are kept
+        aside and restored when they are requested, like a fresh test object
+        loads them.
+        """
+        for key, value in snapshot.get('statistics', {}).items():
+            test_obj.set_metric(key, value)
+        test_obj.custom_vars = list(snapshot.get('custom_vars') or [])
+        test_obj._snapshot_tables = {
+            (table['name'], table['aggregation']): table['data']
+            for table in snapshot.get('tables', [])
+        }
+        test_obj._snapshot_ml = snapshot.get('ml')
+
+    @staticmethod
+    def apply_ml(test_obj: BaseTestData) -> bool:
+        """Restore the ML results kept aside by apply(); False if the snapshot has none."""
+        ml = getattr(test_obj, '_snapshot_ml', None)
+        if not ml:
+            return False
+        for attr in SNAPSHOT_ML_ATTRS:
+            if attr in ml and ml[attr] is not None:
+                setattr(test_obj, attr, ml[attr])
+        test_obj.ml_metrics = ml.get('ml_metrics') or {}
+        return True
+
+
+class TestSnapshotStore:
+    """File-backed store of test snapshots, one file per test and settings key."""
+
+    file_prefix = 'snapshot-'
+    file_suffix = '.json.gz'
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def make_key(cls, *parts: Any) -> str:
+        return hashlib.sha256(repr((SNAPSHOT_VERSION,) + parts).encode('utf-8')).hexdigest()[:32]
+
+    @classmethod
+    def _path(cls, scope: Tuple[Any, ...], test_title: str, key: str) -> str:
+        return os.path.join(QueryResultCache.test_dir(scope, test_title), f"{cls.file_prefix}{key}{cls.file_suffix}")
+
+    @classmethod
+    def load(cls, scope: Tuple[Any, ...], test_title: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the snapshot of a test for a settings key, or None if there is none."""
+        path = cls._path(scope, test_title, key)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as er:
+            logging.warning(f"TestSnapshotStore: failed to read {path}: {er}")
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    @classmethod
+    def save(cls, scope: Tuple[Any, ...], test_title: str, key: str, snapshot: Dict[str, Any]) -> None:
+        """Store the snapshot of a test, replacing snapshots made with other settings."""
+        path = cls._path(scope, test_title, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=5) as f:
+                json.dump(snapshot, f, default=_json_default, separators=(',', ':'))
+            with cls._lock:
+                os.replace(tmp_path, path)
+                for stale in glob.glob(os.path.join(os.path.dirname(path), f"{cls.file_prefix}*{cls.file_suffix}")):
+                    if stale != path:
+                        os.remove(stale)
+        except Exception as er:
+            logging.warning(f"TestSnapshotStore: failed to store {path}: {er}")
@@ -21,6 +21,7 @@ from lxml import etree
 from app.backend.integrations.integration                                  import Integration
 from app.backend.integrations.atlassian_confluence.atlassian_confluence_db import DBAtlassianConfluence
 from app.backend.components.secrets.secrets_db                             import DBSecrets
+from app.backend.integrations.http_transport                               import HttpTransport
 from atlassian                                                             import Confluence
 
 
@@ -50,14 +51,16 @@ class AtlassianConfluence(Integration):
                     url      = self.org_url,
                     username = self.email,
                     password = self.token,
-                    cloud    = True  # Optional but explicit
+                    cloud    = True,  # Optional but explicit
+                    session  = HttpTransport.session(self.org_url)
                 )
             else:
                 # Confluence Data Center/Server with Personal Access Token
                 self.confluence_auth = Confluence(
                     url   = self.org_url,
-                    token = self.token,
-                    cloud = False  # REQUIRED for PAT on Data Center/Server
+                    token   = self.token,
+                    cloud   = False,  # REQUIRED for PAT on Data Center/Server
+                    session = HttpTransport.session(self.org_url)
                 )
         else:
             logging.warning("There's no Confluence integration configured, or you're attempting to send a request from an unsupported location.")
@@ -20,6 +20,7 @@ import time
 from app.backend.integrations.integration                      import Integration
 from app.backend.integrations.atlassian_jira.atlassian_jira_db import DBAtlassianJira
 from app.backend.components.secrets.secrets_db                 import DBSecrets
+from app.backend.integrations.http_transport                   import HttpTransport
 from atlassian                                                 import Jira
 
 
@@ -49,12 +50,14 @@ class AtlassianJira(Integration):
                 self.jira_auth = Jira(
                     url      = self.org_url,
                     username = self.email,
-                    password = self.token
+                    password = self.token,
+                    session  = HttpTransport.session(self.org_url)
                 )
             elif self.token_type == "personal_access_token":
                 self.jira_auth = Jira(
-                    url   = self.org_url,
-                    token = self.token
+                    url     = self.org_url,
+                    token   = self.token,
+                    session = HttpTransport.session(self.org_url)
                 )
         else:
             logging.warning("There's no Jira integration configured, or you're attempting to send a request from an unsupported location.")
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
 import base64
 import logging
 import random
@@ -20,6 +19,7 @@ import traceback
 import time
 
 from app.backend.integrations.integration              import Integration
+from app.backend.integrations.http_transport           import HttpTransport
 from app.backend.integrations.azure_wiki.azure_wiki_db import DBAzureWiki
 from app.backend.components.secrets.secrets_db         import DBSecrets
 
@@ -52,6 +52,7 @@ class AzureWiki(Integration):
                     'Accept'       : 'application/json',
                     'Authorization': 'Basic ' + str(base64.b64encode(bytes(':'+ self.token, 'ascii')), 'ascii')
                 }
+            self.session = HttpTransport.session(self.org_url)
         else:
             logging.warning("There's no Azure integration configured, or you're attempting to send a request from an unsupported location.")
 
@@ -62,7 +63,7 @@ class AzureWiki(Integration):
         name = f'{name.replace(" ", "-")}.png'
         for _ in range(3):
             try:
-                response = requests.put(
+                response = self.session.put(
                 url = f'{self.org_url}/{self.azure_project_id}/_apis/wiki/wikis/{self.identifier}/attachments?name={name}&api-version=6.0', headers=self.azure_headers_attachments, data=image)
                 if response.status_code != 201:
                     name = str(random.randint(1,100)) + name
@@ -79,7 +80,7 @@ class AzureWiki(Integration):
     def put_page(self, path, page_content):
         wiki_api_url = f'{self.org_url}/{self.azure_project_id}/_apis/wiki/wikis/{self.identifier}/pages?path={path}&api-version=6.0'
         try:
-            response = requests.put(
+            response = self.session.put(
                 url=wiki_api_url, headers=self.azure_authorization_headers, json={ "content": page_content })
             return response
         except Exception as er:
@@ -91,7 +92,7 @@ class AzureWiki(Integration):
     def get_page(self, path):
         wiki_api_url = f'{self.org_url}/{self.azure_project_id}/_apis/wiki/wikis/{self.identifier}/pages?path={path}&api-version=6.0'
         try:
-            response = requests.get(url=wiki_api_url, headers=self.azure_authorization_headers)
+            response = self.session.get(url=wiki_api_url, headers=self.azure_authorization_headers)
             return response
         except Exception as er:
             logging.warning('ERROR: getting ETag failed')
@@ -17,6 +17,7 @@ import logging
 
 from app.config                  import db
 from app.backend.pydantic_models import AzureWikiModel
+from app.backend.config_cache    import cached_config, invalidates_config
 
 
 class DBAzureWiki(db.Model):
@@ -35,6 +36,7 @@ class DBAzureWiki(db.Model):
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
 
     @classmethod
+    @invalidates_config
     def save(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -55,6 +57,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_configs(cls, project_id):
         try:
             query = db.session.query(cls).filter_by(project_id=project_id).all()
@@ -66,6 +69,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_id(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
@@ -79,6 +83,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_default_config(cls, project_id, current_config_id=None):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, is_default=True).one_or_none()
@@ -92,6 +97,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def reset_default_config(cls, project_id):
         try:
             db.session.query(cls).filter_by(project_id=project_id).update({cls.is_default: False})
@@ -102,6 +108,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def update(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -131,6 +138,7 @@ class DBAzureWiki(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def delete(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import logging
+import threading
 import pandas as pd
 
 from app.backend.errors import ErrorMessages
+from app.backend.components.settings.settings_service import SettingsService
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from functools import wraps
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 
 def validate_output(expected_keys: set):
@@ -31,7 +35,7 @@ def validate_output(expected_keys: set):
                 record_keys = set(record.keys())
                 if not expected_keys.issubset(record_keys):
                     logging.warning(ErrorMessages.ER00055.value.format(expected_keys))
-                    return []
+                    return self._query_failed([])
             return result
         return wrapper
     return decorator
@@ -122,6 +126,53 @@ def validate_float_output(func: Callable):
         return result
     return wrapper
 
+# Number of failed queries of the current thread (see DataExtractionBase._query_failed)
+_query_failures = threading.local()
+
+def _query_failure_count() -> int:
+    return getattr(_query_failures, 'count', 0)
+
+def cached_query(func: Callable):
+    """
+    Read-through QueryResultCache for get_* methods taking (test_title, start, end, ...).
+    Only queries of finished tests are cached (see DataExtractionBase._query_cache_key),
+    and only if no query failed while the result was produced.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            cache_key = self._query_cache_key(func.__name__, arguments)
+        except Exception as er:
+            logging.debug(f"Query cache skipped for {func.__name__}: {er}")
+            cache_key = None
+        if cache_key is None:
+            return func(self, *args, **kwargs)
+
+        scope, test_title, query_key = cache_key
+        found, value = QueryResultCache.get(scope, test_title, query_key)
+        if found:
+            return _copy_cached_result(value)
+        failures = _query_failure_count()
+        result = func(self, *args, **kwargs)
+        if _query_failure_count() == failures and QueryResultCache.is_cacheable(result):
+            QueryResultCache.set(scope, test_title, query_key, result)
+            return _copy_cached_result(result)
+        return result
+    return wrapper
+
+def _copy_cached_result(value: Any) -> Any:
+    # Callers may modify returned frames in place; never hand out the cached objects
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_cached_result(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_cached_result(v) for k, v in value.items()}
+    return value
+
 class DataExtractionBase(ABC):
     """
     Abstract base class for all data extraction implementations.
@@ -143,6 +194,22 @@ class DataExtractionBase(ABC):
                                'timings_page_timings',
                                'timings_main_document']
 
+    # Time formats derived from the raw test bounds
+    time_bound_formats = ('human', 'iso', 'timestamp')
+
+    # Upper bound for queries the DataProvider may run against this source at once
+    max_query_concurrency = 8
+
+    # Columns of the combined overall time series (see get_overall_timeseries)
+    overall_timeseries_columns = ('overalThroughput',
+                                  'overalAvgResponseTime',
+                                  'overalMedianResponseTime',
+                                  'overal90PctResponseTime',
+                                  'overalErrors')
+
+    # Columns of the long per-transaction frame (see get_per_transaction_metrics)
+    per_transaction_metrics_columns = ('timestamp', 'transaction', 'rps', 'rt_avg', 'rt_median', 'rt_p90', 'error_rate')
+
     def __init__(self, project):
         """
         Initialize the DataExtractionBase class with configuration for the data source.
@@ -151,6 +218,64 @@ class DataExtractionBase(ABC):
         self.project = project
         self.metric_map = {}
 
+    # Data of tests that ended less than this long ago may still be arriving and is never cached
+    query_cache_settle_seconds = 600
+
+    def _query_cache_key(self, method_name: str, arguments: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the (scope, test_title, query_key) QueryResultCache key of a get_* call,
+        or None if the result must not be cached (cache disabled, test not finished).
+        """
+        if not SettingsService.get_setting(self.project, 'data_query', 'query_cache_enabled', default=True):
+            return None
+        scope = QueryResultCache.get_scope_of(self)
+        end = self._parse_query_cache_time(arguments.get('end'))
+        if scope is None or end is None:
+            return None
+        if end > datetime.now(timezone.utc) - timedelta(seconds=self.query_cache_settle_seconds):
+            return None
+
+        call_args = tuple((k, v) for k, v in arguments.items() if k not in ('self', 'test_title'))
+        query_key = (method_name, call_args) + self._query_context()
+        return scope, arguments['test_title'], query_key
+
+    def _query_context(self) -> Tuple[Any, ...]:
+        """Source configuration that changes query results without being a query argument."""
+        queries = getattr(self, 'queries', None)
+        return (
+            getattr(queries, 'granularity_seconds', None),
+            getattr(self, 'listener', None),
+            getattr(self, 'regex', None),
+            getattr(self, 'test_title_tag_name', None),
+            getattr(self, 'multi_node_tag', None),
+            str(getattr(self, '_target_tz', None))
+        )
+
+    @staticmethod
+    def _query_failed(fallback: Any) -> Any:
+        """
+        Return the fallback result of a failed query (e.g. 0 or an empty frame)
+        and record the failure, so the fallback is never cached as a real result.
+        """
+        _query_failures.count = _query_failure_count() + 1
+        return fallback
+
+    @staticmethod
+    def _parse_query_cache_time(value: Any) -> Optional[datetime]:
+        """Parse a start/end argument (epoch s/ms, ISO string or datetime) into UTC, or None."""
+        if value is None:
+            return None
+        try:
+            if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+                value = int(value)
+                ts = pd.Timestamp(value, unit='ms' if value > 10**11 else 's', tz='UTC')
+            else:
+                ts = pd.Timestamp(value)
+                ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+            return None if pd.isna(ts) else ts.to_pydatetime()
+        except (ValueError, TypeError, OverflowError):
+            return None
+
     @abstractmethod
     def set_config(self):
         """
@@ -245,6 +370,53 @@ class DataExtractionBase(ABC):
         """
         return self._fetch_end_time(test_title, **kwargs)
 
+    @abstractmethod
+    def _fetch_test_time_bounds(self, test_title: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Fetch the raw first and last timestamps of a test in a single round trip.
+        :param test_title: The title of the test.
+        :return: Tuple of timezone-aware UTC datetimes (start, end); (None, None) if not found.
+        """
+        pass
+
+    def _format_time_bound(self, ts_utc: datetime, time_format: str, shift_seconds: int = 0) -> Any:
+        """
+        Render a raw UTC timestamp in one of the supported time formats.
+        :param ts_utc: Timezone-aware UTC datetime.
+        :param time_format: The time format ("human", "iso", "timestamp").
+        :param shift_seconds: Offset applied to the iso format only (query window padding).
+        :return: The timestamp in the requested format.
+        """
+        if ts_utc.tzinfo is None:
+            ts_utc = ts_utc.replace(tzinfo=timezone.utc)
+        if time_format == "human":
+            return datetime.strftime(ts_utc.astimezone(self.tmz_human), "%Y-%m-%d %I:%M:%S %p")
+        if time_format == "iso":
+            shifted = ts_utc.astimezone(timezone.utc) + timedelta(seconds=shift_seconds)
+            return datetime.strftime(shifted, "%Y-%m-%dT%H:%M:%SZ")
+        if time_format == "timestamp":
+            return int(ts_utc.timestamp() * 1000)
+        raise ValueError(f"Invalid time format: {time_format}. Valid formats: {list(self.time_bound_formats)}")
+
+    def get_test_time_bounds(self, test_title: str) -> Dict[str, Any]:
+        """
+        Retrieve the start and end time of a test in every supported format.
+        The data source is queried once; all formats are derived locally so that
+        callers do not need one round trip per format.
+        :param test_title: The title of the test.
+        :return: Dictionary keyed like the test data attributes
+                 (start_time_human, start_time_iso, start_time_timestamp, end_time_*).
+        """
+        start_utc, end_utc = self._fetch_test_time_bounds(test_title)
+        if start_utc is None or end_utc is None:
+            raise ValueError(f"No start/end time found for test: {test_title}")
+
+        bounds = {}
+        for time_format in self.time_bound_formats:
+            bounds[f"start_time_{time_format}"] = self._format_time_bound(start_utc, time_format, shift_seconds=-30)
+            bounds[f"end_time_{time_format}"] = self._format_time_bound(end_utc, time_format, shift_seconds=30)
+        return bounds
+
     @abstractmethod
     def _fetch_custom_var(self, test_title: str, custom_var: str, start: str, end: str) -> str:
         """
@@ -257,6 +429,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_custom_var(self, test_title: str, custom_var: str, start: str, end: str) -> str:
         """
         Retrieve the custom variable for a test, validated for the correct time format.
@@ -282,6 +455,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_output(expected_keys={'avg', 'count', 'errors', 'pct50', 'pct75', 'pct90', 'rpm', 'stddev', 'transaction'})
     def get_aggregated_data(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> List[Dict[str, Any]]:
         """
@@ -296,7 +470,7 @@ class DataExtractionBase(ABC):
             aggregated_table = self._fetch_aggregated_data(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting aggregated table: {str(e)}")
-            aggregated_table = []
+            aggregated_table = self._query_failed([])
         return aggregated_table
 
     @abstractmethod
@@ -310,6 +484,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_rps(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -332,6 +507,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_active_threads(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -354,6 +530,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_average_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -376,6 +553,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_median_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -398,6 +576,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_pct90_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -420,6 +599,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dataframe_output(expected_columns=['value'], expected_index='timestamp')
     def get_error_count(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         """
@@ -431,6 +611,106 @@ class DataExtractionBase(ABC):
         """
         return self._fetch_error_count(test_title, start, end)
 
+    def _fetch_overall_timeseries(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch throughput, response times and errors with a single combined query.
+        Sources without a combined query keep this default and return None, in
+        which case the per-metric methods are used.
+        :param test_title: The title of the test.
+        :param start: The start time.
+        :param end: The end time.
+        :return: A DataFrame indexed by 'timestamp' with one column per entry of
+                 overall_timeseries_columns, or None.
+        """
+        return None
+
+    @cached_query
+    def get_overall_timeseries(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Retrieve the overall time series for the specified test as one wide DataFrame.
+        Columns missing from the result should be fetched with the per-metric methods.
+        :param test_title: The title of the test.
+        :param start: The start time.
+        :param end: The end time.
+        :return: A DataFrame indexed by 'timestamp', or None if not supported.
+        """
+        result = self._fetch_overall_timeseries(test_title, start, end)
+        if result is None:
+            return None
+        if not isinstance(result, pd.DataFrame):
+            raise ValueError(f"The return value must be a pandas DataFrame, got {type(result).__name__} instead.")
+        if result.index.name != 'timestamp':
+            raise ValueError(f"The DataFrame index must be 'timestamp', got {result.index.name} instead.")
+        unexpected = set(result.columns) - set(self.overall_timeseries_columns)
+        if unexpected:
+            raise ValueError(f"Unexpected overall time series columns: {sorted(unexpected)}")
+        return result
+
+    def _fetch_per_transaction_metrics(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch all per-transaction metrics with a single combined query.
+        Sources without a combined query keep this default and return None, in
+        which case the per-request methods are used.
+        :param test_title: The title of the test.
+        :param start: The start time.
+        :param end: The end time.
+        :return: A long DataFrame with per_transaction_metrics_columns, or None.
+        """
+        return None
+
+    @cached_query
+    def get_per_transaction_metrics(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Retrieve a long DataFrame with one row per (timestamp, transaction) and the
+        columns rps, rt_avg, rt_median, rt_p90 and error_rate.
+        :param test_title: The title of the test.
+        :param start: The start time.
+        :param end: The end time.
+        :return: The long DataFrame, or None if not supported.
+        """
+        result = self._fetch_per_transaction_metrics(test_title, start, end)
+        if result is None:
+            return None
+        if not isinstance(result, pd.DataFrame):
+            raise ValueError(f"The return value must be a pandas DataFrame, got {type(result).__name__} instead.")
+        if list(result.columns) != list(self.per_transaction_metrics_columns):
+            raise ValueError(f"The DataFrame must contain the columns: {list(self.per_transaction_metrics_columns)}. Got columns: {result.columns.tolist()}")
+        return result
+
+    def _per_transaction_frame_from_records(self, records: Any, time_key: str, granularity_seconds: int) -> pd.DataFrame:
+        """
+        Build the long per-transaction frame from pivoted query rows (a list of
+        dicts or a DataFrame) holding count_all, count_ko, rt_avg, rt_median and
+        rt_p90 per (time, transaction).
+        """
+        columns = list(self.per_transaction_metrics_columns)
+        raw = pd.DataFrame(records)
+        if raw.empty or time_key not in raw.columns or 'transaction' not in raw.columns:
+            return pd.DataFrame(columns=columns)
+        raw = raw.reindex(columns=[time_key, 'transaction', 'count_all', 'count_ko', 'rt_avg', 'rt_median', 'rt_p90'])
+        raw = raw.dropna(subset=[time_key, 'transaction'])
+
+        numeric = raw[['count_all', 'count_ko', 'rt_avg', 'rt_median', 'rt_p90']].apply(pd.to_numeric, errors='coerce')
+        count_all = numeric['count_all']
+        count_ko = numeric['count_ko'].fillna(0.0)
+        error_rate = (count_ko / count_all.where(count_all > 0) * 100.0).where(count_all > 0, 0.0).where(count_all.notna())
+
+        timestamps = pd.to_datetime(raw[time_key], utc=True)
+        target_tz = getattr(self, '_target_tz', None)
+        if target_tz is not None:
+            timestamps = timestamps.dt.tz_convert(target_tz)
+
+        frame = pd.DataFrame({
+            'timestamp': timestamps,
+            'transaction': raw['transaction'],
+            'rps': count_all / float(granularity_seconds),
+            'rt_avg': numeric['rt_avg'],
+            'rt_median': numeric['rt_median'],
+            'rt_p90': numeric['rt_p90'],
+            'error_rate': error_rate,
+        })
+        return frame.sort_values(['timestamp', 'transaction']).reset_index(drop=True)
+
     @abstractmethod
     def _fetch_average_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         """
@@ -442,6 +722,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dict_output
     def get_average_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         """
@@ -464,6 +745,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dict_output
     def get_median_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         """
@@ -487,6 +769,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dict_output
     def get_pct90_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         """
@@ -521,6 +804,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_dict_output
     def get_throughput_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         """
@@ -533,6 +817,7 @@ class DataExtractionBase(ABC):
         """
         return self._fetch_throughput_per_req(test_title, start, end)
 
+    @cached_query
     @validate_integer_output
     def get_max_active_users_stats(self, test_title: str, start: str, end: str) -> int:
         """
@@ -546,7 +831,7 @@ class DataExtractionBase(ABC):
             value = self._fetch_max_active_users_stats(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting max active users: {str(e)}")
-            value = 0
+            value = self._query_failed(0)
         return value
 
     @abstractmethod
@@ -560,6 +845,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_integer_output
     def get_median_throughput_stats(self, test_title: str, start: str, end: str) -> int:
         """
@@ -573,7 +859,7 @@ class DataExtractionBase(ABC):
             value = self._fetch_median_throughput_stats(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting median throughput: {str(e)}")
-            value = 0
+            value = self._query_failed(0)
         return value
 
     @abstractmethod
@@ -587,6 +873,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_float_output
     def get_median_response_time_stats(self, test_title: str, start: str, end: str) -> float:
         """
@@ -600,7 +887,7 @@ class DataExtractionBase(ABC):
             value = self._fetch_median_response_time_stats(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting median response time stats: {str(e)}")
-            value = 0.0
+            value = self._query_failed(0.0)
         return value
 
     @abstractmethod
@@ -614,6 +901,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_float_output
     def get_pct90_response_time_stats(self, test_title: str, start: str, end: str) -> float:
         """
@@ -627,7 +915,7 @@ class DataExtractionBase(ABC):
             value = self._fetch_pct90_response_time_stats(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting 90th percentile response time stats: {str(e)}")
-            value = 0.0
+            value = self._query_failed(0.0)
         return value
 
     @abstractmethod
@@ -641,6 +929,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     @validate_float_output
     def get_errors_pct_stats(self, test_title: str, start: str, end: str) -> float:
         """
@@ -654,7 +943,7 @@ class DataExtractionBase(ABC):
             value = self._fetch_errors_pct_stats(test_title, start, end)
         except Exception as e:
             logging.warning(f"Error getting errors percentage stats: {str(e)}")
-            value = 0.0
+            value = self._query_failed(0.0)
         return value
 
     # ===================================================================
@@ -673,12 +962,13 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_overview_data(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         try:
             return self._fetch_overview_data(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting overview table: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     # ===================================================================
     # Frontend metrics extraction methods
@@ -696,6 +986,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_google_web_vitals(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve Google Web Vitals metrics from frontend test.
@@ -709,7 +1000,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_google_web_vitals(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting Google Web Vitals: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -724,6 +1015,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_timings_fully_loaded(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve fully loaded timing metrics from frontend test.
@@ -737,7 +1029,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_timings_fully_loaded(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting fully loaded timings: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -752,6 +1044,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_timings_page_timings(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve page timing metrics from frontend test.
@@ -765,7 +1058,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_timings_page_timings(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting page timings: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -780,6 +1073,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_timings_main_document(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve main document timing metrics from frontend test.
@@ -793,7 +1087,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_timings_main_document(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting main document timings: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -808,6 +1102,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_cpu_long_tasks(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve CPU long tasks metrics from frontend test.
@@ -821,7 +1116,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_cpu_long_tasks(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting CPU long tasks: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -836,6 +1131,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_cdp_performance_js_heap_used_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve JavaScript heap used size metrics from frontend test.
@@ -849,7 +1145,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_cdp_performance_js_heap_used_size(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting JS heap used size: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -864,6 +1160,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_cdp_performance_js_heap_total_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve JavaScript heap total size metrics from frontend test.
@@ -877,7 +1174,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_cdp_performance_js_heap_total_size(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting JS heap total size: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -892,6 +1189,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_count_per_content_type(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve content type metrics from frontend test.
@@ -905,7 +1203,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_count_per_content_type(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting content types: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -920,6 +1218,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_first_party_transfer_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve first party content type metrics from frontend test.
@@ -933,7 +1232,7 @@ class DataExtractionBase(ABC):
             result = self._fetch_first_party_transfer_size(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting first party content types: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
 
     @abstractmethod
@@ -948,6 +1247,7 @@ class DataExtractionBase(ABC):
         """
         pass
 
+    @cached_query
     def get_third_party_transfer_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
         Retrieve third party content type metrics from frontend test.
@@ -961,5 +1261,5 @@ class DataExtractionBase(ABC):
             result = self._fetch_third_party_transfer_size(test_title, start, end, aggregation)
         except Exception as e:
             logging.warning(f"Error getting third party content types: {str(e)}")
-            result = {}
+            result = self._query_failed({})
         return result
@@ -43,6 +43,14 @@ class BackEndQueriesBase(ABC):
     def get_end_time(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
         pass
 
+    @abstractmethod
+    def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
+        pass
+
+    @abstractmethod
+    def get_test_catalog_delta(self, bucket: str, test_title_tag_name: str, since: str | None = None, multi_node_tag: str = None) -> str:
+        pass
+
     @abstractmethod
     def get_custom_var(self, testTitle: str, custom_var: str, start: int, stop: int, bucket: str, test_title_tag_name: str) -> str:
         pass
@@ -75,6 +83,14 @@ class BackEndQueriesBase(ABC):
     def get_error_count(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str) -> str:
         pass
 
+    @abstractmethod
+    def get_overall_timeseries(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
+        pass
+
+    @abstractmethod
+    def get_per_transaction_metrics(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
+        pass
+
     @abstractmethod
     def get_average_response_time_per_req(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
         pass
@@ -137,6 +153,14 @@ class FrontEndQueriesBase(ABC):
     def get_end_time(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
         pass
 
+    @abstractmethod
+    def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
+        pass
+
+    @abstractmethod
+    def get_test_catalog_delta(self, bucket: str, test_title_tag_name: str, since: str | None = None) -> str:
+        pass
+
     @abstractmethod
     def get_google_web_vitals(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, aggregation: str = 'median', regex: str = '') -> str:
         pass
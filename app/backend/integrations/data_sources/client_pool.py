@@ -0,0 +1,221 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client Pool - process-wide pool of data source clients.
+
+Data source objects are created per request, but their HTTP clients are not:
+clients are pooled per (client kind, integration id) and reused as long as the
+connection settings (config hash) do not change, so keep-alive connections and
+TLS sessions survive across requests. Each pooled client bounds the number of
+concurrent calls made through it, and clients that have not been used for a
+while are closed.
+"""
+
+import time
+import atexit
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _PoolEntry:
+    """A pooled client with its concurrency slots and usage bookkeeping."""
+
+    def __init__(self, client: Any, config_hash: str, max_concurrency: int):
+        self.client = client
+        self.config_hash = config_hash
+        self.slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self.apis: Dict[str, Any] = {}
+        self.in_flight = 0
+        self.retired = False
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def slot(self):
+        with self.slots:
+            with self.lock:
+                self.in_flight += 1
+                self.last_used = time.monotonic()
+            try:
+                yield
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+                    self.last_used = time.monotonic()
+                    close_now = self.retired and self.in_flight == 0
+                if close_now:
+                    self.close()
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        except Exception as er:
+            logging.warning(f"ClientPool: failed to close client: {er}")
+
+
+class _BoundedProxy:
+    """Runs every method call of the target inside a concurrency slot of its pool entry."""
+
+    def __init__(self, entry: _PoolEntry, target: Any):
+        self._entry = entry
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        def call(*args, **kwargs):
+            with self._entry.slot():
+                return attr(*args, **kwargs)
+        return call
+
+
+class PooledClient:
+    """
+    Handle to a pooled client, used in place of the client itself.
+
+    Attribute access is delegated to the live pooled client (re-created if it
+    was closed as idle). Method calls and argument-less '*_api()' factories
+    (InfluxDB v2 query_api/delete_api) are bounded by the pool entry; the API
+    objects are created once per client. close() is a no-op, the pool owns the
+    client's lifecycle.
+    """
+
+    def __init__(self, key: Tuple[Any, ...], config_hash: str, factory: Callable[[], Any], max_concurrency: int):
+        self._key = key
+        self._config_hash = config_hash
+        self._factory = factory
+        self._max_concurrency = max_concurrency
+
+    def _entry(self) -> _PoolEntry:
+        return ClientPool.get_entry(self._key, self._config_hash, self._factory, self._max_concurrency)
+
+    def __getattr__(self, name: str) -> Any:
+        entry = self._entry()
+        attr = getattr(entry.client, name)
+        if not callable(attr):
+            return attr
+        if name.endswith('_api'):
+            def api_factory(*args, **kwargs):
+                if args or kwargs:
+                    return _BoundedProxy(entry, attr(*args, **kwargs))
+                with entry.lock:
+                    api = entry.apis.get(name)
+                    if api is None:
+                        api = entry.apis[name] = _BoundedProxy(entry, attr())
+                return api
+            return api_factory
+        return _BoundedProxy(entry, entry.client).__getattr__(name)
+
+    def close(self) -> None:
+        return None
+
+
+class ClientPool:
+    """Process-wide, thread-safe pool of data source clients."""
+
+    idle_timeout_seconds = 300
+    sweep_interval_seconds = 60
+
+    # Pool structure: {(client kind, integration id): _PoolEntry}
+    _entries: Dict[Tuple[Any, ...], _PoolEntry] = {}
+    _lock = threading.RLock()
+    _last_sweep = time.monotonic()
+
+    @classmethod
+    def config_hash(cls, *parts: Any) -> str:
+        """Hash of the connection settings of a client (credentials are never stored)."""
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_client(cls, kind: str, integration_id: Any, config_hash: str, factory: Callable[[], Any], max_concurrency: int = 8) -> PooledClient:
+        """
+        Return a handle to the pooled client of an integration.
+
+        The client is created with factory() on first use and whenever the
+        config hash changes; the previous client is closed once it is idle.
+        """
+        handle = PooledClient((kind, integration_id), config_hash, factory, max_concurrency)
+        # Create the client eagerly so connection errors surface where they used to
+        handle._entry()
+        return handle
+
+    @classmethod
+    def get_entry(cls, key: Tuple[Any, ...], config_hash: str, factory: Callable[[], Any], max_concurrency: int) -> _PoolEntry:
+        cls._sweep_idle()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry.config_hash == config_hash:
+                entry.last_used = time.monotonic()
+                return entry
+            if entry is not None:
+                cls._retire(entry)
+            entry = _PoolEntry(factory(), config_hash, max_concurrency)
+            cls._entries[key] = entry
+            logging.debug(f"ClientPool: created client for {key}")
+            return entry
+
+    @classmethod
+    def evict(cls, integration_id: Any) -> None:
+        """Drop the pooled clients of an integration, e.g. after its config changed."""
+        try:
+            integration_id = int(integration_id)
+        except (TypeError, ValueError):
+            pass
+        with cls._lock:
+            for key in [k for k in cls._entries if k[1] == integration_id]:
+                cls._retire(cls._entries.pop(key))
+                logging.debug(f"ClientPool: evicted client for {key}")
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            entries = list(cls._entries.values())
+            cls._entries.clear()
+        for entry in entries:
+            cls._retire(entry)
+
+    @classmethod
+    def _retire(cls, entry: _PoolEntry) -> None:
+        # Calls in flight keep the client open; the last one closes it
+        with entry.lock:
+            entry.retired = True
+            close_now = entry.in_flight == 0
+        if close_now:
+            entry.close()
+
+    @classmethod
+    def _sweep_idle(cls) -> None:
+        now = time.monotonic()
+        if now - cls._last_sweep < cls.sweep_interval_seconds:
+            return
+        with cls._lock:
+            cls._last_sweep = now
+            idle = [
+                key for key, entry in cls._entries.items()
+                if entry.in_flight == 0 and now - entry.last_used > cls.idle_timeout_seconds
+            ]
+            for key in idle:
+                cls._retire(cls._entries.pop(key))
+                logging.debug(f"ClientPool: closed idle client for {key}")
+
+
+atexit.register(ClientPool.close_all)
@@ -16,7 +16,7 @@
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -27,7 +27,10 @@ from app.backend.components.secrets.secrets_db import DBSecrets
 from app.backend.errors import ErrorMessages
 from app.backend.integrations.data_sources.base_extraction import DataExtractionBase
 from app.backend.integrations.data_sources.base_queries import BackEndQueriesBase, FrontEndQueriesBase
+from app.backend.integrations.data_sources.client_pool import ClientPool
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_db import DBInfluxdb
+from app.backend.integrations.data_sources.influxdb_v2.test_catalog_db import DBTestCatalog, DBTestCatalogState
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 from app.backend.integrations.data_sources.influxdb_v1_8.queries.influxdb_backend_listener_client_influxql import (
     InfluxDBBackendListenerClientInfluxQL,
 )
@@ -52,6 +55,14 @@ class InfluxdbV18(DataExtractionBase):
         "sitespeed_influxdb_v1.8": SitespeedInfluxQLQueries,
     }
 
+    # Test catalog refresh: rescan this much before the high-water mark to pick up
+    # late points, and skip refreshes that are more recent than the interval.
+    catalog_refresh_overlap = timedelta(minutes=5)
+    catalog_refresh_interval = timedelta(seconds=30)
+
+    # InfluxDB 1.8 evaluates InfluxQL per shard group; keep parallel load modest
+    max_query_concurrency = 4
+
     def __init__(self, project, id: int | None = None) -> None:
         super().__init__(project)
         self.influxdb_connection: InfluxDBClient | None = None
@@ -146,15 +157,27 @@ class InfluxdbV18(DataExtractionBase):
             host = parsed.hostname or self.url
             port = getattr(self, "port", None) or parsed.port or 8086
 
-            self.influxdb_connection = InfluxDBClient(
-                host=host,
-                port=port,
-                username=getattr(self, "username", None),
-                password=getattr(self, "password", None),
-                database=getattr(self, "database", None),
-                timeout=getattr(self, "timeout", None),
-                ssl=parsed.scheme == "https",
-                verify_ssl=False,
+            username = getattr(self, "username", None)
+            password = getattr(self, "password", None)
+            database = getattr(self, "database", None)
+            timeout = getattr(self, "timeout", None)
+            ssl = parsed.scheme == "https"
+
+            # Clients are pooled per integration and reused while the connection settings are unchanged
+            config_hash = ClientPool.config_hash(host, port, username, password, database, timeout, ssl)
+            self.influxdb_connection = ClientPool.get_client(
+                "InfluxdbV18", getattr(self, "id", None), config_hash,
+                lambda: InfluxDBClient(
+                    host=host,
+                    port=port,
+                    username=username,
+                    password=password,
+                    database=database,
+                    timeout=timeout,
+                    ssl=ssl,
+                    verify_ssl=False,
+                ),
+                max_concurrency=self.max_query_concurrency
             )
         except Exception as er:
             logging.error(ErrorMessages.ER00052.value.format(getattr(self, "name", "InfluxDB 1.8")))
@@ -187,9 +210,9 @@ class InfluxdbV18(DataExtractionBase):
     def _query(self, query: str) -> List[Dict[str, Any]]:
         if self.influxdb_connection is None:
             logging.warning("InfluxdbV18: no active connection for query: %s", query)
-            return []
+            return self._query_failed([])
         try:
-            result = self.influxdb_connection.query(query)
+            result = self.influxdb_connection.query(query, database=self.database)
             # When using GROUP BY, we need to iterate through result sets to get tag values
             # Each result set corresponds to a unique combination of grouped tags
             points = []
@@ -209,7 +232,47 @@ class InfluxdbV18(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00056.value.format(query))
             logging.error(er)
-            return []
+            return self._query_failed([])
+
+    def _query_frame(self, query: str) -> Optional[pd.DataFrame]:
+        """Run an InfluxQL query and decode all series into one DataFrame.
+
+        The raw JSON value arrays of each series are loaded in one shot (with
+        epoch millisecond timestamps) and series tags become columns, so no
+        per-point dicts are built. Multi-statement results are concatenated.
+        Returns None if the query fails.
+        """
+        if self.influxdb_connection is None:
+            logging.warning("InfluxdbV18: no active connection for query: %s", query)
+            return self._query_failed(None)
+        try:
+            result = self.influxdb_connection.query(query, epoch="ms", database=self.database)
+        except Exception as er:
+            logging.error(ErrorMessages.ER00056.value.format(query))
+            logging.error(er)
+            return self._query_failed(None)
+
+        frames: List[pd.DataFrame] = []
+        for result_set in (result if isinstance(result, list) else [result]):
+            for series in (result_set.raw or {}).get("series", []) or []:
+                values = series.get("values") or []
+                if not values:
+                    continue
+                frame = pd.DataFrame(values, columns=series.get("columns"))
+                for tag, tag_value in (series.get("tags") or {}).items():
+                    frame[tag] = tag_value
+                frames.append(frame)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def _localize_epoch(self, times: pd.Series) -> pd.Series:
+        """Vectorized _localize_timestamp for epoch millisecond timestamps."""
+        times = pd.to_datetime(times, unit="ms", utc=True)
+        try:
+            return times.dt.tz_convert(self._target_tz)
+        except Exception:
+            return times
 
     def _query_df(self, query: str, value_field: str, agg_func: str = "mean") -> pd.DataFrame:
         """Query InfluxDB and return a DataFrame with timestamp index.
@@ -220,23 +283,17 @@ class InfluxdbV18(DataExtractionBase):
             agg_func: Aggregation function for duplicate timestamps ('mean', 'sum', 'max')
                       Default is 'mean' for response times; use 'sum' for counts/throughput
         """
-        points = self._query(query)
-        if not points:
+        data = self._query_frame(query)
+        if data is None or data.empty or "time" not in data.columns:
             return self._empty_time_series()
-
-        data: List[Dict[str, Any]] = []
-        for p in points:
-            t_str = p.get("time")
-            if not t_str:
-                continue
-            ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-            ts = self._localize_timestamp(ts_utc)
-            data.append({"timestamp": ts, "value": p.get(value_field)})
-
-        if not data:
+        data = data.dropna(subset=["time"])
+        if data.empty:
             return self._empty_time_series()
 
-        df = pd.DataFrame(data)
+        df = pd.DataFrame({
+            "timestamp": self._localize_epoch(data["time"]),
+            "value": data[value_field] if value_field in data.columns else None,
+        })
         df.set_index("timestamp", inplace=True)
 
         # Aggregate duplicate timestamps (multi-node support)
@@ -250,6 +307,34 @@ class InfluxdbV18(DataExtractionBase):
 
         return df
 
+    def _query_per_req(self, query: str, agg_func: str = "mean") -> List[Dict[str, Any]]:
+        """Query a series grouped by transaction and split it into per-transaction DataFrames.
+
+        Args:
+            query: InfluxQL query string grouped by the "transaction" tag
+            agg_func: Aggregation for duplicate timestamps of one transaction ('mean' or 'sum')
+        """
+        data = self._query_frame(query)
+        if data is None or data.empty or "transaction" not in data.columns:
+            return []
+        data = data[data["transaction"].notna() & (data["transaction"] != "") & data["time"].notna()]
+        if data.empty:
+            return []
+
+        frame = pd.DataFrame({
+            "timestamp": self._localize_epoch(data["time"]),
+            "value": data["value"] if "value" in data.columns else None,
+            "transaction": data["transaction"],
+        }).set_index("timestamp")
+
+        results: List[Dict[str, Any]] = []
+        for txn, group in frame.groupby("transaction", sort=False):
+            df = group[["value"]]
+            if df.index.has_duplicates:
+                df = df.groupby(level=0).sum() if agg_func == "sum" else df.groupby(level=0).mean()
+            results.append({"transaction": txn, "data": df})
+        return results
+
     def list_buckets(self, name_regex: str | None = None) -> List[str]:
         """Return a list of database names (buckets) available in the connected InfluxDB 1.8 instance.
 
@@ -288,6 +373,13 @@ class InfluxdbV18(DataExtractionBase):
     # Backend interface implemented with InfluxQL
     # ------------------------------------------------------------------
     def _fetch_tests_titles(self, search: str = '') -> List[Dict[str, Any]]:
+        if self.refresh_test_catalog():
+            try:
+                entries = DBTestCatalog.get_entries(self.id, self._catalog_bucket(), search=search)
+                return [{"test_title": entry["test_title"]} for entry in entries]
+            except Exception as er:
+                logging.warning(f"InfluxdbV18: test catalog lookup failed, querying database: {er}")
+
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
         query = self.queries.get_tests_titles(bucket="", test_title_tag_name=tag_key, search=search)
         points = self._query(query)
@@ -318,18 +410,7 @@ class InfluxdbV18(DataExtractionBase):
             return None
 
         ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-
-        if time_format == "human":
-            return datetime.strftime(
-                ts_utc.astimezone(self.tmz_human), "%Y-%m-%d %I:%M:%S %p"
-            )
-        if time_format == "iso":
-            start_dt = ts_utc - timedelta(seconds=30)
-            return datetime.strftime(start_dt, "%Y-%m-%dT%H:%M:%SZ")
-        if time_format == "timestamp":
-            return int(ts_utc.astimezone(self.tmz_utc).timestamp() * 1000)
-
-        return None
+        return self._format_time_bound(ts_utc, time_format, shift_seconds=-30)
 
     def _fetch_end_time(self, test_title: str, time_format: str) -> Any:
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
@@ -350,58 +431,163 @@ class InfluxdbV18(DataExtractionBase):
             return None
 
         ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
+        return self._format_time_bound(ts_utc, time_format, shift_seconds=30)
+
+    def _fetch_test_time_bounds(self, test_title: str) -> Tuple[datetime | None, datetime | None]:
+        entry = self._get_catalog_entry(test_title)
+        if entry:
+            return entry["start_time"], entry["end_time"]
+
+        tag_key = getattr(self, "test_title_tag_name", "testTitle")
+        query = self.queries.get_test_time_bounds(
+            testTitle=test_title,
+            bucket="",
+            test_title_tag_name=tag_key,
+        )
+        if self.influxdb_connection is None:
+            logging.warning("InfluxdbV18: no active connection for query: %s", query)
+            return self._query_failed((None, None))
+        try:
+            results = self.influxdb_connection.query(query, database=self.database)
+        except Exception as er:
+            logging.error(ErrorMessages.ER00056.value.format(query))
+            logging.error(er)
+            return self._query_failed((None, None))
+
+        # A multi-statement query yields one result set per statement
+        if not isinstance(results, list):
+            results = [results]
+
+        bounds: List[datetime | None] = []
+        for result in results[:2]:
+            points = list(result.get_points())
+            t_str = points[0].get("time") if points else None
+            bounds.append(pd.to_datetime(t_str, utc=True).to_pydatetime() if t_str else None)
+        while len(bounds) < 2:
+            bounds.append(None)
 
-        if time_format == "human":
-            return datetime.strftime(
-                ts_utc.astimezone(self.tmz_human), "%Y-%m-%d %I:%M:%S %p"
+        if bounds[0] is None or bounds[1] is None:
+            logging.warning(
+                "InfluxdbV18: no time bounds found for test '%s'", test_title
             )
-        if time_format == "iso":
-            end_dt = ts_utc + timedelta(seconds=30)
-            return datetime.strftime(end_dt, "%Y-%m-%dT%H:%M:%SZ")
-        if time_format == "timestamp":
-            return int(ts_utc.astimezone(self.tmz_utc).timestamp() * 1000)
+        return bounds[0], bounds[1]
 
-        return None
+    # ------------------------------------------------------------------
+    # Test catalog
+    # ------------------------------------------------------------------
+    def _catalog_bucket(self) -> str:
+        return getattr(self, "database", None) or ""
+
+    def refresh_test_catalog(self, force: bool = False) -> bool:
+        """Merge tests seen since the catalog high-water mark into the test catalog.
+
+        The first refresh of a database scans its whole history; later
+        refreshes only scan data newer than the mark (minus a small overlap).
+        Returns True if the catalog is up to date and can be used for lookups.
+        """
+        if self.queries is None or self.influxdb_connection is None or not getattr(self, "id", None):
+            return False
+        tag_key = getattr(self, "test_title_tag_name", "testTitle")
+        bucket = self._catalog_bucket()
+        try:
+            now = datetime.now(tz=self.tmz_utc)
+            high_water_mark = DBTestCatalogState.get_high_water_mark(self.id, bucket)
+            if high_water_mark is not None and not force and now - high_water_mark < self.catalog_refresh_interval:
+                return True
+
+            since = None
+            if high_water_mark is not None:
+                since = (high_water_mark - self.catalog_refresh_overlap).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+            if isinstance(self.queries, BackEndQueriesBase):
+                query = self.queries.get_test_catalog_delta(
+                    bucket="", test_title_tag_name=tag_key, since=since, multi_node_tag=self.multi_node_tag
+                )
+            else:
+                query = self.queries.get_test_catalog_delta(bucket="", test_title_tag_name=tag_key, since=since)
+
+            results = self.influxdb_connection.query(query, database=self.database)
+            if not isinstance(results, list):
+                results = [results]
+
+            # One result set per statement: first seen, last seen, peak threads
+            entries: Dict[str, Dict[str, Any]] = {}
+            for stat, result in zip(("start_time", "end_time", "max_threads"), results):
+                for (_, tags), points in result.items():
+                    title = (tags or {}).get(tag_key)
+                    if not title:
+                        continue
+                    entry = entries.setdefault(title, {"test_title": title, "max_threads": None})
+                    for point in points:
+                        if stat == "max_threads":
+                            # Node peaks are summed when grouped by the multi-node tag
+                            if point.get("max") is not None:
+                                entry["max_threads"] = (entry["max_threads"] or 0) + int(round(point["max"]))
+                        elif point.get("time"):
+                            entry[stat] = pd.to_datetime(point["time"], utc=True).to_pydatetime()
+
+            complete = [e for e in entries.values() if e.get("start_time") and e.get("end_time")]
+            if complete:
+                DBTestCatalog.upsert_entries(self.project, self.id, bucket, self.listener, complete)
+            DBTestCatalogState.set_high_water_mark(self.project, self.id, bucket, now)
+            return True
+        except Exception as er:
+            logging.warning(f"InfluxdbV18: test catalog refresh failed for {getattr(self, 'name', 'InfluxDB 1.8')}: {er}")
+            return False
+
+    def _get_catalog_entry(self, test_title: str) -> Optional[Dict[str, Any]]:
+        if not self.refresh_test_catalog():
+            return None
+        try:
+            return DBTestCatalog.get_entry(self.id, self._catalog_bucket(), test_title)
+        except Exception as er:
+            logging.warning(f"InfluxdbV18: test catalog lookup failed for '{test_title}': {er}")
+            return None
 
     def _fetch_test_log(self, test_titles: List[str]) -> List[Dict[str, Any]]:
         records: List[Dict[str, Any]] = []
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
 
         for title in test_titles:
-            start_iso = self._fetch_start_time(title, "iso")
-            end_iso = self._fetch_end_time(title, "iso")
-            if not start_iso or not end_iso:
+            entry = self._get_catalog_entry(title)
+            if entry:
+                start_raw, end_raw = entry["start_time"], entry["end_time"]
+            else:
+                start_raw, end_raw = self._fetch_test_time_bounds(title)
+            if start_raw is None or end_raw is None:
                 continue
+            start_iso = self._format_time_bound(start_raw, "iso", shift_seconds=-30)
+            end_iso = self._format_time_bound(end_raw, "iso", shift_seconds=30)
 
             start_dt = pd.to_datetime(start_iso, utc=True).to_pydatetime()
             end_dt = pd.to_datetime(end_iso, utc=True).to_pydatetime()
             duration = int((end_dt - start_dt).total_seconds())
 
-            # Use queries helper to get max_threads for this test
-            # Only pass multi_node_tag for BackEndQueriesBase (JMeter listener)
-            if isinstance(self.queries, BackEndQueriesBase):
-                query = self.queries.get_test_log(
-                    bucket="",
-                    test_title_tag_name=tag_key,
-                    test_title=title,
-                    multi_node_tag=self.multi_node_tag,
-                )
-            else:
-                query = self.queries.get_test_log(
-                    bucket="",
-                    test_title_tag_name=tag_key,
-                    test_title=title,
-                )
-            if query:
-                points = self._query(query)
+            max_threads = 1
+            if entry and entry.get("max_threads") is not None:
+                max_threads = entry["max_threads"]
             else:
-                points = []
-                max_threads = 1
-            if points:
-                try:
-                    max_threads = int(round(points[0].get("max_threads") or 0))
-                except Exception:
-                    max_threads = 1
+                # Use queries helper to get max_threads for this test
+                # Only pass multi_node_tag for BackEndQueriesBase (JMeter listener)
+                if isinstance(self.queries, BackEndQueriesBase):
+                    query = self.queries.get_test_log(
+                        bucket="",
+                        test_title_tag_name=tag_key,
+                        test_title=title,
+                        multi_node_tag=self.multi_node_tag,
+                    )
+                else:
+                    query = self.queries.get_test_log(
+                        bucket="",
+                        test_title_tag_name=tag_key,
+                        test_title=title,
+                    )
+                points = self._query(query) if query else []
+                if points:
+                    try:
+                        max_threads = int(round(points[0].get("max_threads") or 0))
+                    except Exception:
+                        max_threads = 1
 
             start_local = self._localize_timestamp(start_dt)
             end_local = self._localize_timestamp(end_dt)
@@ -447,14 +633,14 @@ class InfluxdbV18(DataExtractionBase):
         )
         if self.influxdb_connection is None:
             logging.warning("InfluxdbV18: no active connection for aggregated data query: %s", query)
-            return []
+            return self._query_failed([])
 
         try:
-            result = self.influxdb_connection.query(query)
+            result = self.influxdb_connection.query(query, database=self.database)
         except Exception as er:
             logging.error(ErrorMessages.ER00056.value.format(query))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
         results: List[Dict[str, Any]] = []
         for (_measurement, tags), points in result.items():
@@ -556,9 +742,11 @@ class InfluxdbV18(DataExtractionBase):
         )
         return self._query_df(query, "value", agg_func="sum")
 
-    def _fetch_average_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
+    def _fetch_overall_timeseries(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        if not isinstance(self.queries, BackEndQueriesBase) or self.influxdb_connection is None:
+            return None
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
-        query = self.queries.get_average_response_time_per_req(
+        query = self.queries.get_overall_timeseries(
             testTitle=test_title,
             start=start,
             stop=end,
@@ -566,50 +754,56 @@ class InfluxdbV18(DataExtractionBase):
             test_title_tag_name=tag_key,
             regex=getattr(self, "regex", ""),
         )
-        if self.influxdb_connection is None:
-            logging.warning("InfluxdbV18: no active connection for average response time per req query: %s", query)
-            return []
-
-        try:
-            result = self.influxdb_connection.query(query)
-        except Exception as er:
-            logging.error(ErrorMessages.ER00056.value.format(query))
-            logging.error(er)
-            return []
-
-        txn_data: Dict[str, List[pd.DataFrame]] = {}
-        for (_measurement, tags), points in result.items():
-            txn = (tags or {}).get("transaction")
-            if not txn:
-                continue
+        data = self._query_frame(query)
+        if data is None:
+            logging.warning("InfluxdbV18: combined overall time series query failed, using per-metric queries")
+            return None
 
-            rows: List[Dict[str, Any]] = []
-            for p in points:
-                t_str = p.get("time")
-                if not t_str:
-                    continue
-                ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-                ts = self._localize_timestamp(ts_utc)
-                rows.append({"timestamp": ts, "value": p.get("value")})
+        columns = list(self.overall_timeseries_columns)
+        if data.empty or "time" not in data.columns:
+            return pd.DataFrame(columns=columns, dtype=float).set_index(pd.Index([], name="timestamp"))
 
-            if not rows:
-                continue
+        # Each statement returns its own columns for the same GROUP BY time() windows
+        df = data.reindex(columns=["time"] + columns).groupby("time").first().astype(float)
+        df.index = pd.Index(self._localize_epoch(df.index.to_series()), name="timestamp")
+        return df.sort_index()
 
-            df = pd.DataFrame(rows)
-            df.set_index("timestamp", inplace=True)
-            df.index.name = "timestamp"
-            txn_data.setdefault(txn, []).append(df)
+    def _fetch_per_transaction_metrics(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        if not isinstance(self.queries, BackEndQueriesBase) or self.influxdb_connection is None:
+            return None
+        tag_key = getattr(self, "test_title_tag_name", "testTitle")
+        query = self.queries.get_per_transaction_metrics(
+            testTitle=test_title,
+            start=start,
+            stop=end,
+            bucket="",
+            test_title_tag_name=tag_key,
+            regex=getattr(self, "regex", ""),
+        )
+        data = self._query_frame(query)
+        if data is None:
+            logging.warning("InfluxdbV18: combined per-transaction query failed, using per-request queries")
+            return None
+        if data.empty or "transaction" not in data.columns:
+            return self._per_transaction_frame_from_records(data, "time", self.queries.granularity_seconds)
 
-        # Merge DataFrames for same transaction (multi-node support)
-        results: List[Dict[str, Any]] = []
-        for txn, dfs in txn_data.items():
-            if len(dfs) == 1:
-                merged = dfs[0]
-            else:
-                merged = pd.concat(dfs).groupby(level=0).mean()
-            results.append({"transaction": txn, "data": merged})
+        # Both statements are grouped by time and transaction; join their columns on that key
+        data = data.groupby(["time", "transaction"], as_index=False).first()
+        data["time"] = pd.to_datetime(data["time"], unit="ms", utc=True)
+        return self._per_transaction_frame_from_records(data, "time", self.queries.granularity_seconds)
 
-        return results
+    def _fetch_average_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
+        tag_key = getattr(self, "test_title_tag_name", "testTitle")
+        query = self.queries.get_average_response_time_per_req(
+            testTitle=test_title,
+            start=start,
+            stop=end,
+            bucket="",
+            test_title_tag_name=tag_key,
+            regex=getattr(self, "regex", ""),
+        )
+        # Series of the same transaction (multi-node) are averaged
+        return self._query_per_req(query, agg_func="mean")
 
     def _fetch_median_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
@@ -621,50 +815,8 @@ class InfluxdbV18(DataExtractionBase):
             test_title_tag_name=tag_key,
             regex=getattr(self, "regex", ""),
         )
-        if self.influxdb_connection is None:
-            logging.warning("InfluxdbV18: no active connection for median response time per req query: %s", query)
-            return []
-
-        try:
-            result = self.influxdb_connection.query(query)
-        except Exception as er:
-            logging.error(ErrorMessages.ER00056.value.format(query))
-            logging.error(er)
-            return []
-
-        txn_data: Dict[str, List[pd.DataFrame]] = {}
-        for (_measurement, tags), points in result.items():
-            txn = (tags or {}).get("transaction")
-            if not txn:
-                continue
-
-            rows: List[Dict[str, Any]] = []
-            for p in points:
-                t_str = p.get("time")
-                if not t_str:
-                    continue
-                ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-                ts = self._localize_timestamp(ts_utc)
-                rows.append({"timestamp": ts, "value": p.get("value")})
-
-            if not rows:
-                continue
-
-            df = pd.DataFrame(rows)
-            df.set_index("timestamp", inplace=True)
-            df.index.name = "timestamp"
-            txn_data.setdefault(txn, []).append(df)
-
-        # Merge DataFrames for same transaction (multi-node support)
-        results: List[Dict[str, Any]] = []
-        for txn, dfs in txn_data.items():
-            if len(dfs) == 1:
-                merged = dfs[0]
-            else:
-                merged = pd.concat(dfs).groupby(level=0).mean()
-            results.append({"transaction": txn, "data": merged})
-
-        return results
+        # Series of the same transaction (multi-node) are averaged
+        return self._query_per_req(query, agg_func="mean")
 
     def _fetch_pct90_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
@@ -676,50 +828,8 @@ class InfluxdbV18(DataExtractionBase):
             test_title_tag_name=tag_key,
             regex=getattr(self, "regex", ""),
         )
-        if self.influxdb_connection is None:
-            logging.warning("InfluxdbV18: no active connection for pct90 response time per req query: %s", query)
-            return []
-
-        try:
-            result = self.influxdb_connection.query(query)
-        except Exception as er:
-            logging.error(ErrorMessages.ER00056.value.format(query))
-            logging.error(er)
-            return []
-
-        txn_data: Dict[str, List[pd.DataFrame]] = {}
-        for (_measurement, tags), points in result.items():
-            txn = (tags or {}).get("transaction")
-            if not txn:
-                continue
-
-            rows: List[Dict[str, Any]] = []
-            for p in points:
-                t_str = p.get("time")
-                if not t_str:
-                    continue
-                ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-                ts = self._localize_timestamp(ts_utc)
-                rows.append({"timestamp": ts, "value": p.get("value")})
-
-            if not rows:
-                continue
-
-            df = pd.DataFrame(rows)
-            df.set_index("timestamp", inplace=True)
-            df.index.name = "timestamp"
-            txn_data.setdefault(txn, []).append(df)
-
-        # Merge DataFrames for same transaction (multi-node support)
-        results: List[Dict[str, Any]] = []
-        for txn, dfs in txn_data.items():
-            if len(dfs) == 1:
-                merged = dfs[0]
-            else:
-                merged = pd.concat(dfs).groupby(level=0).mean()
-            results.append({"transaction": txn, "data": merged})
-
-        return results
+        # Series of the same transaction (multi-node) are averaged
+        return self._query_per_req(query, agg_func="mean")
 
     def _fetch_throughput_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
@@ -731,50 +841,8 @@ class InfluxdbV18(DataExtractionBase):
             test_title_tag_name=tag_key,
             regex=getattr(self, "regex", ""),
         )
-        if self.influxdb_connection is None:
-            logging.warning("InfluxdbV18: no active connection for throughput per req query: %s", query)
-            return []
-
-        try:
-            result = self.influxdb_connection.query(query)
-        except Exception as er:
-            logging.error(ErrorMessages.ER00056.value.format(query))
-            logging.error(er)
-            return []
-
-        txn_data: Dict[str, List[pd.DataFrame]] = {}
-        for (_measurement, tags), points in result.items():
-            txn = (tags or {}).get("transaction")
-            if not txn:
-                continue
-
-            rows: List[Dict[str, Any]] = []
-            for p in points:
-                t_str = p.get("time")
-                if not t_str:
-                    continue
-                ts_utc = pd.to_datetime(t_str, utc=True).to_pydatetime()
-                ts = self._localize_timestamp(ts_utc)
-                rows.append({"timestamp": ts, "value": p.get("value")})
-
-            if not rows:
-                continue
-
-            df = pd.DataFrame(rows)
-            df.set_index("timestamp", inplace=True)
-            df.index.name = "timestamp"
-            txn_data.setdefault(txn, []).append(df)
-
-        # Merge DataFrames for same transaction (multi-node support, sum for throughput)
-        results: List[Dict[str, Any]] = []
-        for txn, dfs in txn_data.items():
-            if len(dfs) == 1:
-                merged = dfs[0]
-            else:
-                merged = pd.concat(dfs).groupby(level=0).sum()
-            results.append({"transaction": txn, "data": merged})
-
-        return results
+        # Series of the same transaction (multi-node) are summed for throughput
+        return self._query_per_req(query, agg_func="sum")
 
     def _fetch_max_active_users_stats(self, test_title: str, start: str, end: str) -> int:
         tag_key = getattr(self, "test_title_tag_name", "testTitle")
@@ -791,7 +859,7 @@ class InfluxdbV18(DataExtractionBase):
             try:
                 return int(round(points[0].get("value") or 0))
             except Exception:
-                return 0
+                return self._query_failed(0)
         return 0
 
     def _fetch_median_throughput_stats(self, test_title: str, start: str, end: str) -> int:
@@ -809,7 +877,7 @@ class InfluxdbV18(DataExtractionBase):
             try:
                 return int(round(points[0].get("value") or 0))
             except Exception:
-                return 0
+                return self._query_failed(0)
         return 0
 
     def _fetch_median_response_time_stats(self, test_title: str, start: str, end: str) -> float:
@@ -827,7 +895,7 @@ class InfluxdbV18(DataExtractionBase):
             try:
                 return round(float(points[0].get("value") or 0.0), 2)
             except Exception:
-                return 0.0
+                return self._query_failed(0.0)
         return 0.0
 
     def _fetch_pct90_response_time_stats(self, test_title: str, start: str, end: str) -> float:
@@ -845,7 +913,7 @@ class InfluxdbV18(DataExtractionBase):
             try:
                 return round(float(points[0].get("value") or 0.0), 2)
             except Exception:
-                return 0.0
+                return self._query_failed(0.0)
         return 0.0
 
     def _fetch_errors_pct_stats(self, test_title: str, start: str, end: str) -> float:
@@ -886,7 +954,7 @@ class InfluxdbV18(DataExtractionBase):
                 return 0.0
             return round(errors * 100.0 / total, 2)
         except Exception:
-            return 0.0
+            return self._query_failed(0.0)
 
     def _fetch_overview_data(self, test_title: str, start: str, end: str, aggregation: str = "median") -> Dict[str, Any]:
         """Fetch overview data using query class methods.
@@ -1255,12 +1323,14 @@ class InfluxdbV18(DataExtractionBase):
                 try:
                     # DROP SERIES FROM <measurement> WHERE <tag_key>='<test_title>'
                     query = f'DROP SERIES FROM "{measurement}" WHERE "{tag_key}"=\'{test_title}\''
-                    self.influxdb_connection.query(query)
+                    self.influxdb_connection.query(query, database=self.database)
                     logging.info(f"Deleted data from measurement '{measurement}' for test '{test_title}'")
                 except Exception as e:
                     # It's okay if a measurement doesn't exist
                     logging.debug(f"Could not delete from measurement '{measurement}': {e}")
 
+            DBTestCatalog.delete_entry(self.id, self._catalog_bucket(), test_title)
+            QueryResultCache.invalidate_test(QueryResultCache.get_scope_of(self), test_title)
             logging.info(f"Successfully deleted test data for '{test_title}'")
         except Exception as er:
             logging.error(f'ERROR: delete_test_data method failed for test "{test_title}"')
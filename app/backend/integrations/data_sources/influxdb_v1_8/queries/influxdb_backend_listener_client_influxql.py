@@ -61,6 +61,32 @@ class InfluxDBBackendListenerClientInfluxQL(BackEndQueriesBase):
             f'ORDER BY time DESC LIMIT 1'
         )
 
+    def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:  # type: ignore[override]
+        # Both statements are sent in one request; the client returns one
+        # result set per statement (start first, end second).
+        start_query = self.get_start_time(testTitle, bucket, test_title_tag_name)
+        end_query = self.get_end_time(testTitle, bucket, test_title_tag_name)
+        return f"{start_query}; {end_query}"
+
+    def get_test_catalog_delta(
+        self,
+        bucket: str,
+        test_title_tag_name: str,
+        since: str | None = None,
+        multi_node_tag: str | None = None,
+    ) -> str:  # type: ignore[override]
+        # Three statements in one request: first seen, last seen and peak
+        # threads per test (per node when multi_node_tag is set; the
+        # extraction layer sums the node peaks).
+        time_filter = f"time > '{since}'" if since else "time >= 0"
+        group_by = f'"{test_title_tag_name}"'
+        peak_group_by = f'{group_by}, "{multi_node_tag}"' if multi_node_tag else group_by
+        return (
+            f'SELECT FIRST("maxAT") FROM "{self.measurement}" WHERE {time_filter} GROUP BY {group_by}; '
+            f'SELECT LAST("maxAT") FROM "{self.measurement}" WHERE {time_filter} GROUP BY {group_by}; '
+            f'SELECT MAX("maxAT") FROM "{self.measurement}" WHERE {time_filter} GROUP BY {peak_group_by}'
+        )
+
     def get_custom_var(
         self,
         testTitle: str,
@@ -211,6 +237,39 @@ class InfluxDBBackendListenerClientInfluxQL(BackEndQueriesBase):
             f'WHERE {where} GROUP BY time({self.granularity_seconds}s) fill(0)'
         )
 
+    def get_overall_timeseries(
+        self,
+        testTitle: str,
+        start: str,
+        stop: str,
+        bucket: str,
+        test_title_tag_name: str,
+        regex: str,
+    ) -> str:  # type: ignore[override]
+        # One request for the aggregates of get_rps, the three response time queries and
+        # get_error_count; response times share their WHERE clause and a single scan
+        base_where = (
+            f'"{test_title_tag_name}" = \'{testTitle}\' '
+            f'AND time >= \'{start}\' AND time <= \'{stop}\''
+        )
+        regex_where = f' AND "transaction" =~ /{regex}/' if regex else ''
+        group_by = f'GROUP BY time({self.granularity_seconds}s) fill(0)'
+        rps_query = (
+            f'SELECT SUM("count")/{self.granularity_seconds} AS "overalThroughput" FROM "{self.measurement}" '
+            f'WHERE {base_where} AND "statut" = \'all\' AND "transaction" != \'all\'{regex_where} {group_by}'
+        )
+        response_time_query = (
+            f'SELECT MEAN("avg") AS "overalAvgResponseTime", '
+            f'MEAN("pct50.0") AS "overalMedianResponseTime", '
+            f'MEAN("pct90.0") AS "overal90PctResponseTime" FROM "{self.measurement}" '
+            f'WHERE {base_where} AND "statut" = \'all\'{regex_where} {group_by}'
+        )
+        errors_query = (
+            f'SELECT SUM("countError")/{self.granularity_seconds} AS "overalErrors" FROM "{self.measurement}" '
+            f'WHERE {base_where} {group_by}'
+        )
+        return f"{rps_query}; {response_time_query}; {errors_query}"
+
     # ------------------------------------------------------------------
     # Backend stats
     # ------------------------------------------------------------------
@@ -421,6 +480,36 @@ class InfluxDBBackendListenerClientInfluxQL(BackEndQueriesBase):
             f'GROUP BY "transaction"'
         )
 
+    def get_per_transaction_metrics(
+        self,
+        testTitle: str,
+        start: str,
+        stop: str,
+        bucket: str,
+        test_title_tag_name: str,
+        regex: str,
+    ) -> str:  # type: ignore[override]
+        # Counts and response times for all transactions in one scan, plus the failed
+        # request counts; rps and error rate are derived from count_all/count_ko
+        where = (
+            f'"{test_title_tag_name}" = \'{testTitle}\' '
+            f'AND "transaction" != \'all\' '
+            f'AND time >= \'{start}\' AND time <= \'{stop}\''
+        )
+        if regex:
+            where += f' AND "transaction" =~ /{regex}/'
+        group_by = f'GROUP BY time({self.granularity_seconds}s), "transaction" fill(0)'
+        metrics_query = (
+            f'SELECT SUM("count") AS "count_all", MEAN("avg") AS "rt_avg", '
+            f'PERCENTILE("pct50.0", 50) AS "rt_median", PERCENTILE("pct90.0", 90) AS "rt_p90" '
+            f'FROM "{self.measurement}" WHERE {where} AND "statut" = \'all\' {group_by}'
+        )
+        errors_query = (
+            f'SELECT SUM("count") AS "count_ko" FROM "{self.measurement}" '
+            f'WHERE {where} AND "statut" = \'ko\' {group_by}'
+        )
+        return f"{metrics_query}; {errors_query}"
+
     def get_average_response_time_per_req(
         self,
         testTitle: str,
@@ -80,6 +80,21 @@ class SitespeedInfluxQLQueries(FrontEndQueriesBase):
             f'ORDER BY time DESC LIMIT 1'
         )
 
+    def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:  # type: ignore[override]
+        # Both statements are sent in one request; the client returns one
+        # result set per statement (start first, end second).
+        start_query = self.get_start_time(testTitle, bucket, test_title_tag_name)
+        end_query = self.get_end_time(testTitle, bucket, test_title_tag_name)
+        return f"{start_query}; {end_query}"
+
+    def get_test_catalog_delta(self, bucket: str, test_title_tag_name: str, since: str | None = None) -> str:  # type: ignore[override]
+        # First and last LCP point per test; frontend tests have no thread count.
+        time_filter = f"time > '{since}'" if since else "time >= 0"
+        return (
+            f'SELECT FIRST("median") FROM "largestContentfulPaint" WHERE {time_filter} GROUP BY "{test_title_tag_name}"; '
+            f'SELECT LAST("median") FROM "largestContentfulPaint" WHERE {time_filter} GROUP BY "{test_title_tag_name}"'
+        )
+
     def get_custom_var(
         self,
         testTitle: str,
@@ -17,6 +17,7 @@ import logging
 
 from app.config import db
 from app.backend.pydantic_models import InfluxdbModel
+from app.backend.config_cache import cached_config, invalidates_config
 
 
 class DBInfluxdb(db.Model):
@@ -42,6 +43,7 @@ class DBInfluxdb(db.Model):
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
 
     @classmethod
+    @invalidates_config
     def save(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -65,6 +67,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_configs(cls, project_id):
         try:
             query = db.session.query(cls).filter_by(project_id=project_id).all()
@@ -78,6 +81,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_id(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
@@ -90,6 +94,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_default_config(cls, project_id, current_config_id=None):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, is_default=True).one_or_none()
@@ -102,6 +107,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def update(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -125,6 +131,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def reset_default_config(cls, project_id):
         try:
             db.session.query(cls).filter_by(project_id=project_id).update({cls.is_default: False})
@@ -144,6 +151,7 @@ class DBInfluxdb(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def delete(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
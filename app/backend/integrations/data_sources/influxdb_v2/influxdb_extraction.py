@@ -17,19 +17,21 @@ import pandas as pd
 
 from app.backend.integrations.data_sources.base_extraction import DataExtractionBase
 from app.backend.integrations.data_sources.base_queries import BackEndQueriesBase, FrontEndQueriesBase
+from app.backend.integrations.data_sources.client_pool import ClientPool
 from app.backend.integrations.data_sources.influxdb_v2.queries.influxdb_backend_listener_client import InfluxDBBackendListenerClientImpl
 from app.backend.integrations.data_sources.influxdb_v2.queries.sitespeed_influxdb_v2 import SitespeedFluxQueries
 from app.backend.integrations.data_sources.influxdb_v2.queries.meta import InfluxDBMetaQueries
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_db import DBInfluxdb
+from app.backend.integrations.data_sources.influxdb_v2.test_catalog_db import DBTestCatalog, DBTestCatalogState
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 from app.backend.components.secrets.secrets_db import DBSecrets
 from app.backend.components.settings.settings_service import SettingsService
 from app.backend.errors import ErrorMessages
 from influxdb_client import InfluxDBClient
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil import tz
-from typing import List, Dict, Any, Type, Optional
+from typing import List, Dict, Any, Type, Optional, Tuple
 from collections import defaultdict
-from datetime import timedelta
 
 
 class InfluxdbV2(DataExtractionBase):
@@ -46,6 +48,11 @@ class InfluxdbV2(DataExtractionBase):
         "sitespeed_influxdb_v2": SitespeedFluxQueries
     }
 
+    # Test catalog refresh: rescan this much before the high-water mark to pick up
+    # late points, and skip refreshes that are more recent than the interval.
+    catalog_refresh_overlap = timedelta(minutes=5)
+    catalog_refresh_interval = timedelta(seconds=30)
+
     def __init__(self, project, id=None):
         super().__init__(project)
         self.set_config(id)
@@ -101,12 +108,18 @@ class InfluxdbV2(DataExtractionBase):
 
     def _initialize_client(self):
         try:
-            self.influxdb_connection = InfluxDBClient(
-                url=self.url,
-                org=self.org_id,
-                token=self.token,
-                timeout=int(self.timeout),
-                verify_ssl=False,
+            # Clients are pooled per integration and reused while the connection settings are unchanged
+            config_hash = ClientPool.config_hash(self.url, self.org_id, self.token, int(self.timeout))
+            self.influxdb_connection = ClientPool.get_client(
+                "InfluxdbV2", self.id, config_hash,
+                lambda: InfluxDBClient(
+                    url=self.url,
+                    org=self.org_id,
+                    token=self.token,
+                    timeout=int(self.timeout),
+                    verify_ssl=False,
+                ),
+                max_concurrency=self.max_query_concurrency
             )
         except Exception as er:
             logging.error(ErrorMessages.ER00052.value.format(self.name))
@@ -122,6 +135,9 @@ class InfluxdbV2(DataExtractionBase):
 
     def _fetch_test_log(self, test_titles: list[str]) -> List[Dict[str, Any]]:
         """Fetch tests list with optional limit/offset."""
+        catalog_log = self._get_catalog_test_log(test_titles)
+        if catalog_log is not None:
+            return catalog_log
         try:
             start_time = self._fetch_start_time(test_titles[-1], "iso")
             end_time = self._fetch_end_time(test_titles[0], "iso")
@@ -159,7 +175,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00057.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _localize_timestamp(self, timestamp: datetime | None) -> datetime | None:
         """Convert timestamp to configured timezone, assuming UTC if naive."""
@@ -173,6 +189,12 @@ class InfluxdbV2(DataExtractionBase):
             return timestamp
 
     def _fetch_tests_titles(self, search: str = '') -> List[Dict[str, Any]]:
+        if self.refresh_test_catalog():
+            try:
+                entries = DBTestCatalog.get_entries(self.id, self.bucket, search=search)
+                return [{"test_title": entry["test_title"]} for entry in entries]
+            except Exception as er:
+                logging.warning(f"InfluxdbV2: test catalog lookup failed, querying bucket: {er}")
         try:
             if hasattr(self.queries, "get_tests_titles"):
                 query = self.queries.get_tests_titles(self.bucket, self.test_title_tag_name, search=search)
@@ -182,7 +204,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00057.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_aggregated_data(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         try:
@@ -191,7 +213,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00058.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_start_time(self, test_title: str, time_format: str) -> Any:
         try:
@@ -199,13 +221,7 @@ class InfluxdbV2(DataExtractionBase):
             flux_tables = self.influxdb_connection.query_api().query(query)
             for flux_table in flux_tables:
                 for flux_record in flux_table.records:
-                    if time_format == "human":
-                        return datetime.strftime(flux_record["_time"].astimezone(self.tmz_human), "%Y-%m-%d %I:%M:%S %p")
-                    elif time_format == "iso":
-                        start_time_dt = flux_record["_time"] - timedelta(seconds=30)
-                        return datetime.strftime(start_time_dt, "%Y-%m-%dT%H:%M:%SZ")
-                    elif time_format == "timestamp":
-                        return int(flux_record["_time"].astimezone(self.tmz_utc).timestamp() * 1000)
+                    return self._format_time_bound(flux_record["_time"], time_format, shift_seconds=-30)
 
             logging.warning(
                 "InfluxdbV2: no start time found for test '%s' (bucket=%s, listener=%s)",
@@ -216,7 +232,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00059.value.format(self.name))
             logging.error(er)
-            return None
+            return self._query_failed(None)
 
         return None
 
@@ -226,13 +242,7 @@ class InfluxdbV2(DataExtractionBase):
             flux_tables = self.influxdb_connection.query_api().query(query)
             for flux_table in flux_tables:
                 for flux_record in flux_table.records:
-                    if time_format == "human":
-                        return datetime.strftime(flux_record["_time"].astimezone(self.tmz_human), "%Y-%m-%d %I:%M:%S %p")
-                    elif time_format == "iso":
-                        end_time_dt = flux_record["_time"] + timedelta(seconds=30)
-                        return datetime.strftime(end_time_dt, "%Y-%m-%dT%H:%M:%SZ")
-                    elif time_format == "timestamp":
-                        return int(flux_record["_time"].astimezone(self.tmz_utc).timestamp() * 1000)
+                    return self._format_time_bound(flux_record["_time"], time_format, shift_seconds=30)
 
             logging.warning(
                 "InfluxdbV2: no end time found for test '%s' (bucket=%s, listener=%s)",
@@ -243,10 +253,112 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00060.value.format(self.name))
             logging.error(er)
-            return None
+            return self._query_failed(None)
 
         return None
 
+    def _fetch_test_time_bounds(self, test_title: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        entry = self._get_catalog_entry(test_title)
+        if entry:
+            return entry["start_time"], entry["end_time"]
+        try:
+            query = self.queries.get_test_time_bounds(test_title, self.bucket, self.test_title_tag_name)
+            flux_tables = self.influxdb_connection.query_api().query(query)
+            bounds = {}
+            for flux_table in flux_tables:
+                for flux_record in flux_table.records:
+                    bounds[flux_record["bound"]] = flux_record["_time"]
+
+            if "start" not in bounds or "end" not in bounds:
+                logging.warning(
+                    "InfluxdbV2: no time bounds found for test '%s' (bucket=%s, listener=%s)",
+                    test_title,
+                    self.bucket,
+                    self.listener,
+                )
+            return bounds.get("start"), bounds.get("end")
+        except Exception as er:
+            logging.error(ErrorMessages.ER00059.value.format(self.name))
+            logging.error(er)
+            return self._query_failed((None, None))
+
+    def refresh_test_catalog(self, force: bool = False) -> bool:
+        """
+        Merge tests seen since the catalog high-water mark into the test catalog.
+        The first refresh of a bucket scans its whole history; later refreshes
+        only scan data newer than the mark (minus a small overlap).
+        :param force: Refresh even if the last refresh is more recent than the interval.
+        :return: True if the catalog is up to date and can be used for lookups.
+        """
+        if self.queries is None or not getattr(self, "id", None):
+            return False
+        try:
+            now = datetime.now(tz=self.tmz_utc)
+            high_water_mark = DBTestCatalogState.get_high_water_mark(self.id, self.bucket)
+            if high_water_mark is not None and not force and now - high_water_mark < self.catalog_refresh_interval:
+                return True
+
+            since = None
+            if high_water_mark is not None:
+                since = (high_water_mark - self.catalog_refresh_overlap).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+            if isinstance(self.queries, BackEndQueriesBase):
+                query = self.queries.get_test_catalog_delta(self.bucket, self.test_title_tag_name, since=since, multi_node_tag=self.multi_node_tag)
+            else:
+                query = self.queries.get_test_catalog_delta(self.bucket, self.test_title_tag_name, since=since)
+
+            entries = {}
+            for record in self._execute_query(query):
+                title = record.get("test_title")
+                if not title:
+                    continue
+                entry = entries.setdefault(title, {"test_title": title, "max_threads": None})
+                stat = record.get("stat")
+                if stat in ("start", "end"):
+                    entry[f"{stat}_time"] = record.get("_time")
+                elif stat == "max_threads" and record.get("_value") is not None:
+                    entry["max_threads"] = int(round(record["_value"]))
+
+            complete = [e for e in entries.values() if e.get("start_time") and e.get("end_time")]
+            if complete:
+                DBTestCatalog.upsert_entries(self.project, self.id, self.bucket, self.listener, complete)
+            DBTestCatalogState.set_high_water_mark(self.project, self.id, self.bucket, now)
+            return True
+        except Exception as er:
+            logging.warning(f"InfluxdbV2: test catalog refresh failed for {self.name}: {er}")
+            return False
+
+    def _get_catalog_entry(self, test_title: str) -> Optional[Dict[str, Any]]:
+        if not self.refresh_test_catalog():
+            return None
+        try:
+            return DBTestCatalog.get_entry(self.id, self.bucket, test_title)
+        except Exception as er:
+            logging.warning(f"InfluxdbV2: test catalog lookup failed for '{test_title}': {er}")
+            return None
+
+    def _get_catalog_test_log(self, test_titles: list[str]) -> Optional[List[Dict[str, Any]]]:
+        """Build the test log from the catalog; None if any title is not cataloged."""
+        if not test_titles or not self.refresh_test_catalog():
+            return None
+        try:
+            entries = DBTestCatalog.get_entries(self.id, self.bucket, test_titles=test_titles)
+        except Exception as er:
+            logging.warning(f"InfluxdbV2: test catalog lookup failed: {er}")
+            return None
+        if len(entries) < len(set(test_titles)):
+            return None
+        return [
+            {
+                "test_title": entry["test_title"],
+                "start_time": self._localize_timestamp(entry["start_time"]),
+                "end_time": self._localize_timestamp(entry["end_time"]),
+                "duration": int((entry["end_time"] - entry["start_time"]).total_seconds()),
+                "max_threads": entry["max_threads"] if entry["max_threads"] is not None else 1,
+            }
+            for entry in entries
+        ]
+
     def _fetch_custom_var(self, test_title: str, custom_var: str, start: str, end: str) -> Any:
         try:
             query = self.queries.get_custom_var(test_title, custom_var, start, end, self.bucket, self.test_title_tag_name)
@@ -257,18 +369,17 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00076.value.format(self.name))
             logging.error(er)
-            return None
+            return self._query_failed(None)
 
     def _fetch_rps(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
             query = self.queries.get_rps(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00063.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
 
     def _fetch_active_threads(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
@@ -277,101 +388,119 @@ class InfluxdbV2(DataExtractionBase):
                 query = self.queries.get_active_threads(test_title, start, end, self.bucket, self.test_title_tag_name, self.multi_node_tag)
             else:
                 return pd.DataFrame()
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00064.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
 
     def _fetch_average_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
             query = self.queries.get_average_response_time(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00065.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
 
     def _fetch_median_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
             query = self.queries.get_median_response_time(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00066.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
 
     def _fetch_pct90_response_time(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
             query = self.queries.get_pct90_response_time(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00067.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
 
     def _fetch_error_count(self, test_title: str, start: str, end: str) -> pd.DataFrame:
         try:
             query = self.queries.get_error_count(test_title, start, end, self.bucket, self.test_title_tag_name)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            df = self.process_data(flux_tables)
+            df = self.process_data(self._query_data_frame(query))
             return df
         except Exception as er:
             logging.error(ErrorMessages.ER00068.value.format(self.name))
             logging.error(er)
-            return pd.DataFrame()
+            return self._query_failed(pd.DataFrame())
+
+    def _fetch_overall_timeseries(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        if not isinstance(self.queries, BackEndQueriesBase):
+            return None
+        try:
+            query = self.queries.get_overall_timeseries(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
+            data = self._query_data_frame(query)
+            columns = list(self.overall_timeseries_columns)
+            if data.empty or '_time' not in data.columns:
+                return pd.DataFrame(columns=columns, dtype=float).set_index(pd.Index([], name='timestamp'))
+            df = data.reindex(columns=columns).astype(float)
+            df.index = pd.Index(self._localize_series(data['_time']), name='timestamp')
+            return df
+        except Exception as er:
+            logging.warning(f"InfluxdbV2: combined overall time series query failed, using per-metric queries: {er}")
+            return self._query_failed(None)
+
+    def _fetch_per_transaction_metrics(self, test_title: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        if not isinstance(self.queries, BackEndQueriesBase):
+            return None
+        try:
+            query = self.queries.get_per_transaction_metrics(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
+            data = self._query_data_frame(query)
+            return self._per_transaction_frame_from_records(data, '_time', self.queries.granularity_seconds)
+        except Exception as er:
+            logging.warning(f"InfluxdbV2: combined per-transaction query failed, using per-request queries: {er}")
+            return self._query_failed(None)
 
     def _fetch_average_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         try:
             query = self.queries.get_average_response_time_per_req(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            result = self.transform_flux_tables_to_dict(flux_tables)
+            result = self.transform_flux_tables_to_dict(self._query_data_frame(query))
             return result
         except Exception as er:
             logging.error(ErrorMessages.ER00069.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_median_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         try:
             query = self.queries.get_median_response_time_per_req(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            result = self.transform_flux_tables_to_dict(flux_tables)
+            result = self.transform_flux_tables_to_dict(self._query_data_frame(query))
             return result
         except Exception as er:
             logging.error(ErrorMessages.ER00070.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_pct90_response_time_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         try:
             query = self.queries.get_pct90_response_time_per_req(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            result = self.transform_flux_tables_to_dict(flux_tables)
+            result = self.transform_flux_tables_to_dict(self._query_data_frame(query))
             return result
         except Exception as er:
             logging.error(ErrorMessages.ER00071.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_throughput_per_req(self, test_title: str, start: str, end: str) -> List[Dict[str, Any]]:
         try:
             query = self.queries.get_throughput_per_req(test_title, start, end, self.bucket, self.test_title_tag_name, self.regex)
-            flux_tables = self.influxdb_connection.query_api().query(query)
-            result = self.transform_flux_tables_to_dict(flux_tables)
+            result = self.transform_flux_tables_to_dict(self._query_data_frame(query))
             return result
         except Exception as er:
             logging.error(ErrorMessages.ER00072.value.format(self.name))
             logging.error(er)
-            return []
+            return self._query_failed([])
 
     def _fetch_max_active_users_stats(self, test_title: str, start: str, end: str) -> int:
         try:
@@ -384,7 +513,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00061.value.format(self.name))
             logging.error(er)
-            return 0
+            return self._query_failed(0)
 
     def _fetch_median_throughput_stats(self, test_title: str, start: str, end: str) -> int:
         try:
@@ -397,7 +526,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00074.value.format(self.name))
             logging.error(er)
-            return 0
+            return self._query_failed(0)
 
     def _fetch_median_response_time_stats(self, test_title: str, start: str, end: str) -> float:
         try:
@@ -410,7 +539,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00075.value.format(self.name))
             logging.error(er)
-            return 0.0
+            return self._query_failed(0.0)
 
     def _fetch_pct90_response_time_stats(self, test_title: str, start: str, end: str) -> float:
         try:
@@ -423,7 +552,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00075.value.format(self.name))
             logging.error(er)
-            return 0.0
+            return self._query_failed(0.0)
 
     def _fetch_errors_pct_stats(self, test_title: str, start: str, end: str) -> float:
         try:
@@ -436,7 +565,7 @@ class InfluxdbV2(DataExtractionBase):
         except Exception as er:
             logging.error(ErrorMessages.ER00075.value.format(self.name))
             logging.error(er)
-            return 0.0
+            return self._query_failed(0.0)
 
     def delete_test_data(self, test_title, start = None, end = None):
         if start is None:
@@ -461,6 +590,8 @@ class InfluxdbV2(DataExtractionBase):
             predicate = f'{tag_key}="{test_title}"'
             logging.debug("InfluxdbV2 delete_test_data predicate=%s org=%s", predicate, getattr(self, "org_id", None))
             self.influxdb_connection.delete_api().delete(start, end, predicate, bucket=self.bucket, org=self.org_id)
+            DBTestCatalog.delete_entry(self.id, self.bucket, test_title)
+            QueryResultCache.invalidate_test(QueryResultCache.get_scope_of(self), test_title)
             logging.info("InfluxdbV2 delete_test_data completed for test_title=%s", test_title)
         except Exception as er:
             logging.warning('ERROR: delete_test_data method failed')
@@ -505,7 +636,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting overview table: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     # ===================================================================
     # Frontend metrics extraction methods
@@ -537,7 +668,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting Google Web Vitals: {str(e)}")
-            return []
+            return self._query_failed([])
 
     def _fetch_timings_fully_loaded(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> List[Dict[str, Any]]:
         """
@@ -565,7 +696,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting fully loaded timings: {str(e)}")
-            return []
+            return self._query_failed([])
 
     def _fetch_timings_page_timings(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> List[Dict[str, Any]]:
         """
@@ -593,7 +724,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting page timings: {str(e)}")
-            return []
+            return self._query_failed([])
 
     def _fetch_timings_main_document(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -621,7 +752,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting main document timings: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_cpu_long_tasks(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -649,7 +780,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting CPU long tasks: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_cdp_performance_js_heap_used_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -677,7 +808,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting JS heap used size: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_cdp_performance_js_heap_total_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -705,7 +836,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting JS heap total size: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_count_per_content_type(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -733,7 +864,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting content types: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_first_party_transfer_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -761,7 +892,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting first party content types: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     def _fetch_third_party_transfer_size(self, test_title: str, start: str, end: str, aggregation: str = 'median') -> Dict[str, Any]:
         """
@@ -789,7 +920,7 @@ class InfluxdbV2(DataExtractionBase):
             return records
         except Exception as e:
             logging.error(f"Error getting third party content types: {str(e)}")
-            return {}
+            return self._query_failed({})
 
     # ===================================================================
     # HELPER FUNCTIONS
@@ -832,15 +963,33 @@ class InfluxdbV2(DataExtractionBase):
             logging.error(f"Error listing buckets for {self.name}: {er}")
             return []
 
-    def process_data(self, flux_tables):
-        data = []
-        for flux_table in flux_tables:
-            for flux_record in flux_table:
-                timestamp = self._localize_timestamp(flux_record['_time'])
-                value = flux_record['_value']
-                data.append({'timestamp': timestamp, 'value': value})
+    def _query_data_frame(self, query: str) -> pd.DataFrame:
+        """
+        Run a Flux query and decode all result tables into one DataFrame.
 
-        df = pd.DataFrame(data, columns=['timestamp', 'value'])
+        Uses the client's columnar CSV decoder instead of building a FluxRecord
+        per row; the 'result' and 'table' bookkeeping columns are dropped.
+        """
+        result = self.influxdb_connection.query_api().query_data_frame(query)
+        if isinstance(result, list):
+            result = pd.concat(result, ignore_index=True) if result else pd.DataFrame()
+        return result.drop(columns=['result', 'table'], errors='ignore')
+
+    def _localize_series(self, times: pd.Series) -> pd.Series:
+        """Vectorized _localize_timestamp: convert to the configured timezone, assuming UTC if naive."""
+        times = pd.to_datetime(times, utc=True)
+        try:
+            return times.dt.tz_convert(self._target_tz)
+        except Exception:
+            return times
+
+    def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        if data.empty or '_time' not in data.columns:
+            return pd.DataFrame(columns=['value']).set_index(pd.Index([], name='timestamp'))
+        df = pd.DataFrame({
+            'timestamp': self._localize_series(data['_time']),
+            'value': data['_value'] if '_value' in data.columns else None
+        })
         df.set_index('timestamp', inplace=True)
         return df
 
@@ -869,29 +1018,22 @@ class InfluxdbV2(DataExtractionBase):
         return json_result
 
 
-    def transform_flux_tables_to_dict(self, flux_tables) -> List[Dict[str, Any]]:
+    def transform_flux_tables_to_dict(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
         """
-        Transform flux_tables to a list of dictionaries with 'transaction' and 'data' (DataFrame with 'timestamp' and 'value').
-        :param flux_tables: The flux tables to transform.
+        Split a decoded per-transaction result into a list of dictionaries with 'transaction' and 'data' (DataFrame with 'timestamp' and 'value').
+        :param data: The decoded query result (see _query_data_frame).
         :return: A list of dictionaries with 'transaction' and 'data' (DataFrame with 'timestamp' and 'value').
         """
-        data_dict = {}
-
-        for flux_table in flux_tables:
-            for flux_record in flux_table:
-                timestamp = self._localize_timestamp(flux_record['_time'])
-                value = flux_record['_value']
-                transaction = flux_record['transaction']
-
-                if transaction not in data_dict:
-                    data_dict[transaction] = []
-
-                data_dict[transaction].append({'timestamp': timestamp, 'value': value})
+        if data.empty or 'transaction' not in data.columns:
+            return []
 
-        result = []
-        for transaction, records in data_dict.items():
-            df = pd.DataFrame(records)
-            df.set_index('timestamp', inplace=True)
-            result.append({'transaction': transaction, 'data': df})
+        frame = pd.DataFrame({
+            'timestamp': self._localize_series(data['_time']),
+            'value': data['_value'],
+            'transaction': data['transaction']
+        }).set_index('timestamp')
 
-        return result
+        return [
+            {'transaction': transaction, 'data': group[['value']]}
+            for transaction, group in frame.groupby('transaction', sort=False, dropna=False)
+        ]
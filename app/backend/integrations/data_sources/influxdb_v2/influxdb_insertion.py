@@ -39,6 +39,8 @@ from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
 
 from app.backend.integrations.data_sources.influxdb_v2.influxdb_db import DBInfluxdb
+from app.backend.integrations.data_sources.influxdb_v2.test_catalog_db import DBTestCatalog
+from app.backend.integrations.data_sources.query_cache import QueryResultCache
 from app.backend.components.secrets.secrets_db import DBSecrets
 from app.backend.errors import ErrorMessages
 from app.backend.integrations.data_sources.base_insertion import DataInsertionBase
@@ -395,6 +397,21 @@ class InfluxdbV2Insertion(DataInsertionBase):
                 # Non-fatal: preserve original write error
                 pass
             raise
+
+        # Results cached for an earlier upload of the same title are stale now
+        QueryResultCache.invalidate_test(QueryResultCache.get_scope_of(self), test_title)
+
+        # Uploaded data is usually older than the catalog high-water mark, so
+        # incremental refreshes would never see it; record it directly.
+        try:
+            DBTestCatalog.upsert_entries(self.project, self.id, self.bucket, self.listener, [{
+                "test_title": test_title,
+                "start_time": idx.min().to_pydatetime(),
+                "end_time": idx.max().to_pydatetime(),
+                "max_threads": int(at_max.max()),
+            }])
+        except Exception as er:
+            logging.warning(f"Failed to update test catalog for '{test_title}': {er}")
         return {"points_written": written}
 
     # -------------------- Internals --------------------
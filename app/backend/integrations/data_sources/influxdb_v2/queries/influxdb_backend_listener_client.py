@@ -160,6 +160,65 @@ class InfluxDBBackendListenerClientImpl(BackEndQueriesBase):
       |> keep(columns: ["_time"])
       |> max(column: "_time")'''
 
+  def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: 0, stop: now())
+      |> filter(fn: (r) => r["_measurement"] == "jmeter")
+      |> filter(fn: (r) => r["_field"] == "maxAT")
+      |> filter(fn: (r) => r["{test_title_tag_name}"] == "{testTitle}")
+      |> keep(columns: ["_time"])
+      |> group()
+
+    start_time = data
+      |> min(column: "_time")
+      |> set(key: "bound", value: "start")
+
+    end_time = data
+      |> max(column: "_time")
+      |> set(key: "bound", value: "end")
+
+    union(tables: [start_time, end_time])'''
+
+  def get_test_catalog_delta(self, bucket: str, test_title_tag_name: str, since: str | None = None, multi_node_tag: str = None) -> str:
+      # Per-test first/last timestamp and peak threads for data newer than `since`
+      if multi_node_tag:
+          peak_threads = f'''data
+      |> filter(fn: (r) => exists r["{multi_node_tag}"])
+      |> group(columns: ["{test_title_tag_name}", "{multi_node_tag}"])
+      |> max()
+      |> group(columns: ["{test_title_tag_name}"])
+      |> sum()'''
+      else:
+          peak_threads = f'''data
+      |> group(columns: ["{test_title_tag_name}"])
+      |> max()'''
+
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: {since or 0}, stop: now())
+      |> filter(fn: (r) => r["_measurement"] == "jmeter")
+      |> filter(fn: (r) => r["_field"] == "maxAT")
+      |> filter(fn: (r) => exists r["{test_title_tag_name}"])
+
+    start_time = data
+      |> group(columns: ["{test_title_tag_name}"])
+      |> min(column: "_time")
+      |> keep(columns: ["_time", "{test_title_tag_name}"])
+      |> set(key: "stat", value: "start")
+
+    end_time = data
+      |> group(columns: ["{test_title_tag_name}"])
+      |> max(column: "_time")
+      |> keep(columns: ["_time", "{test_title_tag_name}"])
+      |> set(key: "stat", value: "end")
+
+    max_threads = {peak_threads}
+      |> keep(columns: ["_value", "{test_title_tag_name}"])
+      |> set(key: "stat", value: "max_threads")
+
+    union(tables: [start_time, end_time, max_threads])
+      |> group()
+      |> rename(columns: {{{test_title_tag_name}: "test_title"}})'''
+
   def get_aggregated_data(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str, multi_node_tag: str = None) -> str:
       return f'''import "join"
             rpm_set = from(bucket: "{bucket}")
@@ -375,6 +434,111 @@ class InfluxDBBackendListenerClientImpl(BackEndQueriesBase):
       |> aggregateWindow(every: {self.granularity_seconds}s, fn: sum, createEmpty: true)
       |> set(key: "_field", value: "Errors Per Second")'''
 
+  def get_overall_timeseries(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
+      # Same aggregates as get_rps, get_average_response_time, get_median_response_time,
+      # get_pct90_response_time and get_error_count, computed from one scan and pivoted
+      # into one row per window
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: {start}, stop: {stop})
+      |> filter(fn: (r) => r._measurement == "jmeter")
+      |> filter(fn: (r) => r["{test_title_tag_name}"] == "{testTitle}")
+      |> filter(fn: (r) => r._field == "count" or r._field == "avg" or r._field == "pct50.0" or r._field == "pct90.0" or r._field == "countError")
+
+      rps = data
+      |> filter(fn: (r) => r._field == "count" and r["statut"] == "all" and r["transaction"] != "all")
+      {f'|> filter(fn: (r) => r.transaction =~ /{regex}/)' if regex else ''}
+      |> keep(columns: ["_field", "_value", "_time"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: sum, createEmpty: false)
+      |> map(fn: (r) => ({{ r with _value: float(v: r._value / float(v: {self.granularity_seconds}))}}))
+      |> set(key: "_field", value: "overalThroughput")
+
+      avg = data
+      |> filter(fn: (r) => r._field == "avg" and r["statut"] == "all")
+      {f'|> filter(fn: (r) => r.transaction =~ /{regex}/)' if regex else ''}
+      |> group(columns: ["_field"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: mean, createEmpty: false)
+      |> set(key: "_field", value: "overalAvgResponseTime")
+
+      median = data
+      |> filter(fn: (r) => r._field == "pct50.0" and r["statut"] == "all")
+      {f'|> filter(fn: (r) => r.transaction =~ /{regex}/)' if regex else ''}
+      |> group(columns: ["_field"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: median, createEmpty: false)
+      |> set(key: "_field", value: "overalMedianResponseTime")
+
+      pct90 = data
+      |> filter(fn: (r) => r._field == "pct90.0" and r["statut"] == "all")
+      {f'|> filter(fn: (r) => r.transaction =~ /{regex}/)' if regex else ''}
+      |> group(columns: ["_field"])
+      |> aggregateWindow(
+      every: {self.granularity_seconds}s,
+      fn: (tables=<-, column) =>
+      tables
+          |> quantile(q: 0.90, method: "exact_selector"),
+      createEmpty: false)
+      |> toFloat()
+      |> set(key: "_field", value: "overal90PctResponseTime")
+
+      errors = data
+      |> filter(fn: (r) => r._field == "countError")
+      |> group(columns: ["_field"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: sum, createEmpty: true)
+      |> map(fn: (r) => ({{ r with _value: if exists r._value then float(v: r._value) else 0.0 }}))
+      |> set(key: "_field", value: "overalErrors")
+
+      union(tables: [rps, avg, median, pct90, errors])
+      |> keep(columns: ["_field", "_value", "_time"])
+      |> group()
+      |> pivot(rowKey: ["_time"], columnKey: ["_field"], valueColumn: "_value")
+      |> sort(columns: ["_time"])'''
+
+  def get_per_transaction_metrics(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
+      # Request counts (all/ko) and response times per transaction and window, pivoted into
+      # one row per (_time, transaction); rps and error rate are derived from the counts
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: {start}, stop: {stop})
+      |> filter(fn: (r) => r._measurement == "jmeter")
+      |> filter(fn: (r) => r["{test_title_tag_name}"] == "{testTitle}")
+      |> filter(fn: (r) => r._field == "count" or r._field == "avg" or r._field == "pct50.0" or r._field == "pct90.0")
+      |> filter(fn: (r) => r["statut"] == "all" or (r["statut"] == "ko" and r._field == "count"))
+      {f'|> filter(fn: (r) => r.transaction =~ /{regex}/)' if regex else ''}
+
+      counts = data
+      |> filter(fn: (r) => r._field == "count")
+      |> group(columns: ["transaction", "statut"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: sum, createEmpty: false)
+      |> toFloat()
+      |> map(fn: (r) => ({{ r with _field: "count_" + r.statut }}))
+
+      rt_avg = data
+      |> filter(fn: (r) => r._field == "avg" and r["statut"] == "all")
+      |> group(columns: ["transaction"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: mean, createEmpty: false)
+      |> set(key: "_field", value: "rt_avg")
+
+      rt_median = data
+      |> filter(fn: (r) => r._field == "pct50.0" and r["statut"] == "all")
+      |> group(columns: ["transaction"])
+      |> aggregateWindow(every: {self.granularity_seconds}s, fn: median, createEmpty: false)
+      |> set(key: "_field", value: "rt_median")
+
+      rt_p90 = data
+      |> filter(fn: (r) => r._field == "pct90.0" and r["statut"] == "all")
+      |> group(columns: ["transaction"])
+      |> aggregateWindow(
+          every: {self.granularity_seconds}s,
+          fn: (tables=<-, column) =>
+              tables
+              |> quantile(q: 0.90, method: "exact_selector"),
+          createEmpty: false)
+      |> toFloat()
+      |> set(key: "_field", value: "rt_p90")
+
+      union(tables: [counts, rt_avg, rt_median, rt_p90])
+      |> keep(columns: ["_time", "transaction", "_field", "_value"])
+      |> group()
+      |> pivot(rowKey: ["_time", "transaction"], columnKey: ["_field"], valueColumn: "_value")'''
+
   def get_average_response_time_per_req(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, regex: str) -> str:
       return f'''from(bucket: "{bucket}")
       |> range(start: {start}, stop: {stop})
@@ -109,6 +109,48 @@ class SitespeedFluxQueries(FrontEndQueriesBase):
       |> keep(columns: ["_time"])
       |> max(column: "_time")'''
 
+  def get_test_time_bounds(self, testTitle: str, bucket: str, test_title_tag_name: str) -> str:
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: 0, stop: now())
+      |> filter(fn: (r) => r["_measurement"] == "largestContentfulPaint")
+      |> filter(fn: (r) => r["_field"] == "median")
+      |> filter(fn: (r) => r["{test_title_tag_name}"] == "{testTitle}")
+      |> keep(columns: ["_time"])
+      |> group()
+
+    start_time = data
+      |> min(column: "_time")
+      |> set(key: "bound", value: "start")
+
+    end_time = data
+      |> max(column: "_time")
+      |> set(key: "bound", value: "end")
+
+    union(tables: [start_time, end_time])'''
+
+  def get_test_catalog_delta(self, bucket: str, test_title_tag_name: str, since: str | None = None) -> str:
+      # Per-test first/last timestamp for data newer than `since`; frontend tests have no thread count
+      return f'''data = from(bucket: "{bucket}")
+      |> range(start: {since or 0}, stop: now())
+      |> filter(fn: (r) => r["_measurement"] == "largestContentfulPaint")
+      |> filter(fn: (r) => r["_field"] == "median")
+      |> filter(fn: (r) => exists r["{test_title_tag_name}"])
+      |> group(columns: ["{test_title_tag_name}"])
+
+    start_time = data
+      |> min(column: "_time")
+      |> keep(columns: ["_time", "{test_title_tag_name}"])
+      |> set(key: "stat", value: "start")
+
+    end_time = data
+      |> max(column: "_time")
+      |> keep(columns: ["_time", "{test_title_tag_name}"])
+      |> set(key: "stat", value: "end")
+
+    union(tables: [start_time, end_time])
+      |> group()
+      |> rename(columns: {{{test_title_tag_name}: "test_title"}})'''
+
   def get_google_web_vitals(self, testTitle: str, start: int, stop: int, bucket: str, test_title_tag_name: str, aggregation: str = 'median', regex: str = '') -> str:
       query = f'''from(bucket: "{bucket}")
       |> range(start: {start}, stop: {stop})
@@ -0,0 +1,218 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test catalog persisted next to the InfluxDB integrations.
+
+The catalog keeps one row per (integration, bucket, test title) with the first
+and last timestamp and the peak number of threads, so test lists and report
+setup are answered from SQL instead of full-history InfluxDB scans. A per
+bucket high-water mark records up to which point the catalog has been
+refreshed; later refreshes only scan data newer than that mark.
+
+Timestamps are stored as naive UTC and returned as timezone-aware UTC.
+"""
+
+import re
+import traceback
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import db
+from app.backend.pydantic_models import TestCatalogModel
+
+
+def _to_db_time(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _from_db_time(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc)
+
+
+class DBTestCatalog(db.Model):
+    __tablename__ = 'test_catalog'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    influxdb_id = db.Column(db.Integer, db.ForeignKey('influxdb.id', ondelete='CASCADE'), nullable=False)
+    bucket = db.Column(db.String(120), nullable=False, default='')
+    test_title = db.Column(db.String(500), nullable=False)
+    listener = db.Column(db.String(120), nullable=False)
+    start_time = db.Column(db.DateTime, nullable=False)
+    end_time = db.Column(db.DateTime, nullable=False)
+    max_threads = db.Column(db.Integer)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('influxdb_id', 'bucket', 'test_title', name='uq_test_catalog_source_title'),
+        db.Index('ix_test_catalog_source_start', 'influxdb_id', 'bucket', 'start_time'),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'project_id': self.project_id,
+            'influxdb_id': self.influxdb_id,
+            'bucket': self.bucket,
+            'test_title': self.test_title,
+            'listener': self.listener,
+            'start_time': _from_db_time(self.start_time),
+            'end_time': _from_db_time(self.end_time),
+            'max_threads': self.max_threads,
+        }
+
+    @classmethod
+    def upsert_entries(cls, project_id: int, influxdb_id: int, bucket: str, listener: str, entries: List[Dict[str, Any]]) -> int:
+        """
+        Merge observed test spans into the catalog in a single transaction.
+
+        Each entry needs test_title, start_time and end_time; max_threads is
+        optional. Existing rows are widened (earliest start, latest end, peak
+        threads) so partial scans can be merged safely.
+
+        Returns:
+            Number of entries merged
+        """
+        try:
+            merged = 0
+            for entry in entries:
+                validated_data = TestCatalogModel(
+                    project_id=project_id,
+                    influxdb_id=influxdb_id,
+                    bucket=bucket or '',
+                    listener=listener,
+                    **entry
+                )
+                start_time = _to_db_time(validated_data.start_time)
+                end_time = _to_db_time(validated_data.end_time)
+                row = db.session.query(cls).filter_by(
+                    influxdb_id=influxdb_id,
+                    bucket=validated_data.bucket,
+                    test_title=validated_data.test_title
+                ).one_or_none()
+                if row is None:
+                    row = cls(
+                        project_id=project_id,
+                        influxdb_id=influxdb_id,
+                        bucket=validated_data.bucket,
+                        test_title=validated_data.test_title,
+                        listener=listener,
+                        start_time=start_time,
+                        end_time=end_time,
+                        max_threads=validated_data.max_threads
+                    )
+                    db.session.add(row)
+                else:
+                    row.start_time = min(row.start_time, start_time)
+                    row.end_time = max(row.end_time, end_time)
+                    if validated_data.max_threads is not None:
+                        row.max_threads = max(row.max_threads or 0, validated_data.max_threads)
+                    row.listener = listener
+                merged += 1
+            db.session.commit()
+            return merged
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def get_entry(cls, influxdb_id: int, bucket: str, test_title: str) -> Optional[Dict[str, Any]]:
+        try:
+            row = db.session.query(cls).filter_by(
+                influxdb_id=influxdb_id,
+                bucket=bucket or '',
+                test_title=test_title
+            ).one_or_none()
+            return row.to_dict() if row else None
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def get_entries(cls, influxdb_id: int, bucket: str, search: str = '', test_titles: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Return catalog rows for a source, newest test first."""
+        try:
+            query = db.session.query(cls).filter_by(influxdb_id=influxdb_id, bucket=bucket or '')
+            if test_titles is not None:
+                query = query.filter(cls.test_title.in_(test_titles))
+            entries = [row.to_dict() for row in query.order_by(cls.start_time.desc()).all()]
+            if search:
+                # Same case-insensitive regex semantics as the InfluxDB title queries
+                try:
+                    pattern = re.compile(search, re.IGNORECASE)
+                    entries = [e for e in entries if pattern.search(e['test_title'])]
+                except re.error:
+                    entries = [e for e in entries if search.lower() in e['test_title'].lower()]
+            return entries
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def delete_entry(cls, influxdb_id: int, bucket: str, test_title: str) -> None:
+        try:
+            db.session.query(cls).filter_by(
+                influxdb_id=influxdb_id,
+                bucket=bucket or '',
+                test_title=test_title
+            ).delete()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+
+class DBTestCatalogState(db.Model):
+    __tablename__ = 'test_catalog_state'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    influxdb_id = db.Column(db.Integer, db.ForeignKey('influxdb.id', ondelete='CASCADE'), nullable=False)
+    bucket = db.Column(db.String(120), nullable=False, default='')
+    scanned_until = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('influxdb_id', 'bucket', name='uq_test_catalog_state_source'),
+    )
+
+    @classmethod
+    def get_high_water_mark(cls, influxdb_id: int, bucket: str) -> Optional[datetime]:
+        try:
+            row = db.session.query(cls).filter_by(influxdb_id=influxdb_id, bucket=bucket or '').one_or_none()
+            return _from_db_time(row.scanned_until) if row else None
+        except Exception:
+            logging.warning(str(traceback.format_exc()))
+            raise
+
+    @classmethod
+    def set_high_water_mark(cls, project_id: int, influxdb_id: int, bucket: str, scanned_until: datetime) -> None:
+        try:
+            row = db.session.query(cls).filter_by(influxdb_id=influxdb_id, bucket=bucket or '').one_or_none()
+            if row is None:
+                row = cls(project_id=project_id, influxdb_id=influxdb_id, bucket=bucket or '')
+                db.session.add(row)
+            row.scanned_until = _to_db_time(scanned_until)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logging.warning(str(traceback.format_exc()))
+            raise
@@ -0,0 +1,230 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Query Result Cache - read-through cache for data source queries of finished tests.
+
+Once a test has finished, its data no longer changes, so the results of the
+DataExtractionBase get_* methods can be reused across reports and page visits.
+Results are kept in two tiers:
+
+- an in-process LRU tier bounded by entry count and estimated size
+- an on-disk tier under app/data/query_cache bounded by total file size
+
+Disk entries are grouped in one directory per (data source, bucket, test), so
+a test is invalidated by removing its directory (on delete or re-upload).
+Payloads are pickled because results are not only DataFrames but also lists
+and dicts of DataFrames and scalars.
+"""
+
+import os
+import pickle
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+
+class QueryResultCache:
+    """Two-tier (memory LRU + disk) cache for data source query results."""
+
+    cache_dir = os.path.join('app', 'data', 'query_cache')
+
+    memory_max_entries = 512
+    memory_max_bytes = 256 * 1024 * 1024
+    disk_max_bytes = 1024 * 1024 * 1024
+
+    # Cache structure: {entry_key: (test_dir, size_bytes, value)}
+    _memory: "OrderedDict[str, Tuple[str, int, Any]]" = OrderedDict()
+    _memory_bytes = 0
+    _lock = threading.RLock()
+
+    # Scanning the disk tier is not free; only check its size every few writes
+    disk_eviction_every = 50
+    _writes_since_eviction = 0
+
+    @classmethod
+    def _hash(cls, value: Any) -> str:
+        return hashlib.sha256(repr(value).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def test_dir(cls, scope: Tuple[Any, ...], test_title: str) -> str:
+        """Directory holding all disk entries of one test of one data source/bucket."""
+        return os.path.join(cls.cache_dir, cls._hash((scope, test_title))[:32])
+
+    @classmethod
+    def is_cacheable(cls, value: Any) -> bool:
+        """
+        Whether a result may be cached.
+
+        Failed queries are reported by the data source and never reach the
+        cache (see DataExtractionBase._query_failed), so zero and empty results
+        are real results, e.g. a test without errors. None means that there is
+        no result and is not cached.
+        """
+        return value is not None
+
+    @classmethod
+    def _estimate_size(cls, value: Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+        if isinstance(value, dict):
+            return sum(cls._estimate_size(v) for v in value.values()) + 64 * len(value)
+        if isinstance(value, (list, tuple)):
+            return sum(cls._estimate_size(v) for v in value) + 64 * len(value)
+        return 64
+
+    @classmethod
+    def get(cls, scope: Tuple[Any, ...], test_title: str, query_key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            Tuple (found, value)
+        """
+        test_dir = cls.test_dir(scope, test_title)
+        entry_key = cls._hash((scope, test_title, query_key))
+        with cls._lock:
+            entry = cls._memory.get(entry_key)
+            if entry is not None:
+                # A missing test directory means another process invalidated the test
+                if os.path.isdir(test_dir):
+                    cls._memory.move_to_end(entry_key)
+                    return True, entry[2]
+                cls._drop_memory_test(test_dir)
+
+        path = os.path.join(test_dir, f"{entry_key}.pkl")
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return False, None
+        except Exception as er:
+            logging.warning(f"QueryResultCache: failed to read {path}: {er}")
+            return False, None
+
+        cls._put_memory(entry_key, test_dir, value)
+        return True, value
+
+    @classmethod
+    def set(cls, scope: Tuple[Any, ...], test_title: str, query_key: Tuple[Any, ...], value: Any) -> None:
+        """Store a result in both tiers."""
+        test_dir = cls.test_dir(scope, test_title)
+        entry_key = cls._hash((scope, test_title, query_key))
+        try:
+            os.makedirs(test_dir, exist_ok=True)
+            path = os.path.join(test_dir, f"{entry_key}.pkl")
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as er:
+            logging.warning(f"QueryResultCache: failed to write cache entry: {er}")
+            return
+        cls._put_memory(entry_key, test_dir, value)
+        with cls._lock:
+            cls._writes_since_eviction += 1
+            run_eviction = cls._writes_since_eviction >= cls.disk_eviction_every
+            if run_eviction:
+                cls._writes_since_eviction = 0
+        if run_eviction:
+            cls._evict_disk()
+
+    @classmethod
+    def invalidate_test(cls, scope: Optional[Tuple[Any, ...]], test_title: str) -> None:
+        """Drop all cached results of a test (both tiers)."""
+        if scope is None:
+            return
+        test_dir = cls.test_dir(scope, test_title)
+        with cls._lock:
+            cls._drop_memory_test(test_dir)
+        shutil.rmtree(test_dir, ignore_errors=True)
+        logging.debug(f"QueryResultCache: invalidated '{test_title}' for {scope}")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached result."""
+        with cls._lock:
+            cls._memory.clear()
+            cls._memory_bytes = 0
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
+
+    @classmethod
+    def _put_memory(cls, entry_key: str, test_dir: str, value: Any) -> None:
+        size = cls._estimate_size(value)
+        if size > cls.memory_max_bytes:
+            return
+        with cls._lock:
+            previous = cls._memory.pop(entry_key, None)
+            if previous is not None:
+                cls._memory_bytes -= previous[1]
+            cls._memory[entry_key] = (test_dir, size, value)
+            cls._memory_bytes += size
+            while cls._memory and (len(cls._memory) > cls.memory_max_entries or cls._memory_bytes > cls.memory_max_bytes):
+                _, (_, evicted_size, _) = cls._memory.popitem(last=False)
+                cls._memory_bytes -= evicted_size
+
+    @classmethod
+    def _drop_memory_test(cls, test_dir: str) -> None:
+        for key in [k for k, entry in cls._memory.items() if entry[0] == test_dir]:
+            cls._memory_bytes -= cls._memory.pop(key)[1]
+
+    @classmethod
+    def _evict_disk(cls) -> None:
+        """Remove least recently used entry files until the disk tier fits its budget."""
+        try:
+            files = []
+            total = 0
+            with os.scandir(cls.cache_dir) as test_dirs:
+                for test_dir in test_dirs:
+                    if not test_dir.is_dir():
+                        continue
+                    with os.scandir(test_dir.path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and entry.name.endswith('.pkl'):
+                                stat = entry.stat()
+                                files.append((stat.st_mtime, stat.st_size, entry.path))
+                                total += stat.st_size
+            if total <= cls.disk_max_bytes:
+                return
+            for _, size, path in sorted(files):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= cls.disk_max_bytes:
+                    break
+        except FileNotFoundError:
+            return
+        except Exception as er:
+            logging.warning(f"QueryResultCache: disk eviction failed: {er}")
+
+    @classmethod
+    def get_scope_of(cls, source: Any) -> Optional[Tuple[Any, ...]]:
+        """
+        Cache scope (integration id, bucket) of a data source extraction or
+        insertion object, or None if it has no id. InfluxDB 1.8 keeps the
+        bucket in 'database'.
+        """
+        source_id = getattr(source, 'id', None)
+        if source_id is None:
+            return None
+        bucket = getattr(source, 'bucket', None) or getattr(source, 'database', None) or ''
+        return (source_id, bucket)
@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
 import logging
 import base64
 import traceback
 
 from app.backend.integrations.integration import Integration
+from app.backend.integrations.http_transport import HttpTransport
 from app.backend.integrations.grafana.grafana_db import DBGrafana
 from app.backend.components.secrets.secrets_db import DBSecrets
+from app.backend.data_provider.image_creator.image_cache import GraphImageCache
 
 
 class Grafana(Integration):
@@ -43,6 +44,7 @@ class Grafana(Integration):
             self.test_title = config["test_title"]
             self.baseline_test_title = config["baseline_test_title"]
             self.dashboards = config["dashboards"]
+            self.session = HttpTransport.session(self.server)
         else:
             logging.warning("There's no Grafana integration configured, or you're attempting to send a request from an unsupported location.")
 
@@ -90,12 +92,25 @@ class Grafana(Integration):
         url = self.add_custom_tags(url=url, graph_json=graph_data)
         return url
 
-    def render_image(self, url):
+    def render_image(self, url, cache=False):
+        """
+        Render a panel through the Grafana image renderer.
+
+        With cache=True (finished tests only, the URL holds their time range)
+        the image is taken from and stored in GraphImageCache.
+        """
+        cache_key = GraphImageCache.url_key(url) if cache else None
+        if cache_key:
+            image = GraphImageCache.get(cache_key)
+            if image is not None:
+                return image
         image = None
         try:
-            response = requests.get(url=url, headers={ 'Authorization': 'Bearer ' + self.token}, timeout=180, verify=False)
+            response = self.session.get(url=url, headers={ 'Authorization': 'Bearer ' + self.token}, timeout=180, verify=False)
             if response.status_code == 200:
                 image = response.content
+                if cache_key:
+                    GraphImageCache.set(cache_key, image)
             else:
                 logging.info('ERROR: ' + response.content)
         except Exception as er:
@@ -17,6 +17,7 @@ import logging
 
 from app.config                  import db
 from app.backend.pydantic_models import GrafanaModel
+from app.backend.config_cache    import cached_config, invalidates_config
 from sqlalchemy.orm              import joinedload
 
 
@@ -37,6 +38,7 @@ class DBGrafana(db.Model):
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
 
     @classmethod
+    @invalidates_config
     def save(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -65,6 +67,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_configs(cls, project_id):
         try:
             query = db.session.query(cls).filter_by(project_id=project_id).options(joinedload(cls.dashboards)).all()
@@ -80,6 +83,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_id(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).options(joinedload(cls.dashboards)).one_or_none()
@@ -94,6 +98,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_default_config(cls, project_id, current_config_id=None):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, is_default=True).options(joinedload(cls.dashboards)).one_or_none()
@@ -108,6 +113,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def update(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -137,6 +143,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def reset_default_config(cls, project_id):
         try:
             db.session.query(cls).filter_by(project_id=project_id).update({cls.is_default: False})
@@ -155,6 +162,7 @@ class DBGrafana(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def delete(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
@@ -0,0 +1,175 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+HTTP Transport - shared connection pools for the output integrations.
+
+Integration objects (Grafana, Confluence, Jira, Azure Wiki) are created per
+report, but their connections are not: every host gets one process-wide
+HTTPAdapter, so keep-alive connections and TLS sessions are reused by all
+integration objects that talk to it. Each integration object still gets its
+own requests.Session, because the Atlassian clients store credentials on the
+session.
+
+Per host, the transport also:
+
+- retries connection errors and 429/5xx responses of idempotent requests with
+  exponential backoff, honouring Retry-After (a request whose response timed
+  out is not re-sent, e.g. a slow panel render)
+- bounds the number of requests in flight, so a burst of reports queues up
+  here instead of overwhelming e.g. the Grafana image renderer
+
+The limit is applied by the pooled adapter of an origin (scheme://host), per
+request hop: a redirect is a new request and never waits for the slot of the
+hop that answered with it.
+"""
+
+import os
+import atexit
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _transport_settings() -> Dict[str, float]:
+    defaults = {
+        'HTTP_POOL_MAXSIZE': 10,
+        'HTTP_MAX_RETRIES': 3,
+        'HTTP_BACKOFF_FACTOR': 0.5,
+        'HTTP_HOST_CONCURRENCY': 8,
+        'HTTP_HOST_SLOT_TIMEOUT': 300,
+    }
+    try:
+        from flask import current_app, has_app_context
+        if has_app_context():
+            return {key: type(value)(current_app.config.get(key, value)) for key, value in defaults.items()}
+    except Exception:
+        pass
+    return defaults
+
+
+class _Retry(Retry):
+    """Retry policy that never re-sends a request whose response timed out."""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, ReadTimeoutError):
+            raise error
+        return super().increment(method=method, url=url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+
+
+class _HostLimitedAdapter(HTTPAdapter):
+    """Pooled adapter of one origin; every request hop waits for a free slot of the origin."""
+
+    def __init__(self, origin: str, slots: int, slot_timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.origin = origin
+        self.slots = threading.BoundedSemaphore(max(1, int(slots)))
+        self.slot_timeout = slot_timeout
+
+    def send(self, request, **kwargs):
+        if not self.slots.acquire(timeout=self.slot_timeout):
+            raise requests.exceptions.ConnectTimeout(
+                f"HttpTransport: no free request slot for {self.origin} within {self.slot_timeout} s",
+                request=request,
+            )
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self.slots.release()
+
+
+class _PooledSession(requests.Session):
+    """Session mounting the shared adapter of its origin."""
+
+    def close(self):
+        # Pooled host adapters are shared with other sessions and stay open
+        shared = list(HttpTransport._adapters.values())
+        for adapter in self.adapters.values():
+            if not any(adapter is pooled for pooled in shared):
+                adapter.close()
+
+
+class HttpTransport:
+    """Process-wide, per-origin HTTP connection pools and concurrency limits."""
+
+    # Pool structure: {scheme://host: _HostLimitedAdapter}
+    _adapters: Dict[str, _HostLimitedAdapter] = {}
+    _lock = threading.Lock()
+    _pid = os.getpid()
+
+    @staticmethod
+    def _origin(url: str) -> Optional[str]:
+        parts = urlsplit(url or '')
+        if not parts.scheme or not parts.netloc:
+            return None
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+    @classmethod
+    def _check_fork(cls) -> None:
+        # Pooled connections must not be shared with a forked worker process
+        if cls._pid != os.getpid():
+            cls._adapters = {}
+            cls._pid = os.getpid()
+
+    @classmethod
+    def session(cls, base_url: str) -> requests.Session:
+        """
+        New session for an integration object; requests to the host of
+        base_url go through the pooled adapter of that host.
+        """
+        session = _PooledSession()
+        origin = cls._origin(base_url)
+        if origin is None:
+            return session
+        settings = _transport_settings()
+        with cls._lock:
+            cls._check_fork()
+            adapter = cls._adapters.get(origin)
+            if adapter is None:
+                adapter = cls._adapters[origin] = _HostLimitedAdapter(
+                    origin,
+                    slots=settings['HTTP_HOST_CONCURRENCY'],
+                    slot_timeout=float(settings['HTTP_HOST_SLOT_TIMEOUT']),
+                    pool_connections=1,
+                    pool_maxsize=max(1, int(settings['HTTP_POOL_MAXSIZE'])),
+                    max_retries=_Retry(
+                        total=max(0, int(settings['HTTP_MAX_RETRIES'])),
+                        status_forcelist=RETRY_STATUS_CODES,
+                        backoff_factor=float(settings['HTTP_BACKOFF_FACTOR']),
+                        respect_retry_after_header=True,
+                        raise_on_status=False,
+                    ),
+                )
+                logging.debug(f"HttpTransport: created connection pool for {origin}")
+        session.mount(f"{origin}/", adapter)
+        return session
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            adapters = list(cls._adapters.values())
+            cls._adapters = {}
+        for adapter in adapters:
+            adapter.close()
+
+
+atexit.register(HttpTransport.close_all)
@@ -16,6 +16,8 @@ import os
 import ast
 import json
 import re
+import shutil
+import tempfile
 
 from app.backend.integrations.reporting_base import ReportingBase
 from app.backend.integrations.report_registry import ReportRegistry
@@ -49,9 +51,15 @@ class Pdf:
         }
     }
 
+    # Resolution (dots per inch) images are downscaled to before they are embedded
+    image_dpi = 200
+
     def __init__(self, pdf_io, margin=15, theme='dark'):
         self.doc = BaseDocTemplate(pdf_io, pagesize=landscape(A4), leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin)
         self.elements = []
+        # Downscaled images waiting to be flowed, removed after build()
+        self.image_dir = None
+        self.image_count = 0
         self.logo_path = os.path.join('app', 'static', 'assets', 'img', 'logo.png')
         registerFont(ttfonts.TTFont('NunitoSans', os.path.join('app', 'static', 'assets', 'fonts', 'NunitoSans_7pt-Regular.ttf')))
         registerFont(ttfonts.TTFont('NunitoSans-Bold', os.path.join('app', 'static', 'assets', 'fonts', 'NunitoSans_7pt-Bold.ttf')))
@@ -145,22 +153,28 @@ class Pdf:
         self.elements.append(title)
 
     def add_image(self, image):
-        image_io = BytesIO(image)
-        img = PILImage.open(image_io)
-        img_width, img_height = img.size
-        max_width = landscape(A4)[0] - self.doc.leftMargin - self.doc.rightMargin
-        max_height = landscape(A4)[1] - self.doc.topMargin - self.doc.bottomMargin - 0.25 * inch  # Subtract the height of the Spacer
-        if img_width > max_width:
-            img_height = img_height * (max_width / img_width)
-            img_width = max_width
-        if img_height > max_height:
-            img_width = img_width * (max_height / img_height)
-            img_height = max_height
-        # Create a new BytesIO object for the resized image
-        resized_image_io = BytesIO()
-        img.save(resized_image_io, format=img.format)
-        resized_image_io.seek(0)
-        img = RoundedImage(resized_image_io, width=img_width, height=img_height)
+        with PILImage.open(BytesIO(image)) as img:
+            image_format = img.format or 'PNG'
+            img_width, img_height = img.size
+            max_width = landscape(A4)[0] - self.doc.leftMargin - self.doc.rightMargin
+            max_height = landscape(A4)[1] - self.doc.topMargin - self.doc.bottomMargin - 0.25 * inch  # Subtract the height of the Spacer
+            if img_width > max_width:
+                img_height = img_height * (max_width / img_width)
+                img_width = max_width
+            if img_height > max_height:
+                img_width = img_width * (max_height / img_height)
+                img_height = max_height
+            # Downscale once to the target resolution of the drawn size (e.g. scale=3 panels)
+            target_size = (max(1, round(img_width / 72 * self.image_dpi)), max(1, round(img_height / 72 * self.image_dpi)))
+            resized = img.resize(target_size, PILImage.LANCZOS) if target_size[0] < img.size[0] else img
+            # Keep the image on disk; the flowable opens it when drawn and releases it afterwards
+            if self.image_dir is None:
+                self.image_dir = tempfile.mkdtemp(prefix='perforge-pdf-')
+            self.image_count += 1
+            extension = '.jpg' if image_format == 'JPEG' else '.png'
+            image_path = os.path.join(self.image_dir, f"{self.image_count}{extension}")
+            resized.save(image_path, format='JPEG' if extension == '.jpg' else 'PNG')
+        img = RoundedImage(image_path, width=img_width, height=img_height, lazy=2)
         self.elements.append(Spacer(1, 0.1 * inch))
         self.elements.append(img)
 
@@ -289,12 +303,22 @@ class Pdf:
         self.elements.insert(3, Paragraph(text, normal_style))
 
     def build(self):
-        self.doc.build(self.elements)
+        try:
+            self.doc.build(self.elements)
+        finally:
+            self.discard_images()
+
+    def discard_images(self):
+        """Drop the pending elements and remove their downscaled image files."""
+        self.elements = []
+        if self.image_dir is not None:
+            shutil.rmtree(self.image_dir, ignore_errors=True)
+            self.image_dir = None
 
 class RoundedImage(Image):
 
-    def __init__(self, filename_or_object, width=None, height=None, kind='direct', mask=None, hAlign='CENTER', useDPI=False, rounded_corner_radius=6):
-        super().__init__(filename_or_object, width, height, kind, mask, hAlign)
+    def __init__(self, filename_or_object, width=None, height=None, kind='direct', mask=None, hAlign='CENTER', useDPI=False, rounded_corner_radius=6, lazy=1):
+        super().__init__(filename_or_object, width, height, kind=kind, mask=mask, lazy=lazy, hAlign=hAlign, useDPI=useDPI)
         self.rounded_corner_radius = rounded_corner_radius
 
     def draw(self):
@@ -307,13 +331,21 @@ class RoundedImage(Image):
 
 @ReportRegistry.register("pdf_report")
 class PdfReport(ReportingBase):
+    # The document is kept in memory up to this size and spooled to a temporary file beyond it
+    spool_max_bytes = 16 * 1024 * 1024
+
     def __init__(self, project, theme='dark'):
         super().__init__(project)
-        self.pdf_io = BytesIO()
+        self.pdf_io = tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes, mode='w+b')
         self.theme = theme
         self.pdf_creator = Pdf(self.pdf_io, theme=self.theme)
         self.pdf_creator.elements.append(Spacer(1, self.pdf_creator.header_height))
 
+    def close(self):
+        """Release the document and image files of a report that will not be sent."""
+        self.pdf_creator.discard_images()
+        self.pdf_io.close()
+
 
     def set_template(self, template, db_config):
         super().set_template(template, db_config)
@@ -501,6 +533,13 @@ class PdfReport(ReportingBase):
         return json.dumps(table_data)
 
     def generate_report(self, tests, template_group=None, theme='dark'):
+        try:
+            return self._generate_report(tests, template_group, theme)
+        finally:
+            # Images of a failed or cancelled report are never built
+            self.pdf_creator.discard_images()
+
+    def _generate_report(self, tests, template_group, theme):
         page_title = None
         self.pdf_creator.set_theme(theme)
 
@@ -557,6 +596,8 @@ class PdfReport(ReportingBase):
 
     def generate(self, current_test_title, baseline_test_title = None):
         processed_graphs = {}
+        # Render and fetch all graphs concurrently; add_graph() below takes them in order
+        self.prefetch_graphs(current_test_title, baseline_test_title)
 
         # First pass: collect all data from graphs
         for obj in self.data:
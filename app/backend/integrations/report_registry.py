@@ -12,12 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import importlib
+
+
 class ReportRegistry:
     """Registry for report classes with decorator-based registration"""
 
     # Dictionary to store registered report classes
     _registry = {}
 
+    # Modules whose report classes register themselves on import
+    report_modules = [
+        'app.backend.integrations.pdf.pdf_report',
+        'app.backend.integrations.smtp_mail.smtp_mail_report',
+        'app.backend.integrations.azure_wiki.azure_wiki_report',
+        'app.backend.integrations.atlassian_jira.atlassian_jira_report',
+        'app.backend.integrations.atlassian_confluence.atlassian_confluence_report'
+    ]
+
+    @classmethod
+    def load_report_types(cls):
+        """
+        Dynamically import all report types to ensure they are registered.
+        This avoids circular imports by only importing when needed.
+        """
+        for module_name in cls.report_modules:
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                logging.warning(f"Could not import report module {module_name}: {e}")
+
     @classmethod
     def register(cls, report_type):
         """
@@ -13,7 +13,11 @@
 # limitations under the License.
 
 import re
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, has_app_context
 
 from app.backend.components.settings.settings_service import SettingsService
 from app.backend.integrations.ai_support.ai_support import AISupport
@@ -23,7 +27,10 @@ from app.backend.components.nfrs.nfr_validation import NFRValidation
 from app.backend.components.templates.templates_db import DBTemplates
 from app.backend.components.templates.template_groups_db import DBTemplateGroups
 from app.backend.components.prompts.prompts_db import DBPrompts
+from app.backend.components.graphs.graphs_db import DBGraphs
 from app.backend.data_provider.data_provider import DataProvider
+from app.backend.integrations.data_sources.base_extraction import DataExtractionBase
+from app.backend.data_provider.data_analysis.history_analysis import TestHistoryAnalyzer
 from app.backend.data_provider.test_data import BaseTestData, BackendTestData, FrontendTestData, MetricsTable
 from app.backend.data_provider.image_creator.plotly_image_renderer import PlotlyImageRenderer
 
@@ -39,6 +46,17 @@ class ReportingBase:
         self.current_test_obj: BaseTestData = None
         self.baseline_test_obj: BaseTestData = None
         self._needs_transaction_status_table = False  # Flag to track if status table is needed
+        # Optional callable(event, **details) set by the background job runner; it may raise to cancel
+        self.progress_callback = None
+        # Internal graphs share one renderer (and through it the warm Kaleido pool)
+        self.image_renderer = PlotlyImageRenderer()
+        # Images rendered by prefetch_graphs(), keyed by (graph id, test title, baseline test title)
+        self._prefetched_graphs: Dict[tuple, bytes] = {}
+
+    def report_progress(self, event: str, **details):
+        """Notify the progress callback ('test' when a test starts, 'item' after each graph)."""
+        if self.progress_callback is not None:
+            self.progress_callback(event, **details)
 
     def set_template(self, template, db_config: Dict[str, str]):
         template_obj = DBTemplates.get_config_by_id(project_id=self.project, id=template)
@@ -162,6 +180,16 @@ class ReportingBase:
                 except Exception as e:
                     logging.warning(f"Error loading table '{table_name}' with aggregation '{aggregation}': {e}")
 
+            # Cross-test history of the current test, computed once per test from the summary index
+            if var == "test_history_summary" and self.current_test_obj is not None:
+                try:
+                    history = TestHistoryAnalyzer(self.project).analyze_test(self.dp_obj, self.current_test_obj.test_title)
+                    self.parameters[var] = history["summary"]
+                    text = text.replace("${" + var + "}", history["summary"])
+                except Exception as e:
+                    logging.warning(f"Error analyzing the test history: {e}")
+                continue
+
             # Check for transaction status table variables
             if var == "transaction_status_table":
                 # Set flag indicating status table is needed
@@ -372,6 +400,14 @@ class ReportingBase:
             # Generate AI summary with the fully processed prompt
             self.parameters['ai_summary'] = self.ai_support_obj.run_summary_chain(processed_prompt)
 
+        # Keep the tables and ML results computed for this report for the next ones
+        self._save_test_snapshots()
+
+    def _save_test_snapshots(self):
+        for test_obj in (self.current_test_obj, self.baseline_test_obj):
+            if test_obj is not None:
+                self.dp_obj.save_test_snapshot(test_obj)
+
     def analyze_template_group(self):
         overall_summary = ""
         if self.ai_summary:
@@ -406,18 +442,15 @@ class ReportingBase:
         # Attach overall anomaly windows (per overall metric) for backend graph shading.
         try:
             windows_by_metric = {}
-            engine = getattr(self.dp_obj, "anomaly_detection_engine", None)
-            if engine is not None:
-                overall_list = getattr(engine, "overall_anomalies", []) or []
-                for oa in overall_list:
-                    metric = oa.get("metric")
-                    start_time = oa.get("start_time")
-                    end_time = oa.get("end_time")
-                    if not metric or start_time is None or end_time is None:
-                        continue
-                    windows_by_metric.setdefault(metric, []).append(
-                        {"start": str(start_time), "end": str(end_time)}
-                    )
+            for oa in getattr(self.current_test_obj, "ml_anomaly_windows", None) or []:
+                metric = oa.get("metric")
+                start_time = oa.get("start_time")
+                end_time = oa.get("end_time")
+                if not metric or start_time is None or end_time is None:
+                    continue
+                windows_by_metric.setdefault(metric, []).append(
+                    {"start": str(start_time), "end": str(end_time)}
+                )
             if windows_by_metric:
                 metrics["overall_anomaly_windows"] = windows_by_metric
         except Exception as e:
@@ -425,13 +458,27 @@ class ReportingBase:
 
         return metrics
 
+    def _graph_images_cacheable(self) -> bool:
+        """
+        Whether Grafana images of the current test may be cached: the test has
+        finished (like query results, see DataExtractionBase) and the query
+        cache is enabled.
+        """
+        end_timestamp = getattr(self.current_test_obj, "end_time_timestamp", None)
+        if not end_timestamp:
+            return False
+        if not SettingsService.get_setting(self.project, 'data_query', 'query_cache_enabled', default=True):
+            return False
+        settled_before = time.time() - DataExtractionBase.query_cache_settle_seconds
+        return float(end_timestamp) / 1000 < settled_before
+
     def _render_internal_graph(self, graph_data: dict) -> bytes:
         """Render an internal Plotly graph fully in-memory and return PNG bytes."""
         # Ensure metric series exist
         metrics = self._ensure_ml_metrics()
 
         # Render via Plotly
-        renderer = PlotlyImageRenderer()
+        renderer = self.image_renderer
         width = int(graph_data.get("width") or 1024)
         height = int(graph_data.get("height") or 400)
         image = renderer.render_bytes_by_name(
@@ -451,17 +498,35 @@ class ReportingBase:
         """
         ai_support_response = None
 
+        prefetched = self._prefetched_graphs.get(self._graph_prefetch_key(graph_data, current_test_title, baseline_test_title))
+
         if graph_data.get("type") == "default":
             # Render internal Plotly graph
-            image = self._render_internal_graph(graph_data)
+            image = prefetched if prefetched is not None else self._render_internal_graph(graph_data)
 
             # Optional AI analysis
             ai_graph_enabled = bool(graph_data.get("ai_graph_switch"))
             if self.ai_switch and ai_graph_enabled and graph_data.get("prompt_id"):
                 ai_support_response = self.ai_support_obj.analyze_graph(graph_data.get("name"), image, graph_data.get("prompt_id"))
+            self.report_progress('item', name=graph_data.get("name"))
             return image, ai_support_response
 
         # External (Grafana) graph fallback
+        if prefetched is not None:
+            image = prefetched
+        else:
+            grafana, url = self._grafana_render_url(graph_data, current_test_title, baseline_test_title)
+            image = grafana.render_image(url, cache=self._graph_images_cacheable())
+
+        ai_graph_enabled = bool(graph_data.get("ai_graph_switch"))
+        if self.ai_switch and ai_graph_enabled and graph_data.get("prompt_id"):
+            ai_support_response = self.ai_support_obj.analyze_graph(graph_data.get("name"), image, graph_data.get("prompt_id"))
+
+        self.report_progress('item', name=graph_data.get("name"))
+        return image, ai_support_response
+
+    def _grafana_render_url(self, graph_data: dict, current_test_title: str, baseline_test_title: str | None):
+        """Return the Grafana integration of an external graph and its final render URL."""
         # Instantiate Grafana using graph-specific grafana_id to respect overrides
         grafana_id = graph_data.get("grafana_id")
         if grafana_id:
@@ -480,13 +545,70 @@ class ReportingBase:
 
         url = grafana.generate_url_to_render_graph(graph_data, start_timestamp, end_timestamp, current_test_title, baseline_test_title)
         url = self.replace_variables(url)
-        image = grafana.render_image(url)
+        return grafana, url
 
-        ai_graph_enabled = bool(graph_data.get("ai_graph_switch"))
-        if self.ai_switch and ai_graph_enabled and graph_data.get("prompt_id"):
-            ai_support_response = self.ai_support_obj.analyze_graph(graph_data.get("name"), image, graph_data.get("prompt_id"))
+    @staticmethod
+    def _graph_prefetch_key(graph_data: dict, current_test_title: str, baseline_test_title: str | None):
+        return graph_data.get("id"), current_test_title, baseline_test_title
 
-        return image, ai_support_response
+    def prefetch_graphs(self, current_test_title: str, baseline_test_title: str | None = None) -> None:
+        """
+        Render and fetch all graphs of the template concurrently, before the
+        report is assembled; add_graph() then takes the prefetched images in
+        template order.
+
+        Internal graphs are rendered as one batch on the Kaleido pool while
+        Grafana panels are fetched in parallel; the pooled HTTP transport of the
+        Grafana host bounds the renders in flight across all reports of the
+        process (HTTP_HOST_CONCURRENCY).
+        Graphs that fail here are left to add_graph(), which renders them again
+        and reports the error as before.
+        """
+        self._prefetched_graphs = {}
+        graphs = {}
+        for obj in self.data:
+            if obj.get("type") == "graph" and obj.get("graph_id") not in graphs:
+                graph_data = DBGraphs.get_config_by_id(project_id=self.project, id=obj["graph_id"])
+                if graph_data:
+                    graphs[obj["graph_id"]] = graph_data
+        internal = [graph for graph in graphs.values() if graph.get("type") == "default"]
+        external = [graph for graph in graphs.values() if graph.get("type") != "default"]
+
+        # URLs are resolved here: they need the app context and the collected test data
+        fetches = []
+        cacheable = self._graph_images_cacheable() if external else False
+        for graph_data in external:
+            try:
+                grafana, url = self._grafana_render_url(graph_data, current_test_title, baseline_test_title)
+                fetches.append((graph_data, grafana, url))
+            except Exception as er:
+                logging.warning(f"prefetch_graphs: skipping '{graph_data.get('name')}': {er}")
+
+        executor = None
+        futures = []
+        if fetches:
+            workers = current_app.config.get('GRAPH_PREFETCH_WORKERS', 8) if has_app_context() else 8
+            executor = ThreadPoolExecutor(max_workers=max(1, min(int(workers), len(fetches))), thread_name_prefix="perforge-graphs")
+            futures = [(graph_data, executor.submit(grafana.render_image, url, cacheable)) for graph_data, grafana, url in fetches]
+        try:
+            if internal:
+                try:
+                    images = self.image_renderer.render_many_by_name(internal, self._ensure_ml_metrics(), image_format="png")
+                    for graph_data, image in zip(internal, images):
+                        self._prefetched_graphs[self._graph_prefetch_key(graph_data, current_test_title, baseline_test_title)] = image
+                except Exception as er:
+                    logging.warning(f"prefetch_graphs: internal graphs are rendered one by one: {er}")
+            for graph_data, future in futures:
+                try:
+                    image = future.result()
+                except Exception as er:
+                    logging.warning(f"prefetch_graphs: failed to fetch '{graph_data.get('name')}': {er}")
+                    continue
+                if image is not None:
+                    self._prefetched_graphs[self._graph_prefetch_key(graph_data, current_test_title, baseline_test_title)] = image
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     def _apply_baseline_to_all_tables(self) -> None:
         """
@@ -651,6 +773,12 @@ class ReportingBase:
             additional_context: Optional additional context for the report
         """
 
+        self.report_progress(
+            'test',
+            test_title=current_test_title,
+            items_total=sum(1 for obj in getattr(self, 'data', []) if obj.get("type") == "graph")
+        )
+
         # Initialize parameters dictionary
         self.parameters = {}
 
@@ -17,6 +17,7 @@ import logging
 
 from app.config                  import db
 from app.backend.pydantic_models import SmtpMailModel
+from app.backend.config_cache    import cached_config, invalidates_config
 from sqlalchemy.orm              import joinedload
 
 
@@ -38,6 +39,7 @@ class DBSMTPMail(db.Model):
         return {column.name: getattr(self, column.name) for column in self.__table__.columns}
 
     @classmethod
+    @invalidates_config
     def save(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -63,6 +65,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_configs(cls, project_id):
         try:
             query = db.session.query(cls).filter_by(project_id=project_id).options(joinedload(cls.recipients)).all()
@@ -78,6 +81,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_config_by_id(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).options(joinedload(cls.recipients)).one_or_none()
@@ -92,6 +96,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @cached_config
     def get_default_config(cls, project_id, current_config_id=None):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, is_default=True).options(joinedload(cls.recipients)).one_or_none()
@@ -106,6 +111,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def reset_default_config(cls, project_id):
         try:
             db.session.query(cls).filter_by(project_id=project_id).update({cls.is_default: False})
@@ -116,6 +122,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def update(cls, project_id, data):
         try:
             data['project_id'] = project_id
@@ -153,6 +160,7 @@ class DBSMTPMail(db.Model):
             raise
 
     @classmethod
+    @invalidates_config
     def delete(cls, project_id, id):
         try:
             config = db.session.query(cls).filter_by(project_id=project_id, id=id).one_or_none()
@@ -241,6 +241,8 @@ class SmtpMailReport(ReportingBase):
 
     def generate(self, current_test_title, baseline_test_title = None):
         report_body = ""
+        # Render and fetch all graphs concurrently; add_graph() below takes them in order
+        self.prefetch_graphs(current_test_title, baseline_test_title)
         for obj in self.data:
             if obj["type"] == "text":
                 report_body += self.add_text(obj["content"])
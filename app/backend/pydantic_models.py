@@ -14,6 +14,7 @@
 
 from pydantic import BaseModel, Field, model_validator, field_validator, EmailStr, ConfigDict
 from typing import Optional, Literal, Any
+from datetime import datetime
 import logging
 
 
@@ -306,3 +307,52 @@ class SettingModel(BaseModel):
     value: Any
     value_type: Literal['int', 'float', 'bool', 'string', 'list', 'dict']
     description: Optional[str] = None
+
+class TestCatalogModel(BaseModel):
+    """Model for test catalog entry validation."""
+    id: Optional[int] = None
+    project_id: int
+    influxdb_id: int
+    bucket: str = Field(default="", max_length=120)
+    test_title: str = Field(..., min_length=1, max_length=500)
+    listener: str
+    start_time: datetime
+    end_time: datetime
+    max_threads: Optional[int] = None
+
+class ReportJobModel(BaseModel):
+    """Model for background report job validation."""
+    id: str = Field(..., min_length=1, max_length=36)
+    project_id: int
+    action_type: str = Field(..., min_length=1, max_length=120)
+    status: Literal['queued', 'running', 'completed', 'failed', 'cancelled'] = 'queued'
+    cancel_requested: bool = False
+    request: dict[str, Any]
+    progress: dict[str, Any] = Field(default_factory=dict)
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    artifact_path: Optional[str] = None
+    artifact_name: Optional[str] = None
+    artifact_mimetype: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    owner_pid: Optional[int] = None
+    heartbeat_at: Optional[datetime] = None
+
+class TestSummaryModel(BaseModel):
+    """Model for per-test summary (test history index) validation."""
+    id: Optional[int] = None
+    project_id: int
+    source_type: str = Field(..., min_length=1, max_length=120)
+    source_id: str = Field(..., min_length=1, max_length=120)
+    bucket: str = Field(default="", max_length=120)
+    test_title: str = Field(..., min_length=1, max_length=500)
+    start_time: datetime
+    end_time: datetime
+    duration: Optional[int] = None
+    vu: Optional[float] = None
+    throughput: Optional[float] = None
+    median: Optional[float] = None
+    pct90: Optional[float] = None
+    errors_pct: Optional[float] = None
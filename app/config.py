@@ -35,4 +35,23 @@ class Config:
     # Enable to require HTTP Basic Auth for API endpoints
     BASIC_AUTH_ENABLED = config('BASIC_AUTH_ENABLED', default=True, cast=bool)
     # Realm shown in Basic Auth challenge
-    BASIC_AUTH_REALM = config('BASIC_AUTH_REALM', default='PerForge API')
\ No newline at end of file
+    BASIC_AUTH_REALM = config('BASIC_AUTH_REALM', default='PerForge API')
+    # Number of reports generated in parallel by the background job runner (per worker process)
+    REPORT_JOB_WORKERS = config('REPORT_JOB_WORKERS', default=2, cast=int)
+    # Chart rendering (per worker process): browser tabs rendering in parallel,
+    # renders before the browser is recycled, and seconds allowed for one render
+    RENDER_POOL_SIZE = config('RENDER_POOL_SIZE', default=2, cast=int)
+    RENDER_POOL_MAX_RENDERS = config('RENDER_POOL_MAX_RENDERS', default=200, cast=int)
+    RENDER_TIMEOUT = config('RENDER_TIMEOUT', default=90, cast=int)
+
+    # Graph prefetch during report generation: parallel Grafana panel fetches per report
+    # (renders in flight per Grafana server are bounded by HTTP_HOST_CONCURRENCY)
+    GRAPH_PREFETCH_WORKERS = config('GRAPH_PREFETCH_WORKERS', default=8, cast=int)
+    # HTTP transport of the output integrations (Grafana, Confluence, Jira, Azure Wiki), per host:
+    # pooled keep-alive connections, retries of 429/5xx with exponential backoff, requests in flight
+    HTTP_POOL_MAXSIZE = config('HTTP_POOL_MAXSIZE', default=10, cast=int)
+    HTTP_MAX_RETRIES = config('HTTP_MAX_RETRIES', default=3, cast=int)
+    HTTP_BACKOFF_FACTOR = config('HTTP_BACKOFF_FACTOR', default=0.5, cast=float)
+    HTTP_HOST_CONCURRENCY = config('HTTP_HOST_CONCURRENCY', default=8, cast=int)
+    # Seconds a request waits for a free slot of its host before it fails
+    HTTP_HOST_SLOT_TIMEOUT = config('HTTP_HOST_SLOT_TIMEOUT', default=300, cast=int)
\ No newline at end of file
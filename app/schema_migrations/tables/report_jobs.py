@@ -0,0 +1,47 @@
+# Copyright 2025 Uladzislau Shklianik <ushklianik@gmail.com> & Siamion Viatoshkin <sema.cod@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from sqlalchemy import text
+from app.schema_migrations.base import BaseMigration
+
+log = logging.getLogger("app.migrations")
+
+
+class ReportJobsAddOwner(BaseMigration):
+    """Add owner_pid and heartbeat_at columns to report_jobs table."""
+
+    name = "report_jobs: add owner_pid, heartbeat_at"
+
+    def apply(self, connection, inspector):
+        table_name = 'report_jobs'
+
+        # Check if table exists
+        if table_name not in inspector.get_table_names():
+            return
+
+        cols = [c['name'] for c in inspector.get_columns(table_name)]
+
+        if 'owner_pid' not in cols:
+            log.info(f"Applying migration: Adding 'owner_pid' column to '{table_name}'")
+            connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN owner_pid INTEGER"))
+
+        if 'heartbeat_at' not in cols:
+            log.info(f"Applying migration: Adding 'heartbeat_at' column to '{table_name}'")
+            connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN heartbeat_at DATETIME"))
+
+
+MIGRATIONS = [
+    ReportJobsAddOwner(),
+]
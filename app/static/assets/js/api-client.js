@@ -680,6 +680,66 @@ const apiClient = {
                 id: id,
                 bucket: bucket
             });
+        },
+
+        /**
+         * Submit a report for background generation
+         *
+         * @param {Object} data - Report request (tests, template_group, output_config)
+         * @returns {Promise} - Promise that resolves with the job ID
+         */
+        submitJob: function(data) {
+            return apiClient.post('/reports/jobs', data);
+        },
+
+        /**
+         * Get the status and progress of a report job
+         *
+         * @param {string} jobId - Job ID
+         * @returns {Promise} - Promise that resolves with the job status
+         */
+        getJob: function(jobId) {
+            return apiClient.get(`/reports/jobs/${jobId}`);
+        },
+
+        /**
+         * Cancel a report job
+         *
+         * @param {string} jobId - Job ID
+         * @returns {Promise} - Promise that resolves with the job status
+         */
+        cancelJob: function(jobId) {
+            return apiClient.post(`/reports/jobs/${jobId}/cancel`, {});
+        },
+
+        /**
+         * Download the file (PDF) of a completed report job
+         *
+         * @param {string} jobId - Job ID
+         * @returns {Promise} - Promise that resolves with the file blob and its name
+         */
+        downloadJob: function(jobId) {
+            return fetch(`${apiClient.baseUrl}/reports/jobs/${jobId}/download`, {
+                method: 'GET',
+                credentials: 'same-origin'
+            })
+            .then(response => {
+                if (!response.ok) {
+                    return response.json().then(err => {
+                        throw err;
+                    });
+                }
+                let filename = 'report.pdf';
+                const contentDisposition = response.headers.get('content-disposition');
+                if (contentDisposition) {
+                    // Support both standard and RFC 5987 (filename*) forms
+                    const match = /filename\*?=(?:UTF-8''|"?)([^";\n]*)/i.exec(contentDisposition);
+                    if (match && match[1]) {
+                        filename = decodeURIComponent(match[1]).trim().replace(/"/g, '');
+                    }
+                }
+                return response.blob().then(blob => ({ blob, filename }));
+            });
         }
     },
 
@@ -65,92 +65,50 @@
     });
   };
 
-  const sendPostRequestReport = (url, json) => {
-    return new Promise((resolve, reject) => {
-      // Parse the JSON string if it's a string
-      const data = typeof json === 'string' ? JSON.parse(json) : json;
-
-      // Use the API client for report generation
-      apiClient.tests.generateReport(data)
-          .then((response) => {
-            if (response.status === 'success') {
-              showResultModal("Report generated!", response.data);
-              resolve();
-            } else {
-              showResultModal("Failed!", response.message);
-              reject(new Error(response.message));
-            }
-          })
-          .catch((error) => {
-            showResultModal("Failed!", error.message || "An error occurred while generating the report");
-            reject(error);
-          });
-    });
+  // Milliseconds between two status requests of a running report job
+  const reportJobPollInterval = 2000;
+
+  const saveBlob = (blob, filename) => {
+    const link = document.createElement('a');
+    link.href = window.URL.createObjectURL(blob);
+    link.download = filename;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    window.URL.revokeObjectURL(link.href);
   };
 
-  const sendDownloadRequest = (url, json) => {
-    return new Promise((resolve, reject) => {
-        const data = typeof json === 'string' ? JSON.parse(json) : json;
-
-        fetch('/api/v1/reports', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-                'Cookie': `project=${getCookie('project')}`
-            },
-            body: JSON.stringify(data)
-        })
-        .then(response => {
-            // Get the X-Result-Data header that contains the statistics
-            const resultData = response.headers.get('X-Result-Data');
-
-            if (!response.ok) {
-                return response.json().then(err => {
-                    showResultModal("Failed!", err.message || "Failed to generate PDF report");
-                    throw new Error(err.message || 'PDF generation failed');
-                });
-            }
-
-            // Parse the result data from the header and show it in the modal
-            if (resultData) {
-                try {
-                    const parsedData = JSON.parse(resultData);
-                    showResultModal("Report generated!", parsedData);
-                    resolve(parsedData);
-                } catch (e) {
-                    console.error("Failed to parse result data:", e);
-                }
-            }
-
-            const contentDisposition = response.headers.get('content-disposition');
-            let filename = 'report.pdf';
-            if (contentDisposition) {
-                // Support both standard and RFC 5987 (filename*) forms.
-                // This regex captures the first occurrence of filename or filename* and stops at the next semicolon.
-                const filenameRegex = /filename\*?=(?:UTF-8''|"?)([^";\n]*)/i;
-                const match = filenameRegex.exec(contentDisposition);
-                if (match && match[1]) {
-                    // Decode RFC 5987 encoding and trim surrounding quotes/spaces
-                    filename = decodeURIComponent(match[1]).replace(/^\s+|\s+$/g, '').replace(/"/g, '');
-                }
-            }
-            return response.blob().then(blob => ({ blob, filename }));
-        })
-        .then(({ blob, filename }) => {
-            const link = document.createElement('a');
-            link.href = window.URL.createObjectURL(blob);
-            link.download = filename;
-            document.body.appendChild(link);
-            link.click();
-            document.body.removeChild(link);
-            window.URL.revokeObjectURL(link.href);
-            resolve();
-        })
-        .catch(error => {
-            showResultModal("Failed!", error.message || "An error occurred while generating the report");
-            reject(error);
-        });
-    });
+  // Generate a report as a background job: submit it, report its progress
+  // through onProgress(jobId, job) until it finishes, then download its file
+  const runReportJob = async (json, onProgress) => {
+    const data = typeof json === 'string' ? JSON.parse(json) : json;
+    try {
+      const submitted = await apiClient.reports.submitJob(data);
+      const jobId = submitted.data.job_id;
+      let job = submitted.data;
+      onProgress(jobId, job);
+      while (!['completed', 'failed', 'cancelled'].includes(job.status)) {
+        await new Promise(resolve => setTimeout(resolve, reportJobPollInterval));
+        job = (await apiClient.reports.getJob(jobId)).data;
+        onProgress(jobId, job);
+      }
+
+      if (job.status === 'completed') {
+        if (job.has_artifact) {
+          const { blob, filename } = await apiClient.reports.downloadJob(jobId);
+          saveBlob(blob, filename);
+        }
+        showResultModal("Report generated!", job.result);
+      } else if (job.status === 'cancelled') {
+        showResultModal("Report cancelled.");
+      } else {
+        showResultModal("Failed!", job.error || "An error occurred while generating the report");
+      }
+      return job;
+    } catch (error) {
+      showResultModal("Failed!", error.message || "An error occurred while generating the report");
+      throw error;
+    }
   };
 
   const sendGetRequest = (url) => {
@@ -681,6 +639,8 @@
     const selectedTemplateGroup = document.getElementById('templateGroupName');
     const spinner = document.getElementById("spinner-apply");
     const spinnerText = document.getElementById("spinner-apply-text");
+    const cancelReportBtn = document.getElementById("cancel-report");
+    let runningJobId = null;
 
     // Utility Functions
     const getCookieValue = (name) => {
@@ -791,10 +751,9 @@
       try {
         spinner.style.display = "inline-block";
         spinnerText.style.display = "none";
+        selectedRowsBtn.disabled = true;
 
-        if (requestType === 'download') {
-          await sendDownloadRequest(url, data);
-        } else if (requestType === 'delete') {
+        if (requestType === 'delete') {
           // For delete operations, use the API client directly
           if (url === '/generate') {
             const parsedData = typeof data === 'string' ? JSON.parse(data) : data;
@@ -809,10 +768,23 @@
             await sendPostRequest(url, data);
           }
         } else {
-          await sendPostRequestReport(url, data);
+          cancelReportBtn.disabled = false;
+          cancelReportBtn.style.display = "";
+          await runReportJob(data, (jobId, job) => {
+            runningJobId = jobId;
+            const percent = job.progress && job.progress.percent ? job.progress.percent : 0;
+            spinnerText.textContent = `${Math.round(percent)}%`;
+            spinnerText.style.display = "";
+          });
         }
+      } catch (error) {
+        console.error('Report request failed:', error);
       } finally {
+        runningJobId = null;
+        cancelReportBtn.style.display = "none";
+        selectedRowsBtn.disabled = false;
         spinner.style.display = "none";
+        spinnerText.textContent = "Apply";
         spinnerText.style.display = "";
       }
     };
@@ -830,6 +802,19 @@
       });
     }
 
+    if (cancelReportBtn) {
+      cancelReportBtn.addEventListener('click', async () => {
+        if (!runningJobId) return;
+        cancelReportBtn.disabled = true;
+        try {
+          await apiClient.reports.cancelJob(runningJobId);
+        } catch (error) {
+          cancelReportBtn.disabled = false;
+          showFlashMessage(error.message || 'Failed to cancel the report', 'error');
+        }
+      });
+    }
+
     if (showApiBtn) {
       showApiBtn.addEventListener('click', () => {
         const selectedRows = get_tests_data();
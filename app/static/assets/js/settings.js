@@ -20,7 +20,8 @@ const categoryNames = {
 
 // Subsection groupings for ML Analysis
 const mlAnalysisGroups = {
-    'Isolation Forest': ['contamination', 'isf_threshold', 'isf_feature_metric', 'isf_validation_threshold'],
+    'Detectors': ['detectors_enabled'],
+    'Isolation Forest': ['contamination', 'isf_threshold', 'isf_feature_metric', 'isf_validation_threshold', 'isf_shared_model', 'isf_baseline_test_title'],
     'Z-Score Detection': ['z_score_threshold', 'z_score_median_validation_threshold'],
     'Rolling Analysis': ['rolling_window', 'rolling_correlation_threshold', 'baseline_window'],
     'Ramp-Up Detection': ['ramp_up_base_metric', 'ramp_up_required_breaches_min', 'ramp_up_required_breaches_max', 'ramp_up_required_breaches_fraction'],
@@ -29,7 +30,9 @@ const mlAnalysisGroups = {
     'Severity Thresholds': ['severity_critical', 'severity_high', 'severity_medium', 'severity_low'],
     'Context Filtering': ['context_median_window', 'context_median_pct', 'context_median_enabled'],
     'Merging & Grouping': ['merge_gap_samples'],
-    'Per-Transaction Analysis': ['per_txn_analysis_enabled', 'per_txn_metrics', 'per_txn_coverage', 'per_txn_max_k', 'per_txn_min_points']
+    'Per-Transaction Analysis': ['per_txn_analysis_enabled', 'per_txn_metrics', 'per_txn_coverage', 'per_txn_max_k', 'per_txn_min_points', 'per_txn_n_jobs'],
+    'Resolution': ['ml_max_points', 'chart_max_points', 'chart_downsampling_method'],
+    'Test History': ['history_max_runs', 'history_min_runs', 'history_trend_threshold_pct', 'history_changepoint_penalty', 'history_backfill_max_tests']
 };
 
 // Subsection groupings for Transaction Status
@@ -41,7 +44,8 @@ const transactionStatusGroups = {
 
 // Subsection groupings for Data Query
 const dataQueryGroups = {
-    'Backend Listener Query Settings': ['backend_query_granularity_seconds']
+    'Backend Listener Query Settings': ['backend_query_granularity_seconds'],
+    'Query Execution': ['max_concurrent_queries', 'query_cache_enabled']
 };
 
 // Subsection groupings for Reporting Table